@@ -1,294 +1,176 @@
-import heapq
 from math import inf
 from .graph import Graph
-from collections import deque
+from .csr import (
+    GrafoCSR, bfs_arvore_csr, dfs_arvore_csr, dijkstra_csr, bellman_ford_csr, caminho_ids, obter_csr,
+    bfs_caminho_ids, dfs_caminho_ids, dfs_tem_ciclo_ids, dfs_tempos_ids,
+)
+from .dial import dial_ids
+from .componentes import indice_componentes
 
 
 def _validar_pesos_nao_negativos(grafo: Graph):
-    """Valida se todos os pesos do grafo são não-negativos."""
-    for u in grafo.obter_nos():
-        for _v, peso in grafo.vizinhos(u):
-            if float(peso) < 0:
-                raise ValueError("Dijkstra não aceita pesos negativos.")
+    """Valida em O(1), pelas estatísticas do grafo, se todos os pesos são não-negativos."""
+    if grafo.tem_peso_negativo:
+        raise ValueError("Dijkstra não aceita pesos negativos.")
 
 
 def dijkstra(grafo: Graph, origem: str, destino: str):
-    """Encontra o caminho mínimo entre origem e destino usando Dijkstra."""
-    if origem not in grafo.adjacencia or destino not in grafo.adjacencia:
+    """Encontra o caminho mínimo entre origem e destino usando Dijkstra sobre o CSR."""
+    _validar_pesos_nao_negativos(grafo)
+    if not indice_componentes(grafo).mesma_componente(origem, destino):
         return inf, []
 
-    _validar_pesos_nao_negativos(grafo)
+    return dijkstra_csr(obter_csr(grafo), origem, destino)
 
-    dist = {no: inf for no in grafo.obter_nos()}
-    dist[origem] = 0.0
-    anterior = {}
-    fila = [(0.0, origem)]
 
-    while fila:
-        dist_atual, u = heapq.heappop(fila)
+def dijkstra_arvore(grafo: Graph, origem: str):
+    """Calcula de uma vez as distâncias e predecessores de todos os nós a partir da origem."""
+    csr = obter_csr(grafo)
+    s = csr.id_de(origem)
+    if s is None:
+        raise ValueError(f"Nó de origem '{origem}' não existe no grafo.")
 
-        if dist_atual > dist[u]:
-            continue
+    dist_ids, anterior_ids = dial_ids(csr, s)
 
-        if u == destino:
-            break
+    nomes = csr.nomes
+    dist = {nomes[i]: d for i, d in enumerate(dist_ids)}
+    anterior = {nomes[i]: (nomes[a] if a >= 0 else None) for i, a in enumerate(anterior_ids)}
+    return dist, anterior
 
-        for v, peso in grafo.vizinhos(u):
-            novo_custo = dist[u] + float(peso)
-            if novo_custo < dist[v]:
-                dist[v] = novo_custo
-                anterior[v] = u
-                heapq.heappush(fila, (novo_custo, v))
 
-    if dist[destino] == inf:
-        return inf, []
+def extrair_caminho(anterior: dict, origem: str, destino: str):
+    """Extrai o caminho origem -> destino de um dicionário de predecessores."""
+    if destino not in anterior or (destino != origem and anterior[destino] is None):
+        return []
 
-    caminho = []
-    atual = destino
-    while atual != origem:
-        caminho.append(atual)
-        atual = anterior[atual]
-    caminho.append(origem)
+    caminho = [destino]
+    while caminho[-1] != origem:
+        caminho.append(anterior[caminho[-1]])
     caminho.reverse()
+    return caminho
+
+
+def dijkstra_lote(grafo: Graph, pares):
+    """Resolve vários pares (origem, destino) com uma única busca por origem distinta."""
+    csr = obter_csr(grafo)
+    rotulo = indice_componentes(csr).rotulo
+    destinos_por_origem = {}
+    for origem, destino in pares:
+        destinos_por_origem.setdefault(origem, set()).add(destino)
+
+    resultados = {}
+    for origem, destinos in destinos_por_origem.items():
+        s = csr.id_de(origem)
+        ids_destinos = {destino: csr.id_de(destino) for destino in destinos}
+        validos = [
+            t for t in ids_destinos.values()
+            if t is not None and s is not None and rotulo[t] == rotulo[s]
+        ]
+
+        dist = anterior = None
+        if s is not None and validos:
+            alvo = validos[0] if len(ids_destinos) == 1 else -1
+            dist, anterior = dial_ids(csr, s, alvo)
+
+        for destino, t in ids_destinos.items():
+            if dist is None or t not in validos or dist[t] == inf:
+                resultados[(origem, destino)] = (inf, [])
+            else:
+                caminho = [csr.nome_de(i) for i in caminho_ids(anterior, s, t)]
+                resultados[(origem, destino)] = (dist[t], caminho)
 
-    return dist[destino], caminho
+    return [resultados[(origem, destino)] for origem, destino in pares]
 
 
 def bfs_arvore(grafo: Graph, origem: str):
     """Constrói a árvore BFS a partir da origem."""
-    if origem not in grafo.adjacencia:
+    if not isinstance(grafo, GrafoCSR) and origem not in grafo.adjacencia:
         raise ValueError(f"Bairro de origem '{origem}' não existe no grafo.")
 
-    visitado = set()
-    pai = {}
-    nivel = {}
-
-    fila = deque()
-
-    visitado.add(origem)
-    pai[origem] = None
-    nivel[origem] = 0
-    fila.append(origem)
-
-    while fila:
-        atual = fila.popleft()
-        for vizinho, _peso in grafo.vizinhos(atual):
-            if vizinho not in visitado:
-                visitado.add(vizinho)
-                pai[vizinho] = atual
-                nivel[vizinho] = nivel[atual] + 1
-                fila.append(vizinho)
-
-    return pai, nivel
+    return bfs_arvore_csr(obter_csr(grafo), origem)
 
 
 def bfs_caminho(grafo: Graph, origem: str, destino: str):
     """Encontra o menor caminho entre origem e destino usando BFS."""
-    if origem not in grafo.adjacencia or destino not in grafo.adjacencia:
+    csr = obter_csr(grafo)
+    s = csr.id_de(origem)
+    t = csr.id_de(destino)
+    if s is None or t is None:
         return []
-    
-    if origem == destino:
-        return [origem]
-    
-    visitado = set()
-    anterior = {}
-    fila = deque([origem])
-    visitado.add(origem)
-    anterior[origem] = None
-    
-    encontrou = False
-    
-    while fila and not encontrou:
-        atual = fila.popleft()
-        
-        for vizinho, _ in grafo.vizinhos(atual):
-            if vizinho not in visitado:
-                visitado.add(vizinho)
-                anterior[vizinho] = atual
-                fila.append(vizinho)
-                
-                if vizinho == destino:
-                    encontrou = True
-                    break
-    
-    if not encontrou:
+    if s != t and not indice_componentes(csr).mesma_componente(origem, destino):
         return []
-    
-    caminho = []
-    no_atual = destino
-    while no_atual is not None:
-        caminho.append(no_atual)
-        no_atual = anterior[no_atual]
-    
-    caminho.reverse()
-    return caminho
+
+    return [csr.nome_de(i) for i in bfs_caminho_ids(csr, s, t)]
 
 
 def dfs_arvore(grafo: Graph, origem: str):
     """Constrói a árvore DFS a partir da origem."""
-    if origem not in grafo.adjacencia:
+    if not isinstance(grafo, GrafoCSR) and origem not in grafo.adjacencia:
         raise ValueError(f"Bairro de origem '{origem}' não existe no grafo.")
-    
-    visitado = set()
-    pai = {}
-    descoberta = {}
-    pilha = [origem]
-    contador = 0
-    
-    visitado.add(origem)
-    pai[origem] = None
-    descoberta[origem] = contador
-    contador += 1
-    
-    while pilha:
-        atual = pilha.pop()
-        
-        vizinhos = list(grafo.vizinhos(atual))
-        for vizinho, _ in reversed(vizinhos):
-            if vizinho not in visitado:
-                visitado.add(vizinho)
-                pai[vizinho] = atual
-                descoberta[vizinho] = contador
-                contador += 1
-                pilha.append(vizinho)
-    
-    return pai, descoberta
+
+    return dfs_arvore_csr(obter_csr(grafo), origem)
 
 
 def dfs_caminho(grafo: Graph, origem: str, destino: str):
-    """Encontra um caminho entre origem e destino usando DFS."""
-    if origem not in grafo.adjacencia or destino not in grafo.adjacencia:
+    """Encontra um caminho entre origem e destino usando DFS (sem recursão)."""
+    csr = obter_csr(grafo)
+    s = csr.id_de(origem)
+    t = csr.id_de(destino)
+    if s is None or t is None:
         return []
-    
-    if origem == destino:
-        return [origem]
-    
-    visitado = set()
-    caminho_atual = []
-    resultado = []
-    
-    def dfs_recursivo(no_atual):
-        nonlocal resultado
-        if resultado:
-            return
-            
-        visitado.add(no_atual)
-        caminho_atual.append(no_atual)
-        
-        if no_atual == destino:
-            resultado = caminho_atual.copy()
-            return
-        
-        for vizinho, _ in grafo.vizinhos(no_atual):
-            if vizinho not in visitado:
-                dfs_recursivo(vizinho)
-                if resultado:
-                    return
-
-        caminho_atual.pop()
-    
-    dfs_recursivo(origem)
-    return resultado
+
+    return [csr.nome_de(i) for i in dfs_caminho_ids(csr, s, t)]
 
 
 def dfs_detectar_ciclo(grafo: Graph) -> bool:
     """Detecta se o grafo possui ciclos."""
-    visitado = set()
-
-    def dfs(u, pai):
-        visitado.add(u)
-        for v, _ in grafo.vizinhos(u):
-            if v == pai:
-                continue
-            if v not in visitado:
-                if dfs(v, u):
-                    return True
-            else:
-                return True
-        return False
+    return dfs_tem_ciclo_ids(obter_csr(grafo))
 
-    for no in grafo.obter_nos():
-        if no not in visitado and dfs(no, None):
-            return True
-    return False
+
+def dfs_tempos(grafo: Graph):
+    """Retorna (pre, pos): tempos de descoberta e finalização de cada nó na DFS completa."""
+    csr = obter_csr(grafo)
+    _pai, pre, pos, _arestas = dfs_tempos_ids(csr)
+    nomes = csr.nomes
+    return dict(zip(nomes, pre)), dict(zip(nomes, pos))
 
 
 def dfs_classificar_arestas(grafo: Graph):
     """Classifica as arestas do grafo em tree, back ou cross."""
-    visitado = set()
-    em_processamento = set()
-    classificacao = {}
+    csr = obter_csr(grafo)
+    _pai, _pre, _pos, arestas = dfs_tempos_ids(csr, classificar=True)
 
-    def registrar(u, v, tipo):
-        chave = tuple(sorted((u, v)))
+    nomes = csr.nomes
+    tipos = ("tree", "back", "cross")
+    classificacao = {}
+    for u, v, tipo in arestas:
+        chave = tuple(sorted((nomes[u], nomes[v])))
         if chave not in classificacao:
-            classificacao[chave] = tipo
-
-    def dfs(u, pai):
-        visitado.add(u)
-        em_processamento.add(u)
-
-        for v, _ in grafo.vizinhos(u):
-            if v == pai:
-                continue
-            if v not in visitado:
-                registrar(u, v, "tree")
-                dfs(v, u)
-            elif v in em_processamento:
-                registrar(u, v, "back")
-            else:
-                registrar(u, v, "cross")
-
-        em_processamento.remove(u)
-
-    for no in grafo.obter_nos():
-        if no not in visitado:
-            dfs(no, None)
+            classificacao[chave] = tipos[tipo]
 
     return classificacao
 
 
-def bellman_ford(grafo: Graph, origem: str):
-    """Encontra caminhos mínimos a partir da origem e detecta ciclos negativos."""
-    if origem not in grafo.adjacencia:
+def bellman_ford(grafo: Graph, origem: str, estatisticas: dict = None):
+    """Encontra caminhos mínimos a partir da origem e detecta ciclos negativos.
+
+    Usa a variante com fila (SPFA) sobre o CSR; ``estatisticas`` recebe as
+    relaxações e o ciclo negativo encontrado. Distâncias e detecção de ciclo
+    são as da varredura completa de arestas, mas entre caminhos empatados o
+    predecessor é o da primeira relaxação estrita na ordem da fila, então pode
+    diferir do da varredura; ``anterior`` é sempre uma árvore de caminhos mínimos.
+    """
+    if not isinstance(grafo, GrafoCSR) and origem not in grafo.adjacencia:
         raise ValueError(f"Bairro de origem '{origem}' não existe no grafo.")
-    
-    nos = list(grafo.obter_nos())
-    dist = {no: inf for no in nos}
-    anterior = {no: None for no in nos}
-    dist[origem] = 0.0
-    
-    for _ in range(len(nos) - 1):
-        houve_mudanca = False
-        
-        for u in nos:
-            if dist[u] == inf:
-                continue
-                
-            for v, peso in grafo.vizinhos(u):
-                peso_float = float(peso)
-                if dist[u] + peso_float < dist[v]:
-                    dist[v] = dist[u] + peso_float
-                    anterior[v] = u
-                    houve_mudanca = True
-        
-        if not houve_mudanca:
-            break
-    
-    tem_ciclo_negativo = False
-    for u in nos:
-        if dist[u] == inf:
-            continue
-            
-        for v, peso in grafo.vizinhos(u):
-            peso_float = float(peso)
-            if dist[u] + peso_float < dist[v]:
-                tem_ciclo_negativo = True
-                break
-        if tem_ciclo_negativo:
-            break
-    
-    return dist, anterior, tem_ciclo_negativo
+
+    return bellman_ford_csr(obter_csr(grafo), origem, estatisticas)
+
+
+def encontrar_ciclo_negativo(grafo: Graph, origem: str):
+    """Retorna um ciclo negativo alcançável da origem (fechado), ou [] se não houver."""
+    estatisticas = {}
+    bellman_ford(grafo, origem, estatisticas)
+    return estatisticas.get("ciclo_negativo", [])
 
 
 def bellman_ford_caminho(grafo: Graph, origem: str, destino: str):
@@ -0,0 +1,187 @@
+import os
+import json
+import hashlib
+import numpy as np
+from math import inf
+from .graph import Graph
+from .csr import obter_csr, dijkstra_ids
+from .io import carregar_grafo_recife
+
+
+class TabelaDistancias:
+    """Distâncias e predecessores de todos os pares, indexados pelos ids dos nós.
+
+    ``anterior[i, j]`` é o predecessor de ``j`` no caminho mínimo a partir de ``i``
+    (-1 se ``j`` for inalcançável ou igual a ``i``).
+    """
+
+    def __init__(self, nomes, dist, anterior):
+        """Guarda os nomes dos nós e as matrizes n x n (arrays ou memmaps)."""
+        self.nomes = list(nomes)
+        self.indice = {no: i for i, no in enumerate(self.nomes)}
+        self.dist = dist
+        self.anterior = anterior
+
+
+def floyd_warshall(grafo: Graph):
+    """Calcula (dist, anterior) de todos os pares com Floyd-Warshall vetorizado em NumPy.
+
+    As distâncias coincidem com as de ``dijkstra``, mas em empates o predecessor
+    pode ser outro; ``calcular_todos_os_pares`` só o usa quando pedido.
+    """
+    csr = obter_csr(grafo)
+    if csr.tem_peso_negativo:
+        raise ValueError("Pesos negativos em grafo não-direcionado formam ciclo negativo.")
+
+    n = csr.ordem()
+    dist = np.full((n, n), np.inf)
+    anterior = np.full((n, n), -1, dtype=np.int64)
+
+    for u in range(n):
+        for k in range(csr.offsets[u], csr.offsets[u + 1]):
+            v, peso = csr.alvos[k], csr.pesos[k]
+            if peso < dist[u, v]:
+                dist[u, v] = peso
+                anterior[u, v] = u
+    np.fill_diagonal(dist, 0.0)
+    np.fill_diagonal(anterior, -1)
+
+    for k in range(n):
+        candidato = dist[:, k, None] + dist[None, k, :]
+        melhora = candidato < dist
+        dist = np.where(melhora, candidato, dist)
+        anterior = np.where(melhora, anterior[k, :][None, :], anterior)
+
+    return dist, anterior
+
+
+def dijkstra_repetido(grafo: Graph):
+    """Calcula (dist, anterior) de todos os pares com um Dijkstra por origem.
+
+    Os predecessores coincidem com os de ``dijkstra``, inclusive em empates.
+    """
+    csr = obter_csr(grafo)
+    n = csr.ordem()
+    dist = np.empty((n, n))
+    anterior = np.empty((n, n), dtype=np.int64)
+
+    for s in range(n):
+        dist_s, anterior_s = dijkstra_ids(csr, s)
+        dist[s] = dist_s
+        anterior[s] = anterior_s
+
+    return dist, anterior
+
+
+def calcular_todos_os_pares(grafo: Graph, metodo: str = "dijkstra"):
+    """Calcula a tabela completa; o padrão (Dijkstra repetido) mantém os caminhos de ``dijkstra``."""
+    if metodo == "floyd_warshall":
+        dist, anterior = floyd_warshall(grafo)
+    elif metodo == "dijkstra":
+        dist, anterior = dijkstra_repetido(grafo)
+    else:
+        raise ValueError("Método deve ser 'dijkstra' ou 'floyd_warshall'.")
+
+    return TabelaDistancias(grafo.obter_nos(), dist, anterior)
+
+
+VERSAO_CACHE = "apsp-v2"
+
+
+def chave_cache(*caminhos: str, metodo: str = "dijkstra"):
+    """Retorna o hash SHA-256 da versão do formato, do método e do conteúdo dos arquivos."""
+    resumo = hashlib.sha256()
+    resumo.update(f"{VERSAO_CACHE}\0{metodo}\0".encode())
+    for caminho in caminhos:
+        with open(caminho, "rb") as f:
+            resumo.update(f.read())
+        resumo.update(b"\0")
+    return resumo.hexdigest()[:16]
+
+
+def _gravar_atomico(caminho: str, escrever):
+    """Grava em um arquivo temporário ao lado de ``caminho`` e o renomeia com ``os.replace``."""
+    temporario = f"{caminho}.{os.getpid()}.tmp"
+    try:
+        with open(temporario, "wb") as f:
+            escrever(f)
+        os.replace(temporario, caminho)
+    finally:
+        if os.path.exists(temporario):
+            os.remove(temporario)
+
+
+def _ler_tabela_em_cache(caminho_dist: str, caminho_anterior: str, caminho_nomes: str):
+    """Abre a tabela em cache, ou retorna None se faltar arquivo ou as formas não baterem."""
+    if not all(os.path.exists(c) for c in (caminho_dist, caminho_anterior, caminho_nomes)):
+        return None
+    try:
+        with open(caminho_nomes, "r", encoding="utf-8") as f:
+            nomes = json.load(f)
+        dist = np.load(caminho_dist, mmap_mode="r")
+        anterior = np.load(caminho_anterior, mmap_mode="r")
+    except (OSError, ValueError):
+        return None
+
+    n = len(nomes)
+    if dist.shape != (n, n) or anterior.shape != (n, n):
+        return None
+    return TabelaDistancias(nomes, dist, anterior)
+
+
+def carregar_ou_calcular_tabela(
+    caminho_bairros_unique: str,
+    caminho_adjacencias: str,
+    diretorio_cache: str,
+    metodo: str = "dijkstra",
+    grafo: Graph = None
+):
+    """Lê a tabela do cache em disco (memory-mapped) ou a calcula e persiste.
+
+    Cada arquivo é gravado com nome temporário e renomeado, e o cache só é
+    aceito se os três arquivos existirem com formas consistentes. ``grafo``,
+    se informado, deve ter sido carregado desses arquivos e evita relê-los.
+    """
+    chave = chave_cache(caminho_bairros_unique, caminho_adjacencias, metodo=metodo)
+    prefixo = os.path.join(diretorio_cache, f"apsp_{chave}")
+    caminho_dist = f"{prefixo}_dist.npy"
+    caminho_anterior = f"{prefixo}_anterior.npy"
+    caminho_nomes = f"{prefixo}_nomes.json"
+
+    tabela = _ler_tabela_em_cache(caminho_dist, caminho_anterior, caminho_nomes)
+    if tabela is not None:
+        return tabela
+
+    if grafo is None:
+        grafo, _ = carregar_grafo_recife(caminho_bairros_unique, caminho_adjacencias)
+    tabela = calcular_todos_os_pares(grafo, metodo)
+
+    os.makedirs(diretorio_cache, exist_ok=True)
+    _gravar_atomico(caminho_dist, lambda f: np.save(f, tabela.dist))
+    _gravar_atomico(caminho_anterior, lambda f: np.save(f, tabela.anterior))
+    _gravar_atomico(
+        caminho_nomes,
+        lambda f: f.write(json.dumps(tabela.nomes, ensure_ascii=False).encode("utf-8")),
+    )
+
+    return _ler_tabela_em_cache(caminho_dist, caminho_anterior, caminho_nomes)
+
+
+def dijkstra_tabela(tabela: TabelaDistancias, origem: str, destino: str):
+    """Consulta a tabela em O(tamanho do caminho), no contrato de ``dijkstra``."""
+    s = tabela.indice.get(origem)
+    t = tabela.indice.get(destino)
+    if s is None or t is None:
+        return inf, []
+
+    custo = float(tabela.dist[s, t])
+    if custo == inf:
+        return inf, []
+
+    linha = tabela.anterior[s]
+    caminho = [t]
+    while caminho[-1] != s:
+        caminho.append(int(linha[caminho[-1]]))
+    caminho.reverse()
+
+    return custo, [tabela.nomes[i] for i in caminho]
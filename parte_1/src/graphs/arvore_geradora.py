@@ -0,0 +1,125 @@
+import heapq
+from .graph import Graph
+from .csr import GrafoCSR, obter_csr
+from .componentes import UniaoBusca
+
+
+class FlorestaGeradora:
+    """Floresta geradora mínima: uma árvore por componente conexa do grafo.
+
+    ``arestas`` lista (u, v, peso) na ordem em que entraram na floresta e
+    ``componentes`` lista os nós de cada componente, na ordem dos ids.
+    """
+
+    def __init__(self, arestas, componentes):
+        """Guarda as arestas escolhidas e os nós de cada componente."""
+        self.arestas = arestas
+        self.componentes = componentes
+        self.peso_total = sum(peso for _, _, peso in arestas)
+
+    def por_componente(self):
+        """Retorna, para cada componente, um dicionário com nós, arestas e peso da sua árvore."""
+        componente_de = {}
+        for i, nos in enumerate(self.componentes):
+            for no in nos:
+                componente_de[no] = i
+
+        arvores = [{"nos": nos, "arestas": [], "peso": 0.0} for nos in self.componentes]
+        for u, v, peso in self.arestas:
+            arvore = arvores[componente_de[u]]
+            arvore["arestas"].append((u, v, peso))
+            arvore["peso"] += peso
+        return arvores
+
+
+def _componentes_por_nome(csr: GrafoCSR, conjuntos: UniaoBusca):
+    """Agrupa os nós pelo representante do seu conjunto, na ordem do menor id."""
+    grupos = {}
+    for i in range(csr.ordem()):
+        grupos.setdefault(conjuntos.encontrar(i), []).append(csr.nomes[i])
+    return list(grupos.values())
+
+
+def kruskal_ids(csr: GrafoCSR):
+    """Kruskal em O(E log V); retorna (arestas (u, v, peso) por id, conjuntos).
+
+    Cada aresta não-direcionada é considerada uma vez (u < v) e laços são
+    ignorados. Empates de peso são resolvidos pelos ids das pontas.
+    """
+    offsets, alvos, pesos = csr.offsets, csr.alvos, csr.pesos
+    candidatas = sorted(
+        (pesos[k], u, alvos[k])
+        for u in range(csr.ordem())
+        for k in range(offsets[u], offsets[u + 1])
+        if u < alvos[k]
+    )
+
+    conjuntos = UniaoBusca(csr.ordem())
+    escolhidas = []
+    limite = csr.ordem() - 1
+    for peso, u, v in candidatas:
+        if conjuntos.unir(u, v):
+            escolhidas.append((u, v, peso))
+            if len(escolhidas) == limite:
+                break
+    return escolhidas, conjuntos
+
+
+def prim_ids(csr: GrafoCSR):
+    """Prim preguiçoso com heap em O(E log V); retorna (arestas por id, componentes por id).
+
+    Entradas obsoletas ficam no heap e são descartadas ao sair. Quando o heap
+    esvazia, recomeça do menor id ainda fora da floresta, gerando uma árvore
+    por componente.
+    """
+    offsets, alvos, pesos = csr.offsets, csr.alvos, csr.pesos
+    n = csr.ordem()
+    na_arvore = [False] * n
+    escolhidas = []
+    componentes = []
+
+    for raiz in range(n):
+        if na_arvore[raiz]:
+            continue
+        na_arvore[raiz] = True
+        componente = [raiz]
+        fila = [(pesos[k], raiz, alvos[k]) for k in range(offsets[raiz], offsets[raiz + 1])]
+        heapq.heapify(fila)
+
+        while fila:
+            peso, u, v = heapq.heappop(fila)
+            if na_arvore[v]:
+                continue
+            na_arvore[v] = True
+            componente.append(v)
+            escolhidas.append((u, v, peso))
+            for k in range(offsets[v], offsets[v + 1]):
+                if not na_arvore[alvos[k]]:
+                    heapq.heappush(fila, (pesos[k], v, alvos[k]))
+
+        componentes.append(sorted(componente))
+    return escolhidas, componentes
+
+
+def kruskal(grafo: Graph):
+    """Floresta geradora mínima pelo algoritmo de Kruskal (união-busca)."""
+    csr = obter_csr(grafo)
+    escolhidas, conjuntos = kruskal_ids(csr)
+
+    nomes = csr.nomes
+    return FlorestaGeradora(
+        [(nomes[u], nomes[v], peso) for u, v, peso in escolhidas],
+        _componentes_por_nome(csr, conjuntos),
+    )
+
+
+def prim(grafo: Graph):
+    """Floresta geradora mínima pelo algoritmo de Prim (heap preguiçoso)."""
+    csr = obter_csr(grafo)
+    escolhidas, componentes = prim_ids(csr)
+
+    nomes = csr.nomes
+    return FlorestaGeradora(
+        [(nomes[u], nomes[v], peso) for u, v, peso in escolhidas],
+        [[nomes[i] for i in componente] for componente in componentes],
+    )
@@ -0,0 +1,134 @@
+from array import array
+from .graph import Graph
+from .csr import GrafoCSR, obter_csr
+
+
+class Biconexidade:
+    """Pontos de articulação, pontes e componentes biconexas (blocos) de um grafo.
+
+    ``blocos[i]`` lista os nós do bloco ``i``; nós isolados formam blocos unitários.
+    A árvore bloco-corte liga cada bloco aos pontos de articulação que ele contém.
+    """
+
+    def __init__(self, articulacoes, pontes, blocos):
+        """Guarda as articulações, as pontes (pares de nós) e os blocos."""
+        self.articulacoes = articulacoes
+        self.pontes = pontes
+        self.blocos = blocos
+
+    def blocos_por_articulacao(self):
+        """Retorna, para cada ponto de articulação, os índices dos blocos que o contêm."""
+        resultado = {no: [] for no in self.articulacoes}
+        for i, bloco in enumerate(self.blocos):
+            for no in bloco:
+                if no in resultado:
+                    resultado[no].append(i)
+        return resultado
+
+    def arvore_bloco_corte(self):
+        """Retorna as arestas (índice do bloco, articulação) da árvore bloco-corte."""
+        return [
+            (i, no)
+            for no, blocos in self.blocos_por_articulacao().items()
+            for i in blocos
+        ]
+
+
+def tarjan_ids(csr: GrafoCSR):
+    """Tarjan iterativo em O(V + E); retorna (articulacoes, pontes, blocos) por id.
+
+    Só a primeira aresta de volta ao pai é ignorada, então arestas paralelas contam
+    como ciclo (não são pontes). Laços são ignorados.
+    """
+    offsets, alvos = csr.offsets, csr.alvos
+    n = csr.ordem()
+    proximo = array("q", offsets)
+    descoberta = [-1] * n
+    menor = [0] * n
+    pai = [-1] * n
+    pulou_pai = [False] * n
+    eh_articulacao = [False] * n
+    pontes = []
+    blocos = []
+    relogio = 0
+
+    for r in range(n):
+        if descoberta[r] >= 0:
+            continue
+        descoberta[r] = menor[r] = relogio
+        relogio += 1
+        pilha = [r]
+        pilha_nos = [r]
+        filhos_raiz = 0
+
+        while pilha:
+            u = pilha[-1]
+            k = proximo[u]
+            if k < offsets[u + 1]:
+                proximo[u] = k + 1
+                v = alvos[k]
+                if v == u:
+                    continue
+                if v == pai[u] and not pulou_pai[u]:
+                    pulou_pai[u] = True
+                    continue
+                if descoberta[v] < 0:
+                    pai[v] = u
+                    descoberta[v] = menor[v] = relogio
+                    relogio += 1
+                    pilha.append(v)
+                    pilha_nos.append(v)
+                elif descoberta[v] < menor[u]:
+                    menor[u] = descoberta[v]
+                continue
+
+            pilha.pop()
+            if not pilha:
+                break
+            p = pilha[-1]
+            if menor[u] < menor[p]:
+                menor[p] = menor[u]
+            if menor[u] > descoberta[p]:
+                pontes.append((p, u))
+            if menor[u] >= descoberta[p]:
+                if p == r:
+                    filhos_raiz += 1
+                else:
+                    eh_articulacao[p] = True
+                bloco = []
+                while bloco[-1:] != [u]:
+                    bloco.append(pilha_nos.pop())
+                bloco.append(p)
+                bloco.reverse()
+                blocos.append(bloco)
+
+        if filhos_raiz >= 2:
+            eh_articulacao[r] = True
+        if relogio == descoberta[r] + 1:
+            blocos.append([r])
+
+    articulacoes = [i for i in range(n) if eh_articulacao[i]]
+    return articulacoes, pontes, blocos
+
+
+def biconexidade(grafo: Graph):
+    """Calcula articulações, pontes e blocos do grafo, traduzidos para nomes."""
+    csr = obter_csr(grafo)
+    articulacoes, pontes, blocos = tarjan_ids(csr)
+
+    nomes = csr.nomes
+    return Biconexidade(
+        [nomes[i] for i in articulacoes],
+        [(nomes[u], nomes[v]) for u, v in pontes],
+        [[nomes[i] for i in bloco] for bloco in blocos],
+    )
+
+
+def pontos_articulacao(grafo: Graph):
+    """Retorna os nós cuja remoção desconecta sua componente."""
+    return biconexidade(grafo).articulacoes
+
+
+def pontes(grafo: Graph):
+    """Retorna as arestas cuja remoção desconecta sua componente."""
+    return biconexidade(grafo).pontes
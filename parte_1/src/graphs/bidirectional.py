@@ -0,0 +1,182 @@
+import heapq
+from math import inf
+from .graph import Graph
+from .csr import GrafoCSR, obter_csr, postos_por_nome, caminho_ids, dijkstra_ids
+from .componentes import indice_componentes
+
+
+def _juntar_caminho(anterior_ida, anterior_volta, s, t, meio_ida, meio_volta):
+    """Une o caminho s -> meio_ida com o caminho meio_volta -> t (ids)."""
+    caminho = caminho_ids(anterior_ida, s, meio_ida)
+    v = meio_volta
+    if v != meio_ida:
+        caminho.append(v)
+    while v != t:
+        v = anterior_volta[v]
+        caminho.append(v)
+    return caminho
+
+
+def dijkstra_bidirecional_ids(csr: GrafoCSR, s: int, t: int, estatisticas: dict = None):
+    """Dijkstra bidirecional sobre ids; retorna (custo, caminho em ids).
+
+    Alterna entre a busca a partir de s e a busca a partir de t (o grafo é
+    não-direcionado) e para quando a soma dos topos das duas filas alcança o
+    melhor custo de encontro já visto.
+    """
+    if csr.tem_peso_negativo:
+        raise ValueError("Dijkstra não aceita pesos negativos.")
+    if s == t:
+        if estatisticas is not None:
+            estatisticas["nos_fixados"] = 1
+        return 0.0, [s]
+
+    offsets, alvos, pesos = csr.offsets, csr.alvos, csr.pesos
+    posto, por_posto = postos_por_nome(csr)
+    n = csr.ordem()
+
+    dist = ([inf] * n, [inf] * n)
+    anterior = ([-1] * n, [-1] * n)
+    fixado = ([False] * n, [False] * n)
+    filas = ([(0.0, posto[s])], [(0.0, posto[t])])
+    dist[0][s] = 0.0
+    dist[1][t] = 0.0
+
+    melhor = inf
+    encontro = None
+    fixados = 0
+
+    while filas[0] and filas[1]:
+        if filas[0][0][0] + filas[1][0][0] >= melhor:
+            break
+
+        lado = 0 if filas[0][0][0] <= filas[1][0][0] else 1
+        dist_lado, dist_outro = dist[lado], dist[1 - lado]
+        anterior_lado = anterior[lado]
+
+        dist_atual, r = heapq.heappop(filas[lado])
+        u = por_posto[r]
+        if dist_atual > dist_lado[u] or fixado[lado][u]:
+            continue
+        fixado[lado][u] = True
+        fixados += 1
+
+        for k in range(offsets[u], offsets[u + 1]):
+            v = alvos[k]
+            novo_custo = dist_atual + pesos[k]
+            if novo_custo < dist_lado[v]:
+                dist_lado[v] = novo_custo
+                anterior_lado[v] = u
+                heapq.heappush(filas[lado], (novo_custo, posto[v]))
+            if dist_outro[v] != inf and novo_custo + dist_outro[v] < melhor:
+                melhor = novo_custo + dist_outro[v]
+                encontro = (lado, u, v)
+
+    if estatisticas is not None:
+        estatisticas["nos_fixados"] = fixados
+
+    if encontro is None:
+        return inf, []
+
+    lado, u, v = encontro
+    if lado == 0:
+        caminho = _juntar_caminho(anterior[0], anterior[1], s, t, u, v)
+    else:
+        caminho = _juntar_caminho(anterior[0], anterior[1], s, t, v, u)
+    return melhor, caminho
+
+
+def dijkstra_bidirecional(grafo: Graph, origem: str, destino: str, estatisticas: dict = None):
+    """Caminho mínimo entre origem e destino com Dijkstra bidirecional, no contrato de ``dijkstra``.
+
+    O custo é sempre o de ``dijkstra``; entre caminhos empatados, o devolvido
+    depende do nó de encontro das duas buscas e pode ser outro.
+    """
+    csr = obter_csr(grafo)
+    s = csr.id_de(origem)
+    t = csr.id_de(destino)
+    if not indice_componentes(csr).mesma_componente(origem, destino):
+        return inf, []
+
+    custo, caminho = dijkstra_bidirecional_ids(csr, s, t, estatisticas)
+    return custo, [csr.nome_de(i) for i in caminho]
+
+
+def bfs_caminho_bidirecional(grafo: Graph, origem: str, destino: str, estatisticas: dict = None):
+    """Menor caminho em número de arestas expandindo, nível a nível, a menor das duas fronteiras."""
+    csr = obter_csr(grafo)
+    s = csr.id_de(origem)
+    t = csr.id_de(destino)
+    if s is None or t is None:
+        return []
+    if not indice_componentes(csr).mesma_componente(origem, destino):
+        if estatisticas is not None:
+            estatisticas["nos_visitados"] = 0
+        return []
+    if s == t:
+        if estatisticas is not None:
+            estatisticas["nos_visitados"] = 1
+        return [origem]
+
+    offsets, alvos = csr.offsets, csr.alvos
+    n = csr.ordem()
+    nivel = ([-1] * n, [-1] * n)
+    anterior = ([-1] * n, [-1] * n)
+    fronteiras = ([s], [t])
+    nivel[0][s] = 0
+    nivel[1][t] = 0
+    visitados = 2
+    encontro = None
+
+    while fronteiras[0] and fronteiras[1] and encontro is None:
+        lado = 0 if len(fronteiras[0]) <= len(fronteiras[1]) else 1
+        nivel_lado, nivel_outro = nivel[lado], nivel[1 - lado]
+        anterior_lado = anterior[lado]
+        melhor = inf
+        proxima = []
+
+        for u in fronteiras[lado]:
+            for k in range(offsets[u], offsets[u + 1]):
+                v = alvos[k]
+                if nivel_outro[v] >= 0:
+                    total = nivel_lado[u] + 1 + nivel_outro[v]
+                    if total < melhor:
+                        melhor = total
+                        encontro = (lado, u, v)
+                if nivel_lado[v] < 0:
+                    nivel_lado[v] = nivel_lado[u] + 1
+                    anterior_lado[v] = u
+                    visitados += 1
+                    proxima.append(v)
+
+        fronteiras = (proxima, fronteiras[1]) if lado == 0 else (fronteiras[0], proxima)
+
+    if estatisticas is not None:
+        estatisticas["nos_visitados"] = visitados
+
+    if encontro is None:
+        return []
+
+    lado, u, v = encontro
+    if lado == 0:
+        caminho = _juntar_caminho(anterior[0], anterior[1], s, t, u, v)
+    else:
+        caminho = _juntar_caminho(anterior[0], anterior[1], s, t, v, u)
+    return [csr.nome_de(i) for i in caminho]
+
+
+def comparar_nos_fixados(grafo: Graph, origem: str, destino: str):
+    """Retorna quantos nós Dijkstra unidirecional e bidirecional fixam para o mesmo par."""
+    csr = obter_csr(grafo)
+    s = csr.id_de(origem)
+    t = csr.id_de(destino)
+    if s is None or t is None:
+        raise ValueError("Origem e destino devem existir no grafo.")
+
+    unidirecional, bidirecional = {}, {}
+    dijkstra_ids(csr, s, t, estatisticas=unidirecional)
+    dijkstra_bidirecional_ids(csr, s, t, estatisticas=bidirecional)
+    return {
+        "unidirecional": unidirecional["nos_fixados"],
+        "bidirecional": bidirecional["nos_fixados"],
+    }
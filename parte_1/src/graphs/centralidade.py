@@ -0,0 +1,246 @@
+import heapq
+import random
+import numpy as np
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from math import ceil, inf, log
+from .graph import Graph
+from .csr import GrafoCSR, obter_csr
+
+_trabalhador = None
+LARGURA_LOTE = 64
+
+
+def adjacencia_simples(csr: GrafoCSR):
+    """Retorna (offsets, alvos, pesos) sem laços e sem arestas paralelas (fica o menor peso)."""
+    if "simples" not in csr.derivados:
+        offsets = array("q", [0])
+        alvos = array("i")
+        pesos = array("d")
+        for u in range(csr.ordem()):
+            menor = {}
+            for k in range(csr.offsets[u], csr.offsets[u + 1]):
+                v, peso = csr.alvos[k], csr.pesos[k]
+                if v != u and peso < menor.get(v, inf):
+                    menor[v] = peso
+            alvos.extend(menor.keys())
+            pesos.extend(menor.values())
+            offsets.append(len(alvos))
+        csr.derivados["simples"] = (offsets, alvos, pesos)
+    return csr.derivados["simples"]
+
+
+def _dependencias_bfs(offsets, alvos, s: int, n: int):
+    """Passo de Brandes sem pesos: retorna a dependência de s em cada nó."""
+    sigma = [0] * n
+    dist = [-1] * n
+    sigma[s] = 1
+    dist[s] = 0
+    ordem = []
+    fila = deque([s])
+
+    while fila:
+        u = fila.popleft()
+        ordem.append(u)
+        proximo = dist[u] + 1
+        sigma_u = sigma[u]
+        for v in alvos[offsets[u]:offsets[u + 1]]:
+            if dist[v] < 0:
+                dist[v] = proximo
+                fila.append(v)
+            if dist[v] == proximo:
+                sigma[v] += sigma_u
+
+    delta = [0.0] * n
+    for w in reversed(ordem):
+        dw = dist[w] - 1
+        coeficiente = (1.0 + delta[w]) / sigma[w]
+        for v in alvos[offsets[w]:offsets[w + 1]]:
+            if dist[v] == dw:
+                delta[v] += sigma[v] * coeficiente
+    delta[s] = 0.0
+    return delta
+
+
+def _dependencias_dijkstra(offsets, alvos, pesos, s: int, n: int):
+    """Passo de Brandes com pesos: retorna a dependência de s em cada nó."""
+    sigma = [0] * n
+    dist = [inf] * n
+    fixado = [False] * n
+    predecessores = [[] for _ in range(n)]
+    sigma[s] = 1
+    dist[s] = 0.0
+    ordem = []
+    fila = [(0.0, s)]
+
+    while fila:
+        d, u = heapq.heappop(fila)
+        if fixado[u]:
+            continue
+        fixado[u] = True
+        ordem.append(u)
+        for k in range(offsets[u], offsets[u + 1]):
+            v = alvos[k]
+            novo_custo = d + pesos[k]
+            if novo_custo < dist[v]:
+                dist[v] = novo_custo
+                sigma[v] = sigma[u]
+                predecessores[v] = [u]
+                heapq.heappush(fila, (novo_custo, v))
+            elif novo_custo == dist[v] and not fixado[v]:
+                sigma[v] += sigma[u]
+                predecessores[v].append(u)
+
+    delta = [0.0] * n
+    for w in reversed(ordem):
+        coeficiente = (1.0 + delta[w]) / sigma[w]
+        for v in predecessores[w]:
+            delta[v] += sigma[v] * coeficiente
+    delta[s] = 0.0
+    return delta
+
+
+def _somar_dependencias(adjacencia, fontes, ponderado: bool, n: int):
+    """Soma as dependências das fontes informadas."""
+    offsets, alvos, pesos = adjacencia
+    total = [0.0] * n
+    for s in fontes:
+        if ponderado:
+            delta = _dependencias_dijkstra(offsets, alvos, pesos, s, n)
+        else:
+            delta = _dependencias_bfs(offsets, alvos, s, n)
+        total = [a + b for a, b in zip(total, delta)]
+    return total
+
+
+def _iniciar_trabalhador(adjacencia, ponderado: bool, n: int):
+    """Guarda no processo trabalhador a adjacência simples e o modo de cálculo."""
+    global _trabalhador
+    _trabalhador = (adjacencia, ponderado, n)
+
+
+def _somar_dependencias_trabalhador(fontes):
+    """Ponto de entrada dos processos trabalhadores."""
+    adjacencia, ponderado, n = _trabalhador
+    return _somar_dependencias(adjacencia, fontes, ponderado, n)
+
+
+def amostras_necessarias(n: int, erro: float, confianca: float = 0.9):
+    """Número de fontes para erro absoluto ``erro`` na intermediação normalizada.
+
+    Usa a desigualdade de Hoeffding com união sobre os n nós: com probabilidade
+    ``confianca``, nenhum nó erra mais que ``erro``.
+    """
+    if not 0 < erro < 1 or not 0 < confianca < 1:
+        raise ValueError("Erro e confiança devem estar entre 0 e 1.")
+    return ceil(log(2 * n / (1 - confianca)) / (2 * erro * erro))
+
+
+def intermediacao(grafo: Graph, ponderado: bool = False, normalizar: bool = True,
+                  workers: int = 1, erro: float = None, confianca: float = 0.9,
+                  semente: int = 42):
+    """Centralidade de intermediação (betweenness) de cada nó pelo algoritmo de Brandes.
+
+    ``ponderado`` usa os pesos das arestas (Dijkstra) em vez do número de arestas (BFS).
+    Com ``workers > 1`` as fontes são divididas entre processos. Com ``erro``, usa
+    apenas uma amostra de fontes (``amostras_necessarias``) e extrapola o resultado.
+    """
+    csr = obter_csr(grafo)
+    if ponderado and csr.tem_peso_negativo:
+        raise ValueError("Intermediação ponderada não aceita pesos negativos.")
+
+    n = csr.ordem()
+    adjacencia = adjacencia_simples(csr)
+    fontes = list(range(n))
+    if erro is not None:
+        k = amostras_necessarias(n, erro, confianca)
+        if k < n:
+            fontes = sorted(random.Random(semente).sample(fontes, k))
+
+    if workers <= 1 or len(fontes) <= 1:
+        total = _somar_dependencias(adjacencia, fontes, ponderado, n)
+    else:
+        tamanho_lote = max(1, len(fontes) // (workers * 4))
+        lotes = [fontes[i:i + tamanho_lote] for i in range(0, len(fontes), tamanho_lote)]
+        total = [0.0] * n
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_iniciar_trabalhador, initargs=(adjacencia, ponderado, n)
+        ) as executor:
+            for parcial in executor.map(_somar_dependencias_trabalhador, lotes):
+                total = [a + b for a, b in zip(total, parcial)]
+
+    escala = 0.5 * n / len(fontes) if fontes else 0.0
+    if normalizar:
+        escala = escala * 2 / ((n - 1) * (n - 2)) if n > 2 else 0.0
+
+    return {csr.nomes[v]: total[v] * escala for v in range(n)}
+
+
+def _contar_bits(palavras):
+    """Conta os bits ligados de cada palavra uint64."""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(palavras).astype(np.int64)
+    return np.unpackbits(palavras.view(np.uint8).reshape(-1, 8), axis=1).sum(axis=1, dtype=np.int64)
+
+
+def distancias_bit_paralelas(csr: GrafoCSR):
+    """BFS de todas as fontes em lotes de 64, um bit por fonte em cada palavra uint64.
+
+    A cada nível, a nova fronteira de um nó é o OU das fronteiras dos vizinhos,
+    calculado para todos os nós de uma vez com ``np.bitwise_or.reduceat`` sobre o CSR.
+    Como o grafo é não-direcionado, os bits que chegam a v no nível d contam as
+    fontes a distância d de v. Retorna, por id, (soma das distâncias, nós alcançados,
+    soma dos inversos das distâncias).
+    """
+    n = csr.ordem()
+    offsets = np.frombuffer(csr.offsets, dtype=np.int64)
+    alvos = np.frombuffer(csr.alvos, dtype=np.int32)
+    com_vizinhos = np.flatnonzero(np.diff(offsets) > 0)
+    inicios = offsets[:-1][com_vizinhos]
+
+    soma = np.zeros(n, dtype=np.int64)
+    alcance = np.zeros(n, dtype=np.int64)
+    harmonica = np.zeros(n)
+
+    for base in range(0, n, LARGURA_LOTE):
+        fontes = np.arange(base, min(base + LARGURA_LOTE, n))
+        visitado = np.zeros(n, dtype=np.uint64)
+        visitado[fontes] = np.left_shift(np.uint64(1), (fontes - base).astype(np.uint64))
+        fronteira = visitado.copy()
+        nivel = 0
+
+        while len(inicios):
+            nivel += 1
+            proxima = np.zeros(n, dtype=np.uint64)
+            proxima[com_vizinhos] = np.bitwise_or.reduceat(fronteira[alvos], inicios)
+            proxima &= ~visitado
+            if not proxima.any():
+                break
+            visitado |= proxima
+            contagem = _contar_bits(proxima)
+            soma += contagem * nivel
+            alcance += contagem
+            harmonica += contagem / nivel
+            fronteira = proxima
+
+    return soma, alcance, harmonica
+
+
+def proximidade_e_harmonica(grafo: Graph):
+    """Retorna (proximidade, harmonica) de cada nó, em número de arestas.
+
+    A proximidade (closeness) usa a correção de Wasserman-Faust para grafos
+    desconexos; a harmônica é a soma de 1/d(v, u) sobre os nós alcançáveis.
+    """
+    csr = obter_csr(grafo)
+    n = csr.ordem()
+    soma, alcance, harmonica = distancias_bit_paralelas(csr)
+
+    proximidade = {}
+    for v, no in enumerate(csr.nomes):
+        if soma[v] > 0 and n > 1:
+            proximidade[no] = (alcance[v] / soma[v]) * (alcance[v] / (n - 1))
+        else:
+            proximidade[no] = 0.0
+    return proximidade, {no: float(harmonica[v]) for v, no in enumerate(csr.nomes)}
@@ -0,0 +1,107 @@
+from .graph import Graph
+from .csr import GrafoCSR, obter_csr
+
+
+class UniaoBusca:
+    """Conjuntos disjuntos sobre ids 0..n-1 com compressão de caminho e união por posto."""
+
+    def __init__(self, n: int):
+        """Cria n conjuntos unitários."""
+        self.pai = list(range(n))
+        self.posto = [0] * n
+        self.conjuntos = n
+
+    def encontrar(self, x: int):
+        """Retorna o representante do conjunto de x, comprimindo o caminho até ele."""
+        pai = self.pai
+        raiz = x
+        while pai[raiz] != raiz:
+            raiz = pai[raiz]
+        while pai[x] != raiz:
+            pai[x], x = raiz, pai[x]
+        return raiz
+
+    def unir(self, a: int, b: int):
+        """Une os conjuntos de a e b; retorna False se já estavam juntos."""
+        raiz_a, raiz_b = self.encontrar(a), self.encontrar(b)
+        if raiz_a == raiz_b:
+            return False
+        if self.posto[raiz_a] < self.posto[raiz_b]:
+            raiz_a, raiz_b = raiz_b, raiz_a
+        self.pai[raiz_b] = raiz_a
+        if self.posto[raiz_a] == self.posto[raiz_b]:
+            self.posto[raiz_a] += 1
+        self.conjuntos -= 1
+        return True
+
+
+class IndiceComponentes:
+    """Rótulo de componente conexa de cada nó, para consultas de alcançabilidade em O(1).
+
+    Os rótulos são densos e seguem a ordem do menor id de cada componente.
+    """
+
+    def __init__(self, nomes, indice, rotulo, tamanhos):
+        """Guarda os nomes/ids dos nós, o rótulo de cada id e o tamanho de cada componente."""
+        self.nomes = nomes
+        self.indice = indice
+        self.rotulo = rotulo
+        self.tamanhos = tamanhos
+
+    def numero_componentes(self):
+        """Retorna quantas componentes conexas o grafo possui."""
+        return len(self.tamanhos)
+
+    def componente_de(self, no):
+        """Retorna o rótulo da componente do nó, ou None se ele não existir."""
+        i = self.indice.get(no)
+        return None if i is None else self.rotulo[i]
+
+    def mesma_componente(self, u, v):
+        """Retorna True se existe caminho entre u e v."""
+        i, j = self.indice.get(u), self.indice.get(v)
+        return i is not None and j is not None and self.rotulo[i] == self.rotulo[j]
+
+    def tamanho_componente(self, no):
+        """Retorna o número de nós da componente do nó (0 se ele não existir)."""
+        c = self.componente_de(no)
+        return 0 if c is None else self.tamanhos[c]
+
+    def componente_gigante(self):
+        """Retorna os nós da maior componente, na ordem dos ids."""
+        if not self.tamanhos:
+            return []
+        maior = max(range(len(self.tamanhos)), key=self.tamanhos.__getitem__)
+        return [self.nomes[i] for i, c in enumerate(self.rotulo) if c == maior]
+
+
+def indice_componentes(grafo: Graph):
+    """Retorna o índice de componentes do grafo, calculado uma vez por snapshot CSR."""
+    csr = obter_csr(grafo)
+    if "componentes" not in csr.derivados:
+        csr.derivados["componentes"] = _construir_indice(csr)
+    return csr.derivados["componentes"]
+
+
+def _construir_indice(csr: GrafoCSR):
+    """Une as pontas de cada aresta e numera as componentes resultantes."""
+    n = csr.ordem()
+    offsets, alvos = csr.offsets, csr.alvos
+    conjuntos = UniaoBusca(n)
+    for u in range(n):
+        for k in range(offsets[u], offsets[u + 1]):
+            conjuntos.unir(u, alvos[k])
+
+    rotulo_da_raiz = {}
+    rotulo = [0] * n
+    tamanhos = []
+    for i in range(n):
+        raiz = conjuntos.encontrar(i)
+        c = rotulo_da_raiz.get(raiz)
+        if c is None:
+            c = rotulo_da_raiz[raiz] = len(tamanhos)
+            tamanhos.append(0)
+        rotulo[i] = c
+        tamanhos[c] += 1
+
+    return IndiceComponentes(csr.nomes, csr.indice, rotulo, tamanhos)
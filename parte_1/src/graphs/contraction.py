@@ -0,0 +1,231 @@
+import heapq
+import json
+from math import inf
+from .graph import Graph
+from .csr import obter_csr
+
+LIMITE_TESTEMUNHA = 64
+
+
+class HierarquiaContracao:
+    """Índice de contraction hierarchies: nível de cada nó e arestas para cima.
+
+    ``acima[u]`` mapeia cada vizinho de nível maior que ``u`` para ``(peso, meio)``,
+    onde ``meio`` é o nó contraído que originou o atalho (-1 para arestas originais).
+    """
+
+    def __init__(self, nomes, nivel, acima):
+        """Guarda os nomes dos nós, os níveis e a lista de arestas para cima."""
+        self.nomes = list(nomes)
+        self.indice = {no: i for i, no in enumerate(self.nomes)}
+        self.nivel = list(nivel)
+        self.acima = acima
+
+    def ordem(self):
+        """Retorna o número de nós do índice."""
+        return len(self.nomes)
+
+    def numero_atalhos(self):
+        """Retorna quantas arestas do índice são atalhos."""
+        return sum(1 for arestas in self.acima for _p, meio in arestas.values() if meio >= 0)
+
+
+def _busca_testemunha(adjacencia, origem: int, evitar: int, limite_custo: float):
+    """Dijkstra local a partir de origem ignorando ``evitar``, limitado em custo e nós."""
+    dist = {origem: 0.0}
+    fila = [(0.0, origem)]
+    fixados = 0
+
+    while fila:
+        d, u = heapq.heappop(fila)
+        if d > dist[u]:
+            continue
+        if d > limite_custo or fixados >= LIMITE_TESTEMUNHA:
+            break
+        fixados += 1
+        for v, (peso, _meio) in adjacencia[u].items():
+            if v == evitar:
+                continue
+            novo_custo = d + peso
+            if novo_custo < dist.get(v, inf):
+                dist[v] = novo_custo
+                heapq.heappush(fila, (novo_custo, v))
+
+    return dist
+
+
+def _atalhos_necessarios(adjacencia, v: int):
+    """Lista os atalhos (u, w, custo) exigidos pela contração de v."""
+    vizinhos = list(adjacencia[v].items())
+    atalhos = []
+
+    for i, (u, (peso_u, _)) in enumerate(vizinhos):
+        restantes = vizinhos[i + 1:]
+        if not restantes:
+            continue
+        limite = peso_u + max(peso_w for _w, (peso_w, _m) in restantes)
+        dist = _busca_testemunha(adjacencia, u, v, limite)
+        for w, (peso_w, _) in restantes:
+            custo = peso_u + peso_w
+            if dist.get(w, inf) > custo:
+                atalhos.append((u, w, custo))
+
+    return atalhos
+
+
+def construir_hierarquia(grafo: Graph):
+    """Constrói o índice contraindo os nós em ordem de diferença de arestas (offline)."""
+    csr = obter_csr(grafo)
+    if csr.tem_peso_negativo:
+        raise ValueError("Contraction hierarchies não aceitam pesos negativos.")
+
+    n = csr.ordem()
+    adjacencia = [dict() for _ in range(n)]
+    for u in range(n):
+        for k in range(csr.offsets[u], csr.offsets[u + 1]):
+            v, peso = csr.alvos[k], csr.pesos[k]
+            if v != u and peso < adjacencia[u].get(v, (inf, -1))[0]:
+                adjacencia[u][v] = (peso, -1)
+
+    vizinhos_contraidos = [0] * n
+
+    def prioridade(v):
+        return len(_atalhos_necessarios(adjacencia, v)) - len(adjacencia[v]) + vizinhos_contraidos[v]
+
+    fila = [(prioridade(v), v) for v in range(n)]
+    heapq.heapify(fila)
+    nivel = [-1] * n
+    acima = [None] * n
+    proximo_nivel = 0
+
+    while fila:
+        _p, v = heapq.heappop(fila)
+        if nivel[v] >= 0:
+            continue
+        atual = prioridade(v)
+        if fila and atual > fila[0][0]:
+            heapq.heappush(fila, (atual, v))
+            continue
+
+        atalhos = _atalhos_necessarios(adjacencia, v)
+        nivel[v] = proximo_nivel
+        proximo_nivel += 1
+        acima[v] = adjacencia[v]
+
+        for u in acima[v]:
+            del adjacencia[u][v]
+            vizinhos_contraidos[u] += 1
+        for u, w, custo in atalhos:
+            if custo < adjacencia[u].get(w, (inf, -1))[0]:
+                adjacencia[u][w] = (custo, v)
+                adjacencia[w][u] = (custo, v)
+        adjacencia[v] = {}
+
+    return HierarquiaContracao(csr.nomes, nivel, acima)
+
+
+def salvar_hierarquia(hierarquia: HierarquiaContracao, caminho: str):
+    """Serializa o índice em JSON."""
+    dados = {
+        "nomes": hierarquia.nomes,
+        "nivel": hierarquia.nivel,
+        "acima": [
+            [[v, peso, meio] for v, (peso, meio) in arestas.items()]
+            for arestas in hierarquia.acima
+        ],
+    }
+    with open(caminho, "w", encoding="utf-8") as f:
+        json.dump(dados, f, ensure_ascii=False)
+
+
+def carregar_hierarquia(caminho: str):
+    """Carrega um índice salvo por ``salvar_hierarquia``."""
+    with open(caminho, "r", encoding="utf-8") as f:
+        dados = json.load(f)
+
+    acima = [
+        {v: (float(peso), meio) for v, peso, meio in arestas}
+        for arestas in dados["acima"]
+    ]
+    return HierarquiaContracao(dados["nomes"], dados["nivel"], acima)
+
+
+def _aresta(hierarquia: HierarquiaContracao, a: int, b: int):
+    """Retorna (peso, meio) da aresta a-b, guardada no extremo de menor nível."""
+    if hierarquia.nivel[a] < hierarquia.nivel[b]:
+        return hierarquia.acima[a][b]
+    return hierarquia.acima[b][a]
+
+
+def _desempacotar(hierarquia: HierarquiaContracao, a: int, b: int):
+    """Expande a aresta a-b em nós do grafo original (sem incluir a)."""
+    resultado = []
+    pilha = [(a, b)]
+    while pilha:
+        x, y = pilha.pop()
+        meio = _aresta(hierarquia, x, y)[1]
+        if meio < 0:
+            resultado.append(y)
+        else:
+            pilha.append((meio, y))
+            pilha.append((x, meio))
+    return resultado
+
+
+def dijkstra_ch(hierarquia: HierarquiaContracao, origem: str, destino: str):
+    """Caminho mínimo pelo índice de contraction hierarchies, no contrato de ``dijkstra``.
+
+    O custo é sempre o de ``dijkstra``; entre caminhos empatados, o devolvido
+    depende dos atalhos do índice e pode ser outro.
+    """
+    s = hierarquia.indice.get(origem)
+    t = hierarquia.indice.get(destino)
+    if s is None or t is None:
+        return inf, []
+    if s == t:
+        return 0.0, [origem]
+
+    buscas = (({s: 0.0}, {s: -1}, [(0.0, s)]), ({t: 0.0}, {t: -1}, [(0.0, t)]))
+    melhor = inf
+    encontro = -1
+
+    while True:
+        ativos = [lado for lado in (0, 1) if buscas[lado][2] and buscas[lado][2][0][0] < melhor]
+        if not ativos:
+            break
+        lado = min(ativos, key=lambda i: buscas[i][2][0][0])
+        dist, anterior, fila = buscas[lado]
+        dist_outro = buscas[1 - lado][0]
+
+        d, u = heapq.heappop(fila)
+        if d > dist[u]:
+            continue
+        if u in dist_outro and d + dist_outro[u] < melhor:
+            melhor = d + dist_outro[u]
+            encontro = u
+        for v, (peso, _meio) in hierarquia.acima[u].items():
+            novo_custo = d + peso
+            if novo_custo < dist.get(v, inf):
+                dist[v] = novo_custo
+                anterior[v] = u
+                heapq.heappush(fila, (novo_custo, v))
+
+    if encontro < 0:
+        return inf, []
+
+    subida = [encontro]
+    while buscas[0][1][subida[-1]] >= 0:
+        subida.append(buscas[0][1][subida[-1]])
+    subida.reverse()
+
+    caminho = [s]
+    for a, b in zip(subida, subida[1:]):
+        caminho.extend(_desempacotar(hierarquia, a, b))
+
+    v = encontro
+    anterior_volta = buscas[1][1]
+    while anterior_volta[v] >= 0:
+        caminho.extend(_desempacotar(hierarquia, v, anterior_volta[v]))
+        v = anterior_volta[v]
+
+    return melhor, [hierarquia.nomes[i] for i in caminho]
@@ -0,0 +1,546 @@
+import heapq
+from array import array
+from collections import deque
+from math import inf
+from .graph import Graph
+
+
+class GrafoCSR:
+    """Representação imutável do grafo em formato CSR (compressed sparse row).
+
+    Os nós reutilizam os ids inteiros da tabela de símbolos do Graph. Os vizinhos do
+    nó ``i`` ocupam ``alvos[offsets[i]:offsets[i + 1]]`` e os pesos correspondentes
+    ficam na mesma faixa de ``pesos``. O dicionário ``derivados`` guarda estruturas
+    calculadas sob demanda a partir desses arrays (por exemplo, pesos inteiros).
+    ``peso_minimo``/``peso_maximo`` vêm das estatísticas do Graph (None se desconhecidos).
+    """
+
+    __slots__ = (
+        "nomes", "indice", "offsets", "alvos", "pesos", "tem_peso_negativo", "versao",
+        "peso_minimo", "peso_maximo", "derivados"
+    )
+
+    def __init__(self, nomes, indice, offsets, alvos, pesos, tem_peso_negativo=None, versao=None,
+                 peso_minimo=None, peso_maximo=None):
+        """Cria o CSR a partir de arrays já montados (use ``de_grafo``)."""
+        if tem_peso_negativo is None:
+            tem_peso_negativo = any(p < 0 for p in pesos)
+        object.__setattr__(self, "nomes", nomes)
+        object.__setattr__(self, "indice", indice)
+        object.__setattr__(self, "offsets", offsets)
+        object.__setattr__(self, "alvos", alvos)
+        object.__setattr__(self, "pesos", pesos)
+        object.__setattr__(self, "tem_peso_negativo", tem_peso_negativo)
+        object.__setattr__(self, "versao", versao)
+        object.__setattr__(self, "peso_minimo", peso_minimo)
+        object.__setattr__(self, "peso_maximo", peso_maximo)
+        object.__setattr__(self, "derivados", {})
+
+    def __setattr__(self, nome, valor):
+        raise AttributeError("GrafoCSR é imutável.")
+
+    def __reduce__(self):
+        """Serializa apenas os arrays, para envio a processos trabalhadores."""
+        return (
+            GrafoCSR,
+            (self.nomes, self.indice, self.offsets, self.alvos, self.pesos,
+             self.tem_peso_negativo, self.versao, self.peso_minimo, self.peso_maximo),
+        )
+
+    @classmethod
+    def de_grafo(cls, grafo: Graph):
+        """Constrói o CSR a partir de um Graph em uma única passada."""
+        nomes = list(grafo.nomes)
+        indice = dict(grafo.ids)
+
+        offsets = array("q", [0])
+        alvos = array("i")
+        pesos = array("d")
+
+        for no in nomes:
+            for vizinho, peso in grafo.adjacencia[no]:
+                alvos.append(indice[vizinho])
+                pesos.append(float(peso))
+            offsets.append(len(alvos))
+
+        return cls(
+            nomes, indice, offsets, alvos, pesos, grafo.tem_peso_negativo, grafo.versao,
+            grafo.peso_minimo, grafo.peso_maximo,
+        )
+
+    def obter_nos(self):
+        """Retorna a lista de todos os nós do grafo."""
+        return list(self.nomes)
+
+    def ordem(self):
+        """Retorna o número de nós do grafo."""
+        return len(self.nomes)
+
+    def tamanho(self):
+        """Retorna o número de arestas do grafo."""
+        return len(self.alvos) // 2
+
+    def grau(self, no):
+        """Retorna o grau de um nó."""
+        i = self.indice.get(no)
+        if i is None:
+            return 0
+        return self.offsets[i + 1] - self.offsets[i]
+
+    def vizinhos(self, no):
+        """Retorna os vizinhos de um nó como lista de tuplas (vizinho, peso)."""
+        i = self.indice.get(no)
+        if i is None:
+            return []
+        inicio, fim = self.offsets[i], self.offsets[i + 1]
+        return [(self.nomes[self.alvos[k]], self.pesos[k]) for k in range(inicio, fim)]
+
+    def id_de(self, no):
+        """Retorna o id inteiro denso de um nó, ou None se ele não existir."""
+        return self.indice.get(no)
+
+    def nome_de(self, id_no):
+        """Retorna o nó correspondente a um id inteiro."""
+        return self.nomes[id_no]
+
+    def memoria_bytes(self):
+        """Retorna o espaço ocupado pelos arrays de offsets, alvos e pesos."""
+        return sum(a.itemsize * len(a) for a in (self.offsets, self.alvos, self.pesos))
+
+
+def obter_csr(grafo: Graph):
+    """Retorna um GrafoCSR do grafo, reaproveitando o snapshot enquanto a versão não mudar."""
+    if isinstance(grafo, GrafoCSR):
+        return grafo
+
+    snapshot = getattr(grafo, "_snapshot_csr", None)
+    if snapshot is None or snapshot.versao != grafo.versao:
+        snapshot = GrafoCSR.de_grafo(grafo)
+        grafo._snapshot_csr = snapshot
+    return snapshot
+
+
+def postos_por_nome(csr: GrafoCSR):
+    """Retorna (posto, por_posto): a posição de cada id na ordem dos nomes e a inversa.
+
+    Permite desempatar distâncias iguais na mesma ordem de ``dijkstra`` comparando
+    apenas inteiros.
+    """
+    if "postos" not in csr.derivados:
+        n = csr.ordem()
+        try:
+            por_posto = sorted(range(n), key=csr.nomes.__getitem__)
+        except TypeError:
+            por_posto = list(range(n))
+        posto = [0] * n
+        for r, i in enumerate(por_posto):
+            posto[i] = r
+        csr.derivados["postos"] = (posto, por_posto)
+    return csr.derivados["postos"]
+
+
+def _indice_origem(csr: GrafoCSR, origem):
+    """Retorna o id da origem ou lança ValueError se ela não existir."""
+    s = csr.indice.get(origem)
+    if s is None:
+        raise ValueError(f"Nó de origem '{origem}' não existe no grafo.")
+    return s
+
+
+def caminho_ids(anterior, s: int, t: int):
+    """Reconstrói a lista de ids de s até t a partir do vetor de predecessores."""
+    caminho = [t]
+    while t != s:
+        t = anterior[t]
+        caminho.append(t)
+    caminho.reverse()
+    return caminho
+
+
+def _arvore_para_nomes(csr: GrafoCSR, ordem_visita, pai, valor):
+    """Traduz vetores de pai/valor indexados por id para dicionários por nome."""
+    nomes = csr.nomes
+    pai_nomes = {nomes[v]: (nomes[pai[v]] if pai[v] >= 0 else None) for v in ordem_visita}
+    valor_nomes = {nomes[v]: valor[v] for v in ordem_visita}
+    return pai_nomes, valor_nomes
+
+
+def bfs_ids(csr: GrafoCSR, s: int):
+    """BFS sobre ids; retorna (pai, nivel, ordem_visita) com -1 para não alcançados."""
+    offsets, alvos = csr.offsets, csr.alvos
+
+    nivel = [-1] * csr.ordem()
+    pai = [-1] * csr.ordem()
+    nivel[s] = 0
+    ordem_visita = [s]
+    fila = deque([s])
+
+    while fila:
+        u = fila.popleft()
+        proximo = nivel[u] + 1
+        for k in range(offsets[u], offsets[u + 1]):
+            v = alvos[k]
+            if nivel[v] < 0:
+                nivel[v] = proximo
+                pai[v] = u
+                ordem_visita.append(v)
+                fila.append(v)
+
+    return pai, nivel, ordem_visita
+
+
+def bfs_caminho_ids(csr: GrafoCSR, s: int, t: int):
+    """BFS de s até t, parando ao descobrir t; retorna a lista de ids do caminho ou []."""
+    if s == t:
+        return [s]
+
+    offsets, alvos = csr.offsets, csr.alvos
+    pai = [-1] * csr.ordem()
+    visitado = [False] * csr.ordem()
+    visitado[s] = True
+    fila = deque([s])
+
+    while fila:
+        u = fila.popleft()
+        for k in range(offsets[u], offsets[u + 1]):
+            v = alvos[k]
+            if not visitado[v]:
+                visitado[v] = True
+                pai[v] = u
+                if v == t:
+                    return caminho_ids(pai, s, t)
+                fila.append(v)
+
+    return []
+
+
+def dfs_ids(csr: GrafoCSR, s: int):
+    """DFS sobre ids; retorna (pai, descoberta, ordem_visita) com -1 para não alcançados."""
+    offsets, alvos = csr.offsets, csr.alvos
+
+    descoberta = [-1] * csr.ordem()
+    pai = [-1] * csr.ordem()
+    descoberta[s] = 0
+    ordem_visita = [s]
+    contador = 1
+    pilha = [s]
+
+    while pilha:
+        u = pilha.pop()
+        for k in range(offsets[u + 1] - 1, offsets[u] - 1, -1):
+            v = alvos[k]
+            if descoberta[v] < 0:
+                descoberta[v] = contador
+                contador += 1
+                pai[v] = u
+                ordem_visita.append(v)
+                pilha.append(v)
+
+    return pai, descoberta, ordem_visita
+
+
+def dfs_caminho_ids(csr: GrafoCSR, s: int, t: int):
+    """DFS iterativa de s até t; retorna a lista de ids do caminho ou [] se não houver.
+
+    Segue a mesma ordem de vizinhos da versão recursiva, então o caminho é o mesmo.
+    """
+    offsets, alvos = csr.offsets, csr.alvos
+    proximo = array("q", offsets)
+    visitado = [False] * csr.ordem()
+    visitado[s] = True
+    pilha = [s]
+
+    while pilha:
+        if pilha[-1] == t:
+            return pilha
+        u = pilha[-1]
+        k = proximo[u]
+        if k == offsets[u + 1]:
+            pilha.pop()
+            continue
+        proximo[u] = k + 1
+        v = alvos[k]
+        if not visitado[v]:
+            visitado[v] = True
+            pilha.append(v)
+
+    return []
+
+
+def dfs_tem_ciclo_ids(csr: GrafoCSR):
+    """DFS iterativa em todos os componentes; True ao achar aresta que não volta ao pai."""
+    offsets, alvos = csr.offsets, csr.alvos
+    n = csr.ordem()
+    proximo = array("q", offsets)
+    pai = [-1] * n
+    visitado = [False] * n
+
+    for r in range(n):
+        if visitado[r]:
+            continue
+        visitado[r] = True
+        pilha = [r]
+        while pilha:
+            u = pilha[-1]
+            k = proximo[u]
+            if k == offsets[u + 1]:
+                pilha.pop()
+                continue
+            proximo[u] = k + 1
+            v = alvos[k]
+            if v == pai[u]:
+                continue
+            if visitado[v]:
+                return True
+            visitado[v] = True
+            pai[v] = u
+            pilha.append(v)
+
+    return False
+
+
+ARVORE, RETORNO, CRUZAMENTO = 0, 1, 2
+
+
+def dfs_tempos_ids(csr: GrafoCSR, classificar: bool = False):
+    """DFS iterativa em todos os componentes; retorna (pai, pre, pos, arestas).
+
+    Usa uma pilha de nós com o próximo índice de vizinho de cada um, sem recursão.
+    ``pre`` e ``pos`` são os tempos de descoberta e finalização em um único relógio.
+    As arestas que voltam ao pai são ignoradas. Se ``classificar`` for True, ``arestas``
+    lista ``(u, v, tipo)`` na ordem em que foram examinadas, com tipo ``ARVORE``,
+    ``RETORNO`` ou ``CRUZAMENTO``; caso contrário é None.
+    """
+    offsets, alvos = csr.offsets, csr.alvos
+    n = csr.ordem()
+    proximo = array("q", offsets)
+    pai = [-1] * n
+    pre = [-1] * n
+    pos = [-1] * n
+    arestas = [] if classificar else None
+    relogio = 0
+
+    for r in range(n):
+        if pre[r] >= 0:
+            continue
+        pre[r] = relogio
+        relogio += 1
+        pilha = [r]
+        while pilha:
+            u = pilha[-1]
+            k = proximo[u]
+            if k == offsets[u + 1]:
+                pos[u] = relogio
+                relogio += 1
+                pilha.pop()
+                continue
+            proximo[u] = k + 1
+            v = alvos[k]
+            if v == pai[u]:
+                continue
+            if pre[v] < 0:
+                if classificar:
+                    arestas.append((u, v, ARVORE))
+                pai[v] = u
+                pre[v] = relogio
+                relogio += 1
+                pilha.append(v)
+            elif classificar:
+                arestas.append((u, v, RETORNO if pos[v] < 0 else CRUZAMENTO))
+
+    return pai, pre, pos, arestas
+
+
+def dijkstra_ids(csr: GrafoCSR, s: int, t: int = -1, estatisticas: dict = None):
+    """Dijkstra sobre ids; retorna (dist, anterior), parando cedo ao fixar t.
+
+    Se ``estatisticas`` for informado, recebe o número de nós fixados.
+    """
+    if csr.tem_peso_negativo:
+        raise ValueError("Dijkstra não aceita pesos negativos.")
+
+    offsets, alvos, pesos = csr.offsets, csr.alvos, csr.pesos
+    posto, por_posto = postos_por_nome(csr)
+    dist = [inf] * csr.ordem()
+    anterior = [-1] * csr.ordem()
+    dist[s] = 0.0
+    fila = [(0.0, posto[s])]
+    fixados = 0
+
+    while fila:
+        dist_atual, r = heapq.heappop(fila)
+        u = por_posto[r]
+        if dist_atual > dist[u]:
+            continue
+        fixados += 1
+        if u == t:
+            break
+        for k in range(offsets[u], offsets[u + 1]):
+            v = alvos[k]
+            novo_custo = dist_atual + pesos[k]
+            if novo_custo < dist[v]:
+                dist[v] = novo_custo
+                anterior[v] = u
+                heapq.heappush(fila, (novo_custo, posto[v]))
+
+    if estatisticas is not None:
+        estatisticas["nos_fixados"] = fixados
+    return dist, anterior
+
+
+def bellman_ford_ids(csr: GrafoCSR, s: int, estatisticas: dict = None):
+    """Bellman-Ford sobre ids; retorna (dist, anterior, tem_ciclo_negativo).
+
+    Se ``estatisticas`` for informado, recebe o número de arestas examinadas.
+    """
+    offsets, alvos, pesos = csr.offsets, csr.alvos, csr.pesos
+    n = csr.ordem()
+
+    dist = [inf] * n
+    anterior = [-1] * n
+    dist[s] = 0.0
+    relaxacoes = 0
+
+    for _ in range(n - 1):
+        houve_mudanca = False
+        for u in range(n):
+            if dist[u] == inf:
+                continue
+            relaxacoes += offsets[u + 1] - offsets[u]
+            for k in range(offsets[u], offsets[u + 1]):
+                v = alvos[k]
+                if dist[u] + pesos[k] < dist[v]:
+                    dist[v] = dist[u] + pesos[k]
+                    anterior[v] = u
+                    houve_mudanca = True
+        if not houve_mudanca:
+            break
+
+    if estatisticas is not None:
+        estatisticas["relaxacoes"] = relaxacoes
+
+    tem_ciclo_negativo = False
+    if not csr.tem_peso_negativo:
+        return dist, anterior, tem_ciclo_negativo
+
+    for u in range(n):
+        du = dist[u]
+        if du == inf:
+            continue
+        for k in range(offsets[u], offsets[u + 1]):
+            if du + pesos[k] < dist[alvos[k]]:
+                tem_ciclo_negativo = True
+                break
+        if tem_ciclo_negativo:
+            break
+
+    return dist, anterior, tem_ciclo_negativo
+
+
+def _ciclo_em_anterior(anterior, v: int):
+    """Procura um ciclo subindo os predecessores a partir de v; retorna [] se não houver.
+
+    O ciclo é devolvido no sentido das arestas e fechado (primeiro id igual ao último).
+    """
+    posicao = {}
+    subida = []
+    while v >= 0 and v not in posicao:
+        posicao[v] = len(subida)
+        subida.append(v)
+        v = anterior[v]
+    if v < 0:
+        return []
+
+    ciclo = subida[posicao[v]:]
+    ciclo.reverse()
+    ciclo.append(ciclo[0])
+    return ciclo
+
+
+def spfa_ids(csr: GrafoCSR, s: int, estatisticas: dict = None):
+    """Bellman-Ford com fila (SPFA) sobre ids; retorna (dist, anterior, ciclo).
+
+    Só relaxa as arestas de nós cuja distância mudou. Um nó alcançado por um caminho
+    relaxado com ``n`` ou mais arestas indica ciclo negativo; nesse caso a busca para
+    e ``ciclo`` traz os ids do ciclo encontrado nos predecessores (vazio se não houver).
+    Se ``estatisticas`` for informado, recebe o número de arestas examinadas.
+    """
+    offsets, alvos, pesos = csr.offsets, csr.alvos, csr.pesos
+    n = csr.ordem()
+
+    dist = [inf] * n
+    anterior = [-1] * n
+    arestas = [0] * n
+    na_fila = [False] * n
+    dist[s] = 0.0
+    na_fila[s] = True
+    fila = deque([s])
+    relaxacoes = 0
+    ciclo = []
+
+    while fila and not ciclo:
+        u = fila.popleft()
+        na_fila[u] = False
+        du = dist[u]
+        relaxacoes += offsets[u + 1] - offsets[u]
+        for k in range(offsets[u], offsets[u + 1]):
+            v = alvos[k]
+            novo_custo = du + pesos[k]
+            if novo_custo < dist[v]:
+                dist[v] = novo_custo
+                anterior[v] = u
+                arestas[v] = arestas[u] + 1
+                if arestas[v] >= n:
+                    ciclo = _ciclo_em_anterior(anterior, v)
+                    if ciclo:
+                        break
+                if not na_fila[v]:
+                    na_fila[v] = True
+                    fila.append(v)
+
+    if estatisticas is not None:
+        estatisticas["relaxacoes"] = relaxacoes
+    return dist, anterior, ciclo
+
+
+def bfs_arvore_csr(csr: GrafoCSR, origem):
+    """Constrói a árvore BFS a partir da origem sobre o CSR."""
+    pai, nivel, ordem_visita = bfs_ids(csr, _indice_origem(csr, origem))
+    return _arvore_para_nomes(csr, ordem_visita, pai, nivel)
+
+
+def dfs_arvore_csr(csr: GrafoCSR, origem):
+    """Constrói a árvore DFS a partir da origem sobre o CSR."""
+    pai, descoberta, ordem_visita = dfs_ids(csr, _indice_origem(csr, origem))
+    return _arvore_para_nomes(csr, ordem_visita, pai, descoberta)
+
+
+def dijkstra_csr(csr: GrafoCSR, origem, destino):
+    """Encontra o caminho mínimo entre origem e destino usando Dijkstra sobre o CSR."""
+    s = csr.indice.get(origem)
+    t = csr.indice.get(destino)
+    if s is None or t is None:
+        return inf, []
+
+    dist, anterior = dijkstra_ids(csr, s, t)
+    if dist[t] == inf:
+        return inf, []
+
+    nomes = csr.nomes
+    return dist[t], [nomes[i] for i in caminho_ids(anterior, s, t)]
+
+
+def bellman_ford_csr(csr: GrafoCSR, origem, estatisticas: dict = None):
+    """Executa Bellman-Ford (SPFA) sobre o CSR, mantendo o contrato de ``bellman_ford``.
+
+    Se ``estatisticas`` for informado, recebe as relaxações e o ciclo negativo
+    encontrado (lista de nomes, vazia se não houver).
+    """
+    dist, anterior, ciclo = spfa_ids(csr, _indice_origem(csr, origem), estatisticas)
+
+    nomes = csr.nomes
+    if estatisticas is not None:
+        estatisticas["ciclo_negativo"] = [nomes[i] for i in ciclo]
+    dist_nomes = {nomes[i]: d for i, d in enumerate(dist)}
+    anterior_nomes = {nomes[i]: (nomes[a] if a >= 0 else None) for i, a in enumerate(anterior)}
+    return dist_nomes, anterior_nomes, bool(ciclo)
@@ -2,22 +2,50 @@ class Graph:
     def __init__(self):
         """Cria um grafo vazio."""
         self.adjacencia = {}
+        self.ids = {}
+        self.nomes = []
+        self.versao = 0
+        self.peso_minimo = None
+        self.peso_maximo = None
+        self.tem_peso_negativo = False
 
     def adicionar_no(self, bairro):
         """Adiciona um nó ao grafo."""
         if bairro not in self.adjacencia:
             self.adjacencia[bairro] = []
+            self.ids[bairro] = len(self.nomes)
+            self.nomes.append(bairro)
+            self.versao += 1
 
     def obter_nos(self):
         """Retorna a lista de todos os nós do grafo."""
         return list(self.adjacencia.keys())
 
+    def id_de(self, bairro):
+        """Retorna o id inteiro denso de um nó, ou None se ele não existir."""
+        return self.ids.get(bairro)
+
+    def nome_de(self, id_no):
+        """Retorna o nó correspondente a um id inteiro."""
+        return self.nomes[id_no]
+
     def adicionar_aresta(self, bairro1, bairro2, peso=1.0):
         """Adiciona uma aresta não-direcionada entre dois nós."""
         self.adicionar_no(bairro1)
         self.adicionar_no(bairro2)
         self.adjacencia[bairro1].append((bairro2, peso))
         self.adjacencia[bairro2].append((bairro1, peso))
+        self._atualizar_estatisticas_pesos(peso)
+
+    def _atualizar_estatisticas_pesos(self, peso):
+        """Atualiza em O(1) os pesos mínimo/máximo, a flag de peso negativo e a versão."""
+        peso = float(peso)
+        if self.peso_minimo is None or peso < self.peso_minimo:
+            self.peso_minimo = peso
+        if self.peso_maximo is None or peso > self.peso_maximo:
+            self.peso_maximo = peso
+        self.tem_peso_negativo = self.peso_minimo < 0
+        self.versao += 1
 
     def vizinhos(self, bairro):
         """Retorna os vizinhos de um nó como lista de tuplas (vizinho, peso)."""
@@ -97,6 +97,26 @@ def carregar_grafo_recife(
     return grafo, bairro_para_microrregiao
 
 
+def carregar_logradouros(caminho_adjacencias: str) -> dict:
+    """Retorna dicionário mapeando o par de bairros (ordenado) para seus logradouros."""
+    df_adj = pd.read_csv(caminho_adjacencias)
+    df_adj.columns = df_adj.columns.str.strip()
+
+    logradouros = {}
+    for _, linha in df_adj.iterrows():
+        origem = normalizar_bairro(linha["bairro_origem"])
+        destino = normalizar_bairro(linha["bairro_destino"])
+        if not isinstance(origem, str) or not isinstance(destino, str):
+            continue
+
+        par = tuple(sorted((origem, destino)))
+        logradouro = normalizar_bairro(linha["logradouro"])
+        if isinstance(logradouro, str) and logradouro:
+            logradouros.setdefault(par, []).append(logradouro)
+
+    return logradouros
+
+
 def derreter_bairros(caminho_entrada: str, caminho_saida: str) -> None:
     """Derrete CSV de microrregiões em lista de bairros únicos."""
     df = pd.read_csv(caminho_entrada)
@@ -0,0 +1,56 @@
+import numpy as np
+from array import array
+from .graph import Graph
+from .csr import GrafoCSR, obter_csr, spfa_ids
+from .matrix import matriz_distancias
+from .bellman_ford_numpy import arrays_arestas
+
+
+def potenciais_johnson(csr: GrafoCSR):
+    """Calcula os potenciais h com um único Bellman-Ford a partir de uma origem virtual.
+
+    A origem virtual (id ``n``) tem arestas de peso 0 para todos os nós. Retorna
+    ``(h, ciclo)``, onde ``ciclo`` são os nomes de um ciclo negativo (vazio se não houver).
+    """
+    n = csr.ordem()
+    offsets = array("q", csr.offsets)
+    offsets.append(offsets[-1] + n)
+    alvos = array("i", csr.alvos)
+    alvos.extend(range(n))
+    pesos = array("d", csr.pesos)
+    pesos.extend([0.0] * n)
+
+    estendido = GrafoCSR(csr.nomes + [None], csr.indice, offsets, alvos, pesos, csr.tem_peso_negativo)
+    h, _anterior, ciclo = spfa_ids(estendido, n)
+    return h[:n], [csr.nomes[i] for i in ciclo]
+
+
+def reponderar(csr: GrafoCSR, h):
+    """Retorna o CSR com pesos w(u, v) + h[u] - h[v], todos não-negativos."""
+    u, v, w = arrays_arestas(csr)
+    h = np.asarray(h)
+    pesos = array("d")
+    pesos.frombytes(np.maximum(0.0, w + h[u] - h[v]).tobytes())
+    return GrafoCSR(csr.nomes, csr.indice, csr.offsets, csr.alvos, pesos, False)
+
+
+def johnson(grafo: Graph, workers: int = 1):
+    """Calcula distâncias mínimas de todos os pares aceitando pesos negativos.
+
+    Repondera com um único Bellman-Ford e roda a busca não-negativa de
+    ``matriz_distancias`` a partir de cada nó (em paralelo com ``workers > 1``).
+    Retorna ``(dist, pred)`` n x n indexados pelos ids do grafo e lança ValueError
+    se houver ciclo negativo.
+    """
+    csr = obter_csr(grafo)
+    if not csr.tem_peso_negativo:
+        return matriz_distancias(csr, csr.nomes, workers=workers, predecessores=True)
+
+    h, ciclo = potenciais_johnson(csr)
+    if ciclo:
+        raise ValueError(f"Grafo possui ciclo negativo: {' -> '.join(map(str, ciclo))}.")
+
+    dist, pred = matriz_distancias(reponderar(csr, h), csr.nomes, workers=workers, predecessores=True)
+    h = np.asarray(h)
+    dist += h[None, :] - h[:, None]
+    return dist, pred
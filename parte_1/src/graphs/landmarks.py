@@ -0,0 +1,169 @@
+import heapq
+import numpy as np
+from math import inf
+from .graph import Graph
+from .csr import GrafoCSR, obter_csr, postos_por_nome, caminho_ids
+from .dial import dial_ids
+from .componentes import indice_componentes
+
+
+class MarcosALT:
+    """Distâncias pré-calculadas de k marcos (landmarks) para todos os nós do grafo."""
+
+    def __init__(self, nomes, marcos, distancias):
+        """Guarda os nomes dos nós, os ids dos marcos e a matriz k x n de distâncias."""
+        self.nomes = list(nomes)
+        self.marcos = [int(m) for m in marcos]
+        self.distancias = np.asarray(distancias, dtype=np.float64)
+        self.tabelas = [linha.tolist() for linha in self.distancias]
+
+    def nomes_marcos(self):
+        """Retorna os nomes dos nós escolhidos como marcos."""
+        return [self.nomes[m] for m in self.marcos]
+
+    def limite_inferior(self, v: int, t: int):
+        """Limite inferior de d(v, t) pela desigualdade triangular sobre os marcos."""
+        melhor = 0.0
+        for tabela in self.tabelas:
+            dv, dt = tabela[v], tabela[t]
+            if dv == inf or dt == inf:
+                if dv != dt:
+                    return inf
+                continue
+            diferenca = dt - dv if dt > dv else dv - dt
+            if diferenca > melhor:
+                melhor = diferenca
+        return melhor
+
+
+def selecionar_marcos(grafo: Graph, k: int = 8, estrategia: str = "distante"):
+    """Escolhe k marcos e calcula suas distâncias para todos os nós.
+
+    ``estrategia="grau"`` usa os k nós de maior grau; ``"distante"`` começa pelo
+    nó de maior grau e adiciona, a cada passo, o nó alcançável mais distante dos
+    marcos já escolhidos (farthest-point).
+    """
+    if estrategia not in ("distante", "grau"):
+        raise ValueError("Estratégia de marcos deve ser 'distante' ou 'grau'.")
+
+    csr = obter_csr(grafo)
+    n = csr.ordem()
+    k = min(k, n)
+    graus = [csr.offsets[i + 1] - csr.offsets[i] for i in range(n)]
+    por_grau = sorted(range(n), key=lambda i: -graus[i])
+
+    if estrategia == "grau":
+        marcos = por_grau[:k]
+        distancias = [dial_ids(csr, m)[0] for m in marcos]
+        return MarcosALT(csr.nomes, marcos, distancias)
+
+    marcos, distancias = [], []
+    menor = [inf] * n
+    proximo = por_grau[0] if n else None
+
+    while proximo is not None and len(marcos) < k:
+        marcos.append(proximo)
+        dist, _ = dial_ids(csr, proximo)
+        distancias.append(dist)
+
+        proximo, maior = None, -1.0
+        for v in range(n):
+            if dist[v] < menor[v]:
+                menor[v] = dist[v]
+            if menor[v] != inf and menor[v] > maior and v not in marcos:
+                proximo, maior = v, menor[v]
+        if maior <= 0:
+            proximo = None
+
+    return MarcosALT(csr.nomes, marcos, distancias)
+
+
+def salvar_marcos(marcos: MarcosALT, caminho: str):
+    """Salva os marcos e suas distâncias em um arquivo .npz."""
+    np.savez(
+        caminho,
+        nomes=np.array(marcos.nomes, dtype=str),
+        marcos=np.array(marcos.marcos, dtype=np.int64),
+        distancias=marcos.distancias,
+    )
+
+
+def carregar_marcos(caminho: str, grafo: Graph = None):
+    """Carrega marcos de um .npz, verificando se correspondem ao grafo informado."""
+    with np.load(caminho) as dados:
+        marcos = MarcosALT(dados["nomes"].tolist(), dados["marcos"], dados["distancias"])
+
+    if grafo is not None and obter_csr(grafo).nomes != marcos.nomes:
+        raise ValueError(f"Os marcos em '{caminho}' não correspondem aos nós do grafo.")
+    return marcos
+
+
+def a_estrela_ids(csr: GrafoCSR, marcos: MarcosALT, s: int, t: int, estatisticas: dict = None):
+    """A* guiado pelos limites inferiores dos marcos; retorna (dist, anterior) por id."""
+    if csr.tem_peso_negativo:
+        raise ValueError("A* não aceita pesos negativos.")
+    if len(marcos.nomes) != csr.ordem():
+        raise ValueError("Os marcos não correspondem aos nós do grafo.")
+
+    offsets, alvos, pesos = csr.offsets, csr.alvos, csr.pesos
+    posto, por_posto = postos_por_nome(csr)
+    n = csr.ordem()
+    limite = marcos.limite_inferior
+
+    dist = [inf] * n
+    anterior = [-1] * n
+    potencial = [-1.0] * n
+    fixado = [False] * n
+    dist[s] = 0.0
+    potencial[s] = limite(s, t)
+    fila = [(potencial[s], posto[s])]
+    expandidos = 0
+
+    while fila:
+        _f, r = heapq.heappop(fila)
+        u = por_posto[r]
+        if fixado[u]:
+            continue
+        fixado[u] = True
+        expandidos += 1
+        if u == t:
+            break
+        for k in range(offsets[u], offsets[u + 1]):
+            v = alvos[k]
+            novo_custo = dist[u] + pesos[k]
+            if novo_custo < dist[v]:
+                if potencial[v] < 0:
+                    potencial[v] = limite(v, t)
+                if potencial[v] == inf:
+                    continue
+                dist[v] = novo_custo
+                anterior[v] = u
+                heapq.heappush(fila, (novo_custo + potencial[v], posto[v]))
+
+    if estatisticas is not None:
+        estatisticas["nos_expandidos"] = expandidos
+    return dist, anterior
+
+
+def a_estrela_alt(grafo: Graph, origem: str, destino: str, marcos: MarcosALT,
+                  estatisticas: dict = None):
+    """Caminho mínimo com A* e marcos (ALT), no contrato de ``dijkstra``.
+
+    O custo é sempre o de ``dijkstra``; entre caminhos empatados, o devolvido
+    pode ser outro, pois a ordem de fixação segue a estimativa dos marcos.
+    """
+    csr = obter_csr(grafo)
+    s = csr.id_de(origem)
+    t = csr.id_de(destino)
+    if s is None or t is None:
+        return inf, []
+    if not indice_componentes(csr).mesma_componente(origem, destino):
+        if estatisticas is not None:
+            estatisticas["nos_expandidos"] = 0
+        return inf, []
+
+    dist, anterior = a_estrela_ids(csr, marcos, s, t, estatisticas)
+    if dist[t] == inf:
+        return inf, []
+
+    return dist[t], [csr.nome_de(i) for i in caminho_ids(anterior, s, t)]
@@ -0,0 +1,94 @@
+from .graph import Graph
+from .csr import GrafoCSR, obter_csr
+from .centralidade import adjacencia_simples
+
+
+class Triangulos:
+    """Triângulos por nó e as métricas de ego-subrede e agrupamento derivadas deles.
+
+    Tudo é calculado sobre o grafo simples (sem laços nem arestas paralelas): a
+    ego-subrede de v tem ``grau[v] + 1`` nós e ``grau[v] + triangulos[v]`` arestas.
+    """
+
+    def __init__(self, nomes, grau, triangulos):
+        """Guarda, por id, o grau simples e o número de triângulos de cada nó."""
+        self.nomes = nomes
+        self.grau = grau
+        self.triangulos = triangulos
+
+    def total(self):
+        """Retorna o número de triângulos do grafo."""
+        return sum(self.triangulos) // 3
+
+    def agrupamento(self, i: int):
+        """Coeficiente de agrupamento local do id i (0 se grau < 2)."""
+        d = self.grau[i]
+        return 2 * self.triangulos[i] / (d * (d - 1)) if d > 1 else 0.0
+
+    def transitividade(self):
+        """Coeficiente de agrupamento global: 3 * triângulos / triplas conectadas."""
+        triplas = sum(d * (d - 1) // 2 for d in self.grau)
+        return 3 * self.total() / triplas if triplas else 0.0
+
+    def ego(self, i: int):
+        """Retorna (ordem, tamanho, densidade) da ego-subrede do id i."""
+        ordem = self.grau[i] + 1
+        tamanho = self.grau[i] + self.triangulos[i]
+        densidade = 2 * tamanho / (ordem * (ordem - 1)) if ordem > 1 else 0.0
+        return ordem, tamanho, densidade
+
+    def por_no(self):
+        """Retorna, para cada nó, triângulos, agrupamento local e métricas da ego-subrede."""
+        resultado = {}
+        for i, no in enumerate(self.nomes):
+            ordem, tamanho, densidade = self.ego(i)
+            resultado[no] = {
+                "triangulos": self.triangulos[i],
+                "agrupamento": self.agrupamento(i),
+                "ordem_ego": ordem,
+                "tamanho_ego": tamanho,
+                "densidade_ego": densidade,
+            }
+        return resultado
+
+
+def triangulos_ids(offsets, alvos, n: int):
+    """Conta os triângulos de cada id em O(E * sqrt(E)) pelo algoritmo forward.
+
+    Cada aresta é orientada do nó de menor (grau, id) para o de maior, então cada
+    nó guarda no máximo O(sqrt(E)) vizinhos à frente. Cada triângulo aparece uma
+    única vez, na interseção das listas à frente das pontas da sua aresta mais baixa.
+    """
+    grau = [offsets[v + 1] - offsets[v] for v in range(n)]
+    posto = [0] * n
+    for p, v in enumerate(sorted(range(n), key=lambda v: (grau[v], v))):
+        posto[v] = p
+
+    frente = [
+        {u for u in alvos[offsets[v]:offsets[v + 1]] if posto[u] > posto[v]}
+        for v in range(n)
+    ]
+
+    triangulos = [0] * n
+    for v in range(n):
+        frente_v = frente[v]
+        for u in frente_v:
+            for w in frente_v & frente[u]:
+                triangulos[v] += 1
+                triangulos[u] += 1
+                triangulos[w] += 1
+    return grau, triangulos
+
+
+def triangulos_csr(csr: GrafoCSR):
+    """Retorna os triângulos do snapshot CSR, calculados uma única vez."""
+    if "triangulos" not in csr.derivados:
+        offsets, alvos, _pesos = adjacencia_simples(csr)
+        grau, triangulos = triangulos_ids(offsets, alvos, csr.ordem())
+        csr.derivados["triangulos"] = Triangulos(csr.nomes, grau, triangulos)
+    return csr.derivados["triangulos"]
+
+
+def contar_triangulos(grafo: Graph):
+    """Conta os triângulos do grafo e deriva agrupamento e ego-subredes de cada nó."""
+    return triangulos_csr(obter_csr(grafo))
@@ -1,9 +1,17 @@
 import os
 import json
 import pandas as pd
-from .graphs.io import carregar_grafo_recife, tratar_setubal 
+from .graphs.io import carregar_grafo_recife, carregar_logradouros, tratar_setubal 
 from .graphs.graph import Graph
-from .graphs.algorithms import dijkstra
+from .graphs.apsp import carregar_ou_calcular_tabela, dijkstra_tabela
+from .graphs.contraction import construir_hierarquia, salvar_hierarquia
+from .graphs.biconexas import biconexidade
+from .graphs.centralidade import intermediacao, proximidade_e_harmonica
+from .graphs.triangulos import contar_triangulos
+from .graphs.excentricidade import excentricidades
+from .graphs.comunidades import louvain, propagacao_rotulos, modularidade, informacao_mutua_normalizada
+from .graphs.arvore_geradora import kruskal
+from .graphs.k_caminhos import k_caminhos_minimos
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DATA_DIR = os.path.join(BASE_DIR, "data")
@@ -11,15 +19,21 @@ OUT_DIR = os.path.join(BASE_DIR, "out")
 
 CAMINHO_BAIRROS_UNIQUE = os.path.join(DATA_DIR, "bairros_unique.csv")
 CAMINHO_ADJACENCIAS = os.path.join(DATA_DIR, "adjacencias_bairros.csv")
+CAMINHO_CACHE_APSP = os.path.join(OUT_DIR, "cache_apsp")
 
 os.makedirs(OUT_DIR, exist_ok=True)
 
 def calcular_metricas_globais(grafo: Graph) -> dict:
-    """Calcula ordem, tamanho e densidade do grafo completo."""
+    """Calcula ordem, tamanho, densidade, transitividade, diâmetro, raio e ordem da maior componente."""
+    distancias = excentricidades(grafo)
     return {
         "ordem": grafo.ordem(),
         "tamanho": grafo.tamanho(),
-        "densidade": grafo.densidade()
+        "densidade": grafo.densidade(),
+        "transitividade": contar_triangulos(grafo).transitividade(),
+        "diametro": distancias.diametro(),
+        "raio": distancias.raio(),
+        "ordem_maior_componente": len(distancias.inferior)
     }
 
 def calcular_metricas_microrregioes(grafo: Graph, bairro_para_micro: dict):
@@ -41,21 +55,21 @@ def calcular_metricas_microrregioes(grafo: Graph, bairro_para_micro: dict):
     return resultados
 
 def calcular_ego_por_bairro(grafo: Graph):
-    """Calcula métricas da ego-subrede para cada bairro."""
+    """Calcula métricas da ego-subrede para cada bairro a partir dos triângulos de cada nó."""
+    metricas = contar_triangulos(grafo).por_no()
     linhas = []
 
     for bairro in grafo.obter_nos():
-        vizinhos = [v for (v, _) in grafo.vizinhos(bairro)]
-        nos_ego = [bairro] + vizinhos
-
-        ego = grafo.subgrafo_induzido(nos_ego)
+        ego = metricas[bairro]
 
         linha = {
             "bairro": bairro,
             "grau": grafo.grau(bairro),
-            "ordem_ego": ego.ordem(),
-            "tamanho_ego": ego.tamanho(),
-            "densidade_ego": ego.densidade()
+            "ordem_ego": ego["ordem_ego"],
+            "tamanho_ego": ego["tamanho_ego"],
+            "densidade_ego": ego["densidade_ego"],
+            "triangulos": ego["triangulos"],
+            "agrupamento": ego["agrupamento"]
         }
         linhas.append(linha)
 
@@ -81,14 +95,22 @@ def passo_3():
     df_ego.to_csv(os.path.join(OUT_DIR, "ego_bairro.csv"), index=False)
 
 def passo_4():
-    """Gera rankings de graus e densidades ego."""
+    """Gera rankings de graus (com proximidade e centralidade harmônica) e densidades ego."""
     caminho_ego = os.path.join(OUT_DIR, "ego_bairro.csv")
     caminho_graus = os.path.join(OUT_DIR, "graus.csv")
     caminho_densidades = os.path.join(OUT_DIR, "densidades.csv")
 
     df = pd.read_csv(caminho_ego)
 
+    grafo, _ = carregar_grafo_recife(
+        CAMINHO_BAIRROS_UNIQUE,
+        CAMINHO_ADJACENCIAS
+    )
+    proximidade, harmonica = proximidade_e_harmonica(grafo)
+
     df_graus = df[["bairro", "grau"]].copy()
+    df_graus["proximidade"] = df_graus["bairro"].map(proximidade)
+    df_graus["harmonica"] = df_graus["bairro"].map(harmonica)
     df_graus = df_graus.sort_values(by="grau", ascending=False)
     df_graus.to_csv(caminho_graus, index=False)
 
@@ -96,8 +118,11 @@ def passo_4():
     df_den = df_den.sort_values(by="densidade_ego", ascending=False)
     df_den.to_csv(caminho_densidades, index=False)
 
-def passo_6():
-    """Calcula distâncias entre pares de bairros usando Dijkstra."""
+def passo_6(k_alternativas: int = 3):
+    """Calcula distâncias entre pares de bairros consultando a tabela de todos os pares em cache.
+
+    Também lista, para cada par, as ``k_alternativas`` melhores rotas sem ciclos (Yen).
+    """
     caminho_enderecos = os.path.join(DATA_DIR, "enderecos.csv")
     caminho_bairros_unique = os.path.join(DATA_DIR, "bairros_unique.csv")
     caminho_adjacencias = os.path.join(DATA_DIR, "adjacencias_bairros.csv")
@@ -114,6 +139,13 @@ def passo_6():
         caminho_adjacencias
     )
 
+    tabela = carregar_ou_calcular_tabela(
+        caminho_bairros_unique,
+        caminho_adjacencias,
+        CAMINHO_CACHE_APSP,
+        grafo=grafo
+    )
+
     df_end = pd.read_csv(caminho_enderecos)
 
     colunas_necessarias = {"bairro_X", "bairro_Y"}
@@ -122,9 +154,7 @@ def passo_6():
             "O arquivo enderecos.csv deve ter as colunas 'bairro_X' e 'bairro_Y'."
         )
 
-    linhas_saida = []
-    info_nd_setubal = None
-
+    consultas = []
     for _, linha in df_end.iterrows():
         bairro_X_raw = linha["bairro_X"]
         bairro_Y_raw = linha["bairro_Y"]
@@ -132,10 +162,17 @@ def passo_6():
         rotulo_X, no_X = tratar_setubal(bairro_X_raw)
         rotulo_Y, no_Y = tratar_setubal(bairro_Y_raw)
 
+        consultas.append((rotulo_X, no_X, rotulo_Y, no_Y, bairro_Y_raw))
+
+    resultados = [dijkstra_tabela(tabela, no_X, no_Y) for _, no_X, _, no_Y, _ in consultas]
+
+    linhas_saida = []
+    info_nd_setubal = None
+
+    for (rotulo_X, no_X, rotulo_Y, _no_Y, bairro_Y_raw), (custo, caminho) in zip(consultas, resultados):
         X = rotulo_X
         Y = rotulo_Y
 
-        custo, caminho = dijkstra(grafo, no_X, no_Y)
         caminho_str = " > ".join(caminho) if caminho else ""
 
         linhas_saida.append({
@@ -158,17 +195,178 @@ def passo_6():
     df_saida = pd.DataFrame(linhas_saida)
     df_saida.to_csv(caminho_saida_csv, index=False)
 
+    linhas_alternativas = []
+    for rotulo_X, no_X, rotulo_Y, no_Y, _bairro_Y_raw in consultas:
+        for ordem, (custo, caminho) in enumerate(k_caminhos_minimos(grafo, no_X, no_Y, k_alternativas), start=1):
+            linhas_alternativas.append({
+                "bairro_X": rotulo_X,
+                "bairro_Y": rotulo_Y,
+                "ordem": ordem,
+                "custo": custo,
+                "caminho": " > ".join(caminho)
+            })
+    pd.DataFrame(linhas_alternativas).to_csv(os.path.join(OUT_DIR, "rotas_alternativas.csv"), index=False)
+
 
     if info_nd_setubal is not None:
         with open(caminho_saida_json_nd_setubal, "w", encoding="utf-8") as f:
             json.dump(info_nd_setubal, f, ensure_ascii=False, indent=2)
 
 
+def gerar_hierarquia_contracao():
+    """Constrói o índice de contraction hierarchies do grafo de bairros e salva em JSON."""
+    grafo, _ = carregar_grafo_recife(
+        CAMINHO_BAIRROS_UNIQUE,
+        CAMINHO_ADJACENCIAS
+    )
+
+    hierarquia = construir_hierarquia(grafo)
+    salvar_hierarquia(hierarquia, os.path.join(OUT_DIR, "hierarquia_contracao.json"))
+    return hierarquia
+
+
+def gerar_biconexidade():
+    """Gera pontos de articulação, pontes (com logradouros) e árvore bloco-corte dos bairros."""
+    grafo, _ = carregar_grafo_recife(
+        CAMINHO_BAIRROS_UNIQUE,
+        CAMINHO_ADJACENCIAS
+    )
+    logradouros = carregar_logradouros(CAMINHO_ADJACENCIAS)
+
+    resultado = biconexidade(grafo)
+    blocos_por_bairro = resultado.blocos_por_articulacao()
+
+    dados = {
+        "pontos_articulacao": [
+            {"bairro": bairro, "blocos": len(blocos_por_bairro[bairro])}
+            for bairro in resultado.articulacoes
+        ],
+        "pontes": [
+            {
+                "bairro_origem": u,
+                "bairro_destino": v,
+                "logradouros": logradouros.get(tuple(sorted((u, v))), [])
+            }
+            for u, v in resultado.pontes
+        ],
+        "blocos": resultado.blocos,
+        "arvore_bloco_corte": [
+            {"bloco": i, "bairro": bairro} for i, bairro in resultado.arvore_bloco_corte()
+        ]
+    }
+
+    with open(os.path.join(OUT_DIR, "recife_biconexidade.json"), "w", encoding="utf-8") as f:
+        json.dump(dados, f, ensure_ascii=False, indent=2)
+    return dados
+
+
+def gerar_ranking_intermediacao():
+    """Gera o ranking de bairros por centralidade de intermediação (por arestas e por peso)."""
+    grafo, _ = carregar_grafo_recife(
+        CAMINHO_BAIRROS_UNIQUE,
+        CAMINHO_ADJACENCIAS
+    )
+
+    por_arestas = intermediacao(grafo)
+    por_peso = intermediacao(grafo, ponderado=True)
+
+    ranking = [
+        {
+            "bairro": bairro,
+            "intermediacao": por_arestas[bairro],
+            "intermediacao_ponderada": por_peso[bairro]
+        }
+        for bairro in grafo.obter_nos()
+    ]
+    ranking.sort(key=lambda x: x["intermediacao"], reverse=True)
+
+    with open(os.path.join(OUT_DIR, "ranking_intermediacao.json"), "w", encoding="utf-8") as f:
+        json.dump(ranking, f, ensure_ascii=False, indent=2)
+    return ranking
+
+
+def gerar_comunidades():
+    """Detecta comunidades de bairros (Louvain e propagação de rótulos) e compara com as microrregiões."""
+    grafo, bairro_para_micro = carregar_grafo_recife(
+        CAMINHO_BAIRROS_UNIQUE,
+        CAMINHO_ADJACENCIAS
+    )
+    microrregioes = {bairro: str(micro) for bairro, micro in bairro_para_micro.items()}
+
+    por_louvain, q_louvain = louvain(grafo)
+    por_rotulos, q_rotulos = propagacao_rotulos(grafo)
+
+    dados = {
+        "louvain": {
+            "modularidade": q_louvain,
+            "numero_comunidades": len(set(por_louvain.values())),
+            "nmi_microrregiao": informacao_mutua_normalizada(por_louvain, microrregioes)
+        },
+        "propagacao_rotulos": {
+            "modularidade": q_rotulos,
+            "numero_comunidades": len(set(por_rotulos.values())),
+            "nmi_microrregiao": informacao_mutua_normalizada(por_rotulos, microrregioes)
+        },
+        "modularidade_microrregioes": modularidade(grafo, microrregioes),
+        "bairros": [
+            {
+                "bairro": bairro,
+                "microrregiao": microrregioes.get(bairro),
+                "comunidade_louvain": por_louvain[bairro],
+                "comunidade_propagacao": por_rotulos[bairro]
+            }
+            for bairro in grafo.obter_nos()
+        ]
+    }
+
+    with open(os.path.join(OUT_DIR, "recife_comunidades.json"), "w", encoding="utf-8") as f:
+        json.dump(dados, f, ensure_ascii=False, indent=2)
+    return dados
+
+
+def gerar_arvore_geradora():
+    """Gera a floresta geradora mínima dos bairros (Kruskal), com os logradouros de cada conexão."""
+    grafo, _ = carregar_grafo_recife(
+        CAMINHO_BAIRROS_UNIQUE,
+        CAMINHO_ADJACENCIAS
+    )
+    logradouros = carregar_logradouros(CAMINHO_ADJACENCIAS)
+
+    floresta = kruskal(grafo)
+
+    dados = {
+        "peso_total": floresta.peso_total,
+        "numero_arestas": len(floresta.arestas),
+        "componentes": [
+            {
+                "bairros": arvore["nos"],
+                "peso": arvore["peso"],
+                "arestas": [
+                    {
+                        "bairro_origem": u,
+                        "bairro_destino": v,
+                        "peso": peso,
+                        "logradouros": logradouros.get(tuple(sorted((u, v))), [])
+                    }
+                    for u, v, peso in arvore["arestas"]
+                ]
+            }
+            for arvore in floresta.por_componente()
+        ]
+    }
 
+    with open(os.path.join(OUT_DIR, "recife_arvore_geradora.json"), "w", encoding="utf-8") as f:
+        json.dump(dados, f, ensure_ascii=False, indent=2)
+    return dados
 
 
 if __name__ == "__main__":
     passo_3()
     passo_4()
     passo_6()
+    gerar_hierarquia_contracao()
+    gerar_biconexidade()
+    gerar_ranking_intermediacao()
+    gerar_comunidades()
+    gerar_arvore_geradora()
     
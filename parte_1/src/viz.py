@@ -3,7 +3,10 @@ import json
 import pandas as pd
 from pyvis.network import Network
 from .graphs.io import carregar_grafo_recife
-from .graphs.algorithms import bfs_arvore, dijkstra
+from .graphs.algorithms import bfs_arvore
+from .graphs.apsp import carregar_ou_calcular_tabela, dijkstra_tabela
+from .graphs.comunidades import louvain
+from .graphs.arvore_geradora import kruskal
 import matplotlib
 matplotlib.use("Agg")  
 import matplotlib.pyplot as plt
@@ -49,16 +52,17 @@ def arvore_percurso_html(
     caminho_bairros_unique = os.path.join(DATA_DIR, "bairros_unique.csv")
     caminho_adjacencias = os.path.join(DATA_DIR, "adjacencias_bairros.csv")
 
-    grafo, _ = carregar_grafo_recife(
+    tabela = carregar_ou_calcular_tabela(
         caminho_bairros_unique,
-        caminho_adjacencias
+        caminho_adjacencias,
+        os.path.join(OUT_DIR, "cache_apsp")
     )
 
     origem = "Nova Descoberta"
     destino = "Boa Viagem"
     destino_rotulo = "Boa Viagem (Setúbal)"
 
-    _dist, caminho = dijkstra(grafo, origem, destino)
+    _dist, caminho = dijkstra_tabela(tabela, origem, destino)
     if not caminho:
         raise ValueError(
             f"Não foi possível encontrar um caminho entre '{origem}' e '{destino}' usando Dijkstra."
@@ -152,6 +156,102 @@ def arvore_percurso_html(
     net.show(caminho_saida, notebook=False)
 
 
+def arvore_geradora_html(caminho_saida: str | None = None):
+    """Gera HTML interativo com a árvore geradora mínima das conexões entre bairros."""
+
+    caminho_bairros_unique = os.path.join(DATA_DIR, "bairros_unique.csv")
+    caminho_adjacencias = os.path.join(DATA_DIR, "adjacencias_bairros.csv")
+
+    grafo, _ = carregar_grafo_recife(caminho_bairros_unique, caminho_adjacencias)
+    floresta = kruskal(grafo)
+
+    if caminho_saida is None:
+        caminho_saida = os.path.join("out", "arvore_geradora.html")
+
+    os.makedirs(OUT_DIR, exist_ok=True)
+
+    grau_arvore = {}
+    for u, v, _peso in floresta.arestas:
+        grau_arvore[u] = grau_arvore.get(u, 0) + 1
+        grau_arvore[v] = grau_arvore.get(v, 0) + 1
+
+    NODE_SIZE = 25
+    FONT = {"size": 12, "face": "Arial", "color": "#2d3436"}
+
+    net = Network(height="700px", width="100%", directed=False, bgcolor="#ffffff", font_color="#000000")
+    net.barnes_hut()
+    net.set_options("""{
+        "physics": {
+            "stabilization": {
+                "enabled": true,
+                "iterations": 1000
+            },
+            "barnesHut": {
+                "gravitationalConstant": -8000,
+                "springLength": 150,
+                "springConstant": 0.04
+            }
+        },
+        "interaction": {
+            "hover": true,
+            "tooltipDelay": 100,
+            "zoomView": true,
+            "dragView": true
+        },
+        "nodes": {
+            "shape": "dot",
+            "font": {
+                "size": 12,
+                "face": "Arial"
+            },
+            "borderWidth": 2,
+            "shadow": {
+                "enabled": true,
+                "color": "rgba(0,0,0,0.2)",
+                "size": 5,
+                "x": 2,
+                "y": 2
+            }
+        },
+        "edges": {
+            "smooth": {
+                "type": "continuous",
+                "roundness": 0.5
+            }
+        }
+    }""")
+
+    for bairro in grafo.obter_nos():
+        grau = grau_arvore.get(bairro, 0)
+        titulo = f"<b>{bairro}</b><br>Conexões na árvore: {grau}"
+
+        if grau <= 1:
+            color = {"background": "#ff6b6b", "border": "#ee5a52"}
+        else:
+            color = {"background": "#4ecdc4", "border": "#2d3436"}
+
+        net.add_node(
+            bairro,
+            label=bairro,
+            title=titulo,
+            color=color,
+            size=NODE_SIZE,
+            font=FONT
+        )
+
+    for u, v, peso in floresta.arestas:
+        net.add_edge(
+            u,
+            v,
+            title=f"{u} - {v}<br>Peso: {peso}",
+            color={"color": "#95a5a6", "highlight": "#3498db"},
+            width=3,
+            smooth={"type": "continuous"}
+        )
+
+    net.show(caminho_saida, notebook=False)
+
+
 def cor_por_grau(grau: int, gmin: int, gmax: int) -> str:
     """Converte grau em cor usando gradiente azul claro -> azul escuro."""
     if gmax <= gmin:
@@ -1069,7 +1169,12 @@ def grafo_interativo_html():
 
     try:
         if origem_especial in bairros and destino_especial in bairros:
-            dist_especial, caminho_especial = dijkstra(grafo, origem_especial, destino_especial)
+            tabela = carregar_ou_calcular_tabela(
+                caminho_bairros_unique,
+                caminho_adjacencias,
+                os.path.join(OUT_DIR, "cache_apsp")
+            )
+            dist_especial, caminho_especial = dijkstra_tabela(tabela, origem_especial, destino_especial)
             if caminho_especial:
                 path_nodes = list(caminho_especial)
                 for i in range(len(caminho_especial) - 1):
@@ -1098,6 +1203,8 @@ def grafo_interativo_html():
     micro_to_color = {m: palette[i % len(palette)] for i, m in enumerate(unique_micros)}
     default_node_color = "#97c2fc"
     
+    comunidade, _modularidade = louvain(grafo)
+
     total_bairros = grafo.ordem()
     total_conexoes = grafo.tamanho()
     densidade_media = grafo.densidade()
@@ -1140,6 +1247,7 @@ def grafo_interativo_html():
             f"Bairro: {bairro}<br>"
             f"Grau: {grau}<br>"
             f"Microrregiao: {microrregiao_key}<br>"
+            f"Comunidade: {comunidade.get(bairro, '-')}<br>"
             f"Densidade ego: {dens_str}"
         )
 
@@ -2379,6 +2487,7 @@ def gerar_histograma_graus():
 
 if __name__ == "__main__":
     arvore_percurso_html()
+    arvore_geradora_html()
     mapa_graus_html()
     ranking_densidade_ego_microrregiao_png()
     arvore_bfs_boaviagem_html()
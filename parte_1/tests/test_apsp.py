@@ -0,0 +1,129 @@
+from pathlib import Path
+import sys
+import random
+import shutil
+
+import numpy as np
+import pytest
+from math import isinf
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+SRC_DIRS = [ROOT_DIR / "src", ROOT_DIR / "parte1" / "src"]
+for dir_path in SRC_DIRS:
+    if dir_path.exists() and str(dir_path) not in sys.path:
+        sys.path.append(str(dir_path))
+
+from graphs.graph import Graph
+from graphs.algorithms import dijkstra
+from graphs.apsp import (
+    floyd_warshall,
+    calcular_todos_os_pares,
+    carregar_ou_calcular_tabela,
+    chave_cache,
+    dijkstra_tabela,
+)
+
+DATA_DIR = ROOT_DIR / "data"
+
+PESOS = (1.0, 2.0, 3.5, 4.0, 5.0)
+
+
+def test_floyd_warshall_e_dijkstra_repetido_tem_mesmas_distancias(montar_grafo_aleatorio):
+    grafo = montar_grafo_aleatorio(40, 90, 8, PESOS, prefixo="B")
+
+    dist_fw, _ = floyd_warshall(grafo)
+    tabela = calcular_todos_os_pares(grafo, metodo="dijkstra")
+
+    assert np.allclose(dist_fw, tabela.dist)
+
+
+@pytest.mark.parametrize("metodo", ["dijkstra", "floyd_warshall"])
+def test_dijkstra_tabela_coincide_com_dijkstra(metodo, montar_grafo_aleatorio):
+    grafo = montar_grafo_aleatorio(40, 90, 8, PESOS, prefixo="B")
+    grafo.adicionar_no("Isolado")
+    tabela = calcular_todos_os_pares(grafo, metodo=metodo)
+
+    for origem in ["B0", "B7", "Isolado"]:
+        for destino in grafo.obter_nos():
+            custo_esperado, caminho_esperado = dijkstra(grafo, origem, destino)
+            custo, caminho = dijkstra_tabela(tabela, origem, destino)
+            assert custo == pytest.approx(custo_esperado)
+            if metodo == "dijkstra":
+                assert caminho == caminho_esperado
+            else:
+                assert len(caminho) > 0 or isinf(custo)
+
+
+def test_tabela_padrao_em_grafo_denso_e_pesos_iguais_tem_caminhos_de_dijkstra():
+    rng = random.Random(3)
+    grafo = Graph()
+    nos = [f"B{i:02d}" for i in range(20)]
+    for no in nos:
+        grafo.adicionar_no(no)
+    for _ in range(60):
+        u, v = rng.sample(nos, 2)
+        grafo.adicionar_aresta(u, v, 1.0)
+    tabela = calcular_todos_os_pares(grafo)
+
+    for origem in nos:
+        for destino in nos:
+            assert dijkstra_tabela(tabela, origem, destino) == dijkstra(grafo, origem, destino)
+
+
+def test_dijkstra_tabela_no_inexistente(montar_grafo_aleatorio):
+    tabela = calcular_todos_os_pares(montar_grafo_aleatorio(40, 90, 8, PESOS, prefixo="B"))
+
+    custo, caminho = dijkstra_tabela(tabela, "Z", "B1")
+    assert isinf(custo) and caminho == []
+
+
+def test_cache_em_disco_e_reaproveitado_e_invalidado(tmp_path):
+    bairros = tmp_path / "bairros_unique.csv"
+    adjacencias = tmp_path / "adjacencias_bairros.csv"
+    shutil.copy(DATA_DIR / "bairros_unique.csv", bairros)
+    shutil.copy(DATA_DIR / "adjacencias_bairros.csv", adjacencias)
+    cache = tmp_path / "cache"
+
+    tabela = carregar_ou_calcular_tabela(str(bairros), str(adjacencias), str(cache))
+    arquivos = sorted(p.name for p in cache.iterdir())
+    assert len(arquivos) == 3
+    assert isinstance(tabela.dist, np.memmap)
+
+    custo, caminho = dijkstra_tabela(tabela, "Nova Descoberta", "Boa Viagem")
+    assert custo == pytest.approx(10.0)
+    assert caminho[0] == "Nova Descoberta" and caminho[-1] == "Boa Viagem"
+
+    carregar_ou_calcular_tabela(str(bairros), str(adjacencias), str(cache))
+    assert sorted(p.name for p in cache.iterdir()) == arquivos
+
+    chave_antiga = chave_cache(str(bairros), str(adjacencias))
+    with open(adjacencias, "a", encoding="utf-8") as f:
+        f.write("Pina,Boa Vista,Rua Nova,,1\n")
+    assert chave_cache(str(bairros), str(adjacencias)) != chave_antiga
+    assert chave_cache(str(bairros), str(adjacencias), metodo="floyd_warshall") != chave_cache(
+        str(bairros), str(adjacencias)
+    )
+
+    tabela = carregar_ou_calcular_tabela(str(bairros), str(adjacencias), str(cache))
+    assert len(list(cache.iterdir())) == 6
+    assert dijkstra_tabela(tabela, "Pina", "Boa Vista")[0] == pytest.approx(1.0)
+
+
+def test_cache_incompleto_ou_truncado_e_recalculado(tmp_path):
+    bairros = tmp_path / "bairros_unique.csv"
+    adjacencias = tmp_path / "adjacencias_bairros.csv"
+    shutil.copy(DATA_DIR / "bairros_unique.csv", bairros)
+    shutil.copy(DATA_DIR / "adjacencias_bairros.csv", adjacencias)
+    cache = tmp_path / "cache"
+
+    carregar_ou_calcular_tabela(str(bairros), str(adjacencias), str(cache))
+    caminho_dist = next(cache.glob("*_dist.npy"))
+    caminho_anterior = next(cache.glob("*_anterior.npy"))
+
+    np.save(caminho_dist, np.zeros((2, 2)))
+    caminho_anterior.unlink()
+
+    tabela = carregar_ou_calcular_tabela(str(bairros), str(adjacencias), str(cache))
+    assert tabela.dist.shape == (len(tabela.nomes), len(tabela.nomes))
+    assert dijkstra_tabela(tabela, "Nova Descoberta", "Boa Viagem")[0] == pytest.approx(10.0)
+    assert not list(cache.glob("*.tmp"))
@@ -0,0 +1,86 @@
+from pathlib import Path
+import sys
+import random
+from itertools import combinations
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+SRC_DIRS = [ROOT_DIR / "src"]
+for dir_path in SRC_DIRS:
+    if dir_path.exists():
+        sys.path.insert(0, str(dir_path))
+
+from graphs.graph import Graph
+from graphs.componentes import UniaoBusca
+from graphs.arvore_geradora import kruskal, prim
+
+
+def montar_grafo_arvore() -> Graph:
+    grafo = Graph()
+    for u, v, peso in [
+        ("A", "B", 4.0), ("A", "C", 1.0), ("B", "C", 2.0), ("B", "D", 5.0),
+        ("C", "D", 8.0), ("D", "E", 3.0), ("C", "E", 9.0),
+        ("X", "Y", 2.0), ("Y", "Z", 1.0), ("X", "Z", 7.0),
+    ]:
+        grafo.adicionar_aresta(u, v, peso)
+    grafo.adicionar_aresta("A", "B", 1.5)
+    grafo.adicionar_aresta("E", "E", -1.0)
+    grafo.adicionar_no("I")
+    return grafo
+
+
+def menor_floresta_forca_bruta(grafo: Graph) -> float:
+    """Testa todos os subconjuntos de n - c arestas sem ciclo e devolve o menor peso."""
+    nos = grafo.obter_nos()
+    indice = {no: i for i, no in enumerate(nos)}
+    arestas = [
+        (indice[u], indice[v], peso)
+        for u in nos for v, peso in grafo.vizinhos(u)
+        if indice[u] < indice[v]
+    ]
+    componentes = UniaoBusca(len(nos))
+    for u, v, _ in arestas:
+        componentes.unir(u, v)
+    tamanho = len(nos) - componentes.conjuntos
+
+    melhor = None
+    for escolha in combinations(arestas, tamanho):
+        conjuntos = UniaoBusca(len(nos))
+        if all(conjuntos.unir(u, v) for u, v, _ in escolha):
+            peso = sum(p for _, _, p in escolha)
+            melhor = peso if melhor is None else min(melhor, peso)
+    return melhor if melhor is not None else 0.0
+
+
+@pytest.mark.parametrize("algoritmo", [kruskal, prim])
+def test_floresta_geradora_em_grafo_conhecido(algoritmo):
+    grafo = montar_grafo_arvore()
+
+    floresta = algoritmo(grafo)
+
+    assert floresta.peso_total == pytest.approx(1.0 + 1.5 + 5.0 + 3.0 + 2.0 + 1.0)
+    assert len(floresta.arestas) == 6
+    assert floresta.componentes == [["A", "B", "C", "D", "E"], ["X", "Y", "Z"], ["I"]]
+
+    arvores = floresta.por_componente()
+    assert [a["peso"] for a in arvores] == pytest.approx([10.5, 3.0, 0.0])
+    assert [len(a["arestas"]) for a in arvores] == [4, 2, 0]
+
+
+def test_kruskal_e_prim_conferem_com_forca_bruta():
+    for semente in range(15):
+        rng = random.Random(semente)
+        grafo = Graph()
+        n = rng.randint(1, 7)
+        for i in range(n):
+            grafo.adicionar_no(i)
+        for _ in range(rng.randint(0, 10)):
+            grafo.adicionar_aresta(rng.randrange(n), rng.randrange(n), float(rng.randint(-2, 9)))
+
+        esperado = menor_floresta_forca_bruta(grafo)
+        por_kruskal, por_prim = kruskal(grafo), prim(grafo)
+
+        assert por_kruskal.peso_total == pytest.approx(esperado)
+        assert por_prim.peso_total == pytest.approx(esperado)
+        assert por_kruskal.componentes == por_prim.componentes
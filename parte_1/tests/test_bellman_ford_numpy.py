@@ -0,0 +1,71 @@
+from pathlib import Path
+import sys
+
+import numpy as np
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+SRC_DIRS = [ROOT_DIR / "src"]
+for dir_path in SRC_DIRS:
+    if dir_path.exists():
+        sys.path.insert(0, str(dir_path))
+
+from graphs.graph import Graph
+from graphs.algorithms import bellman_ford
+from graphs.csr import obter_csr
+from graphs.bellman_ford_numpy import arrays_arestas, bellman_ford_numpy
+
+PESOS = (0.5, 1.0, 2.0, 3.0)
+
+
+def test_arrays_arestas_reproduzem_o_csr(montar_grafo_aleatorio):
+    grafo = montar_grafo_aleatorio(120, 400, 5, PESOS)
+    grafo.adicionar_no("Isolado")
+    csr = obter_csr(grafo)
+
+    u, v, w = arrays_arestas(csr)
+
+    assert len(u) == len(v) == len(w) == 2 * csr.tamanho()
+    for k in range(0, len(u), 37):
+        assert csr.offsets[u[k]] <= k < csr.offsets[u[k] + 1]
+        assert v[k] == csr.alvos[k] and w[k] == csr.pesos[k]
+    assert arrays_arestas(csr)[0] is u
+
+
+def test_bellman_ford_numpy_coincide_com_bellman_ford(montar_grafo_aleatorio):
+    grafo = montar_grafo_aleatorio(120, 400, 5, PESOS)
+    grafo.adicionar_no("Isolado")
+
+    dist, anterior, ciclo = bellman_ford(grafo, "N0")
+    dist_np, anterior_np, ciclo_np = bellman_ford_numpy(grafo, "N0")
+
+    assert ciclo is ciclo_np is False
+    assert dist_np == dist
+    assert anterior_np["N0"] is None and anterior_np["Isolado"] is None
+    pesos = {}
+    for u in grafo.obter_nos():
+        for v, p in grafo.vizinhos(u):
+            pesos[(u, v)] = min(p, pesos.get((u, v), np.inf))
+    for v, u in anterior_np.items():
+        if u is not None:
+            assert dist_np[v] == pytest.approx(dist_np[u] + pesos[(u, v)])
+
+
+def test_bellman_ford_numpy_detecta_e_extrai_ciclo_negativo():
+    grafo = Graph()
+    grafo.adicionar_aresta("X", "Y", 1.0)
+    grafo.adicionar_aresta("Y", "Z", 2.0)
+    grafo.adicionar_aresta("Z", "X", -5.0)
+    estatisticas = {}
+
+    _dist, _anterior, tem_ciclo = bellman_ford_numpy(grafo, "X", estatisticas)
+
+    ciclo = estatisticas["ciclo_negativo"]
+    assert tem_ciclo is True
+    assert ciclo[0] == ciclo[-1] and len(ciclo) >= 3
+    assert estatisticas["rodadas"] == grafo.ordem()
+
+
+def test_bellman_ford_numpy_origem_inexistente(montar_grafo_aleatorio):
+    with pytest.raises(ValueError):
+        bellman_ford_numpy(montar_grafo_aleatorio(120, 400, 5, PESOS), "Z")
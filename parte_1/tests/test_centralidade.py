@@ -0,0 +1,109 @@
+from pathlib import Path
+import sys
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+SRC_DIRS = [ROOT_DIR / "src"]
+for dir_path in SRC_DIRS:
+    if dir_path.exists():
+        sys.path.insert(0, str(dir_path))
+
+from graphs.graph import Graph
+from graphs.algorithms import bfs_arvore
+from graphs.centralidade import intermediacao, amostras_necessarias, proximidade_e_harmonica
+
+PESOS = (1.0, 2.0, 3.0)
+
+
+def test_intermediacao_em_caminho_e_estrela():
+    caminho = Graph()
+    caminho.adicionar_aresta("A", "B", 1)
+    caminho.adicionar_aresta("B", "C", 1)
+    caminho.adicionar_aresta("C", "D", 1)
+
+    valores = intermediacao(caminho, normalizar=False)
+    assert valores == {"A": 0.0, "B": 2.0, "C": 2.0, "D": 0.0}
+
+    estrela = Graph()
+    for folha in ["X", "Y", "Z", "W"]:
+        estrela.adicionar_aresta("Centro", folha, 1)
+    assert intermediacao(estrela)["Centro"] == pytest.approx(1.0)
+    assert intermediacao(estrela)["X"] == 0.0
+
+
+def test_intermediacao_divide_caminhos_empatados_e_ignora_paralelas():
+    grafo = Graph()
+    grafo.adicionar_aresta("A", "B", 1)
+    grafo.adicionar_aresta("A", "C", 1)
+    grafo.adicionar_aresta("B", "D", 1)
+    grafo.adicionar_aresta("C", "D", 1)
+    grafo.adicionar_aresta("A", "B", 1)
+
+    valores = intermediacao(grafo, normalizar=False)
+
+    assert valores["B"] == pytest.approx(0.5)
+    assert valores["C"] == pytest.approx(0.5)
+
+
+def test_intermediacao_ponderada_segue_os_pesos():
+    grafo = Graph()
+    grafo.adicionar_aresta("A", "C", 5)
+    grafo.adicionar_aresta("A", "B", 1)
+    grafo.adicionar_aresta("B", "C", 1)
+
+    assert intermediacao(grafo, normalizar=False)["B"] == 0.0
+    assert intermediacao(grafo, ponderado=True, normalizar=False)["B"] == pytest.approx(1.0)
+
+
+def test_intermediacao_paralela_igual_a_sequencial(montar_grafo_aleatorio):
+    grafo = montar_grafo_aleatorio(40, 80, 2, PESOS)
+
+    sequencial = intermediacao(grafo, ponderado=True)
+    paralela = intermediacao(grafo, ponderado=True, workers=2)
+
+    for no in grafo.obter_nos():
+        assert paralela[no] == pytest.approx(sequencial[no])
+
+
+def test_intermediacao_amostrada_respeita_o_erro(montar_grafo_aleatorio):
+    grafo = montar_grafo_aleatorio(300, 700, 2, PESOS)
+    erro = 0.2
+    assert amostras_necessarias(grafo.ordem(), erro) < grafo.ordem()
+
+    exata = intermediacao(grafo)
+    aproximada = intermediacao(grafo, erro=erro)
+
+    assert max(abs(exata[no] - aproximada[no]) for no in exata) <= erro
+    with pytest.raises(ValueError):
+        amostras_necessarias(10, 1.5)
+
+
+def test_proximidade_e_harmonica_em_caminho_com_isolado():
+    grafo = Graph()
+    grafo.adicionar_aresta("A", "B", 1)
+    grafo.adicionar_aresta("B", "C", 1)
+    grafo.adicionar_no("Isolado")
+
+    proximidade, harmonica = proximidade_e_harmonica(grafo)
+
+    assert proximidade["B"] == pytest.approx((2 / 2) * (2 / 3))
+    assert proximidade["A"] == pytest.approx((2 / 3) * (2 / 3))
+    assert proximidade["Isolado"] == 0.0
+    assert harmonica["A"] == pytest.approx(1.5)
+    assert harmonica["B"] == pytest.approx(2.0)
+    assert harmonica["Isolado"] == 0.0
+
+
+def test_proximidade_e_harmonica_batem_com_bfs_por_fonte(montar_grafo_aleatorio):
+    grafo = montar_grafo_aleatorio(150, 220, 9, PESOS)
+
+    proximidade, harmonica = proximidade_e_harmonica(grafo)
+
+    n = grafo.ordem()
+    for no in grafo.obter_nos():
+        _pai, nivel = bfs_arvore(grafo, no)
+        distancias = [d for d in nivel.values() if d > 0]
+        esperado = (len(distancias) / sum(distancias)) * (len(distancias) / (n - 1)) if distancias else 0.0
+        assert proximidade[no] == pytest.approx(esperado)
+        assert harmonica[no] == pytest.approx(sum(1 / d for d in distancias))
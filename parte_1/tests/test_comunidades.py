@@ -0,0 +1,87 @@
+from pathlib import Path
+import sys
+import random
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+SRC_DIRS = [ROOT_DIR / "src"]
+for dir_path in SRC_DIRS:
+    if dir_path.exists():
+        sys.path.insert(0, str(dir_path))
+
+from graphs.graph import Graph
+from graphs.comunidades import (
+    louvain,
+    propagacao_rotulos,
+    modularidade,
+    informacao_mutua_normalizada,
+)
+
+
+def montar_cliques_ligadas(k: int = 4, tamanho: int = 5) -> Graph:
+    """k cliques de ``tamanho`` nós ligadas em anel por uma única aresta cada."""
+    grafo = Graph()
+    for c in range(k):
+        nos = [f"{c}-{i}" for i in range(tamanho)]
+        for i in range(tamanho):
+            for j in range(i + 1, tamanho):
+                grafo.adicionar_aresta(nos[i], nos[j], 1.0)
+        grafo.adicionar_aresta(f"{c}-0", f"{(c + 1) % k}-1", 1.0)
+    return grafo
+
+
+def modularidade_por_definicao(grafo: Graph, comunidade: dict) -> float:
+    """Q = 1/2m * soma sobre i, j de [A_ij - k_i k_j / 2m] * [c_i == c_j], no grafo simples."""
+    vizinhos = {no: {v for v, _ in grafo.vizinhos(no) if v != no} for no in grafo.obter_nos()}
+    m2 = sum(len(vs) for vs in vizinhos.values())
+    q = 0.0
+    for i in vizinhos:
+        for j in vizinhos:
+            if comunidade[i] == comunidade[j]:
+                q += (j in vizinhos[i]) - len(vizinhos[i]) * len(vizinhos[j]) / m2
+    return q / m2
+
+
+@pytest.mark.parametrize("detectar", [louvain, propagacao_rotulos])
+def test_detecta_cliques_ligadas(detectar):
+    grafo = montar_cliques_ligadas()
+
+    comunidade, q = detectar(grafo)
+
+    for c in range(4):
+        assert len({comunidade[f"{c}-{i}"] for i in range(5)}) == 1
+    assert len(set(comunidade.values())) == 4
+    assert q == pytest.approx(modularidade_por_definicao(grafo, comunidade))
+
+
+def test_modularidade_confere_com_definicao_em_grafo_aleatorio():
+    rng = random.Random(3)
+    grafo = Graph()
+    for _ in range(120):
+        grafo.adicionar_aresta(rng.randrange(40), rng.randrange(40), 1.0)
+
+    comunidade, q = louvain(grafo)
+    aleatoria = {no: rng.randrange(4) for no in grafo.obter_nos()}
+
+    assert q == pytest.approx(modularidade_por_definicao(grafo, comunidade))
+    assert modularidade(grafo, aleatoria) == pytest.approx(modularidade_por_definicao(grafo, aleatoria))
+    assert q > modularidade(grafo, aleatoria)
+    assert sorted(set(comunidade.values())) == list(range(len(set(comunidade.values()))))
+
+
+def test_nos_isolados_ficam_sozinhos():
+    grafo = montar_cliques_ligadas(2, 3)
+    grafo.adicionar_no("isolado")
+
+    comunidade, _q = louvain(grafo)
+
+    assert sum(1 for c in comunidade.values() if c == comunidade["isolado"]) == 1
+
+
+def test_informacao_mutua_normalizada():
+    a = {"x": 0, "y": 0, "z": 1, "w": 1}
+
+    assert informacao_mutua_normalizada(a, {"x": "p", "y": "p", "z": "q", "w": "q"}) == pytest.approx(1.0)
+    assert informacao_mutua_normalizada(a, {"x": 0, "y": 1, "z": 0, "w": 1}) == pytest.approx(0.0)
+    assert informacao_mutua_normalizada(a, {}) == 0.0
@@ -0,0 +1,95 @@
+from pathlib import Path
+import sys
+import random
+
+import pytest
+from math import isinf
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+SRC_DIRS = [ROOT_DIR / "src", ROOT_DIR / "parte1" / "src"]
+for dir_path in SRC_DIRS:
+    if dir_path.exists() and str(dir_path) not in sys.path:
+        sys.path.append(str(dir_path))
+
+from graphs.graph import Graph
+from graphs.algorithms import dijkstra
+from graphs.io import carregar_grafo_recife
+from graphs.contraction import (
+    construir_hierarquia,
+    salvar_hierarquia,
+    carregar_hierarquia,
+    dijkstra_ch,
+)
+
+DATA_DIR = ROOT_DIR / "data"
+
+
+def montar_grafo_viario(n: int = 150, semente: int = 4) -> Graph:
+    rng = random.Random(semente)
+    grafo = Graph()
+    for i in range(1, n):
+        grafo.adicionar_aresta(f"B{i}", f"B{rng.randrange(i)}", rng.choice([1.0, 2.0, 3.5, 4.0, 5.0]))
+    for _ in range(n):
+        u, v = rng.sample(range(n), 2)
+        grafo.adicionar_aresta(f"B{u}", f"B{v}", rng.choice([1.0, 2.0, 3.5, 4.0, 5.0]))
+    grafo.adicionar_no("Isolado")
+    return grafo
+
+
+def custo_do_caminho(grafo: Graph, caminho):
+    return sum(
+        min(peso for v, peso in grafo.vizinhos(a) if v == b)
+        for a, b in zip(caminho, caminho[1:])
+    )
+
+
+def test_dijkstra_ch_coincide_com_dijkstra_e_desempacota_caminho():
+    grafo = montar_grafo_viario()
+    hierarquia = construir_hierarquia(grafo)
+    rng = random.Random(2)
+    nos = grafo.obter_nos()
+
+    for _ in range(80):
+        origem, destino = rng.choice(nos), rng.choice(nos)
+        custo_esperado, _ = dijkstra(grafo, origem, destino)
+        custo, caminho = dijkstra_ch(hierarquia, origem, destino)
+
+        assert custo == pytest.approx(custo_esperado)
+        if caminho:
+            assert caminho[0] == origem and caminho[-1] == destino
+            assert custo_do_caminho(grafo, caminho) == pytest.approx(custo)
+
+
+def test_dijkstra_ch_casos_limite():
+    hierarquia = construir_hierarquia(montar_grafo_viario())
+
+    assert dijkstra_ch(hierarquia, "B3", "B3") == (0.0, ["B3"])
+    custo, caminho = dijkstra_ch(hierarquia, "B3", "Isolado")
+    assert isinf(custo) and caminho == []
+    custo, caminho = dijkstra_ch(hierarquia, "Z", "B3")
+    assert isinf(custo) and caminho == []
+
+
+def test_hierarquia_recusa_pesos_negativos():
+    grafo = Graph()
+    grafo.adicionar_aresta("A", "B", -1.0)
+
+    with pytest.raises(ValueError):
+        construir_hierarquia(grafo)
+
+
+def test_salvar_e_carregar_hierarquia_dos_bairros(tmp_path):
+    grafo, _ = carregar_grafo_recife(
+        str(DATA_DIR / "bairros_unique.csv"),
+        str(DATA_DIR / "adjacencias_bairros.csv"),
+    )
+    caminho = tmp_path / "hierarquia.json"
+
+    salvar_hierarquia(construir_hierarquia(grafo), str(caminho))
+    hierarquia = carregar_hierarquia(str(caminho))
+
+    assert hierarquia.ordem() == grafo.ordem()
+    for origem, destino in [("Nova Descoberta", "Boa Viagem"), ("Pina", "Boa Vista")]:
+        custo, caminho = dijkstra_ch(hierarquia, origem, destino)
+        assert custo == pytest.approx(dijkstra(grafo, origem, destino)[0])
+        assert custo_do_caminho(grafo, caminho) == pytest.approx(custo)
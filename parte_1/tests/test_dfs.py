@@ -10,7 +10,7 @@ for dir_path in SRC_DIRS:
         sys.path.append(str(dir_path))
 
 from graphs.graph import Graph
-from graphs.algorithms import dfs_arvore, dfs_caminho, dfs_detectar_ciclo, dfs_classificar_arestas
+from graphs.algorithms import dfs_arvore, dfs_caminho, dfs_detectar_ciclo, dfs_classificar_arestas, dfs_tempos
 
 
 def montar_grafo_dfs() -> Graph:
@@ -93,4 +93,43 @@ def test_dfs_classificar_arestas_tree_e_back():
 
     assert classificacao[tuple(sorted(("A", "B")))] == "tree"
     assert classificacao[tuple(sorted(("B", "C")))] == "tree"
-    assert classificacao[tuple(sorted(("A", "C")))] == "back"
\ No newline at end of file
+    assert classificacao[tuple(sorted(("A", "C")))] == "back"
+
+
+def montar_cadeia(n: int) -> Graph:
+    grafo = Graph()
+    for i in range(n - 1):
+        grafo.adicionar_aresta(f"V{i}", f"V{i + 1}", 1)
+    return grafo
+
+
+def test_dfs_em_cadeia_longa_nao_estoura_recursao():
+    n = 50000
+    grafo = montar_cadeia(n)
+
+    caminho = dfs_caminho(grafo, "V0", f"V{n - 1}")
+    assert len(caminho) == n
+    assert dfs_detectar_ciclo(grafo) is False
+
+    grafo.adicionar_aresta(f"V{n - 1}", "V0", 1)
+    assert dfs_detectar_ciclo(grafo) is True
+    classificacao = dfs_classificar_arestas(grafo)
+    assert list(classificacao.values()).count("back") == 1
+
+
+def test_dfs_tempos_formam_intervalos_aninhados():
+    grafo = montar_grafo_dfs()
+    grafo.adicionar_no("Isolado")
+
+    pre, pos = dfs_tempos(grafo)
+
+    tempos = sorted(list(pre.values()) + list(pos.values()))
+    assert tempos == list(range(2 * grafo.ordem()))
+    for no in grafo.obter_nos():
+        assert pre[no] < pos[no]
+    for u in grafo.obter_nos():
+        for v in grafo.obter_nos():
+            disjuntos = pos[u] < pre[v] or pos[v] < pre[u]
+            aninhados = (pre[u] < pre[v] and pos[v] < pos[u]) or (pre[v] < pre[u] and pos[u] < pos[v])
+            assert u == v or disjuntos or aninhados
+    assert pos["Isolado"] == pre["Isolado"] + 1
@@ -11,7 +11,7 @@ for dir_path in SRC_DIRS:
         sys.path.append(str(dir_path))
 
 from graphs.graph import Graph
-from graphs.algorithms import dijkstra
+from graphs.algorithms import dijkstra, dijkstra_arvore, extrair_caminho, dijkstra_lote
 
 
 def montar_grafo_dijkstra() -> Graph:
@@ -78,4 +78,104 @@ def test_dijkstra_recusa_pesos_negativos():
     grafo.adicionar_aresta("A", "B", -1)
 
     with pytest.raises(ValueError):
-        dijkstra(grafo, "A", "B")
\ No newline at end of file
+        dijkstra(grafo, "A", "B")
+
+def test_dijkstra_com_pesos_iguais_desempata_como_dijkstra_arvore():
+    grafo = Graph()
+    grafo.adicionar_aresta("A", "D", 1)
+    grafo.adicionar_aresta("A", "B", 1)
+    grafo.adicionar_aresta("D", "C", 1)
+    grafo.adicionar_aresta("B", "C", 1)
+
+    custo, caminho = dijkstra(grafo, "A", "C")
+    _dist, anterior = dijkstra_arvore(grafo, "A")
+
+    assert custo == pytest.approx(2.0)
+    assert caminho == ["A", "B", "C"]
+    assert caminho == extrair_caminho(anterior, "A", "C")
+
+
+def test_dijkstra_caminhos_iguais_aos_de_dijkstra_arvore():
+    import random
+
+    rng = random.Random(7)
+    for peso in (1, 2.5):
+        grafo = Graph()
+        nos = [f"N{i:02d}" for i in range(30)]
+        for no in nos:
+            grafo.adicionar_no(no)
+        for _ in range(70):
+            u, v = rng.sample(nos, 2)
+            grafo.adicionar_aresta(u, v, peso)
+
+        dist, anterior = dijkstra_arvore(grafo, "N00")
+        for destino in nos[1:]:
+            custo, caminho = dijkstra(grafo, "N00", destino)
+            assert custo == pytest.approx(dist[destino])
+            assert caminho == extrair_caminho(anterior, "N00", destino)
+
+
+def test_dijkstra_valida_pesos_pelas_estatisticas_do_grafo():
+    grafo = montar_grafo_dijkstra()
+    assert grafo.tem_peso_negativo is False
+
+    grafo.adicionar_aresta("E", "F", -2)
+
+    assert grafo.tem_peso_negativo is True
+    with pytest.raises(ValueError):
+        dijkstra(grafo, "A", "B")
+
+
+def test_dijkstra_arvore_calcula_distancias_e_predecessores_de_todos():
+    grafo = montar_grafo_dijkstra()
+    grafo.adicionar_no("Isolado")
+
+    dist, anterior = dijkstra_arvore(grafo, "A")
+
+    assert dist["E"] == pytest.approx(5.0)
+    assert dist["D"] == pytest.approx(6.0)
+    assert isinf(dist["Isolado"])
+    assert anterior["A"] is None
+    assert extrair_caminho(anterior, "A", "E") == ["A", "B", "C", "E"]
+    assert extrair_caminho(anterior, "A", "A") == ["A"]
+    assert extrair_caminho(anterior, "A", "Isolado") == []
+    assert extrair_caminho(anterior, "A", "Z") == []
+
+
+def test_dijkstra_arvore_coincide_com_dijkstra_por_destino():
+    grafo = montar_grafo_dijkstra()
+
+    dist, anterior = dijkstra_arvore(grafo, "B")
+
+    for destino in grafo.obter_nos():
+        custo, caminho = dijkstra(grafo, "B", destino)
+        assert dist[destino] == pytest.approx(custo)
+        assert extrair_caminho(anterior, "B", destino) == caminho
+
+
+def test_dijkstra_arvore_erro_para_origem_inexistente():
+    with pytest.raises(ValueError):
+        dijkstra_arvore(montar_grafo_dijkstra(), "Z")
+
+
+def test_dijkstra_lote_agrupa_por_origem_e_preserva_ordem():
+    grafo = montar_grafo_dijkstra()
+    grafo.adicionar_no("Isolado")
+    pares = [("A", "E"), ("C", "A"), ("A", "D"), ("A", "Isolado"), ("Z", "A"), ("A", "Z")]
+
+    resultados = dijkstra_lote(grafo, pares)
+
+    assert len(resultados) == len(pares)
+    for (origem, destino), (custo, caminho) in zip(pares, resultados):
+        custo_esperado, caminho_esperado = dijkstra(grafo, origem, destino)
+        assert custo == pytest.approx(custo_esperado)
+        assert caminho == caminho_esperado
+
+
+def test_dijkstra_recusa_pesos_negativos_mesmo_entre_componentes_diferentes():
+    grafo = Graph()
+    grafo.adicionar_aresta("A", "B", -1)
+    grafo.adicionar_aresta("C", "D", 1)
+
+    with pytest.raises(ValueError):
+        dijkstra(grafo, "A", "C")
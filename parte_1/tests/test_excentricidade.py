@@ -0,0 +1,111 @@
+from pathlib import Path
+import sys
+import random
+from collections import deque
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+SRC_DIRS = [ROOT_DIR / "src"]
+for dir_path in SRC_DIRS:
+    if dir_path.exists():
+        sys.path.insert(0, str(dir_path))
+
+from graphs.graph import Graph
+from graphs.componentes import indice_componentes
+from graphs.excentricidade import excentricidades
+
+
+def excentricidades_forca_bruta(grafo: Graph, nos):
+    """Uma BFS por nó da componente."""
+    resultado = {}
+    for origem in nos:
+        nivel = {origem: 0}
+        fila = deque([origem])
+        while fila:
+            u = fila.popleft()
+            for v, _ in grafo.vizinhos(u):
+                if v not in nivel:
+                    nivel[v] = nivel[u] + 1
+                    fila.append(v)
+        resultado[origem] = max(nivel.values())
+    return resultado
+
+
+def test_caminho_e_estrela():
+    caminho = Graph()
+    for i in range(6):
+        caminho.adicionar_aresta(i, i + 1, 5.0)
+
+    resultado = excentricidades(caminho)
+
+    assert resultado.exato()
+    assert resultado.diametro() == 6
+    assert resultado.raio() == 3
+    assert resultado.centro() == [3]
+    assert sorted(resultado.periferia()) == [0, 6]
+
+    estrela = Graph()
+    for i in range(1, 8):
+        estrela.adicionar_aresta(0, i, 1.0)
+    estrela.adicionar_no("isolado")
+
+    resultado = excentricidades(estrela)
+    assert (resultado.diametro(), resultado.raio()) == (2, 1)
+    assert "isolado" not in resultado.inferior
+
+
+def test_confere_com_uma_bfs_por_no_e_usa_menos_buscas():
+    for semente in range(30):
+        rng = random.Random(semente)
+        grafo = Graph()
+        n = rng.randint(1, 60)
+        for i in range(n):
+            grafo.adicionar_no(i)
+        for _ in range(rng.randint(0, 100)):
+            grafo.adicionar_aresta(rng.randrange(n), rng.randrange(n), 1.0)
+
+        gigante = indice_componentes(grafo).componente_gigante()
+        esperado = excentricidades_forca_bruta(grafo, gigante)
+        resultado = excentricidades(grafo)
+
+        assert resultado.exato()
+        assert resultado.diametro() == max(esperado.values())
+        assert resultado.raio() == min(esperado.values())
+        assert resultado.buscas <= len(gigante)
+        for no, e in esperado.items():
+            assert resultado.inferior[no] <= e <= resultado.superior[no]
+
+
+def test_max_buscas_devolve_limites_validos():
+    rng = random.Random(11)
+    grafo = Graph()
+    for _ in range(300):
+        grafo.adicionar_aresta(rng.randrange(120), rng.randrange(120), 1.0)
+
+    gigante = indice_componentes(grafo).componente_gigante()
+    esperado = excentricidades_forca_bruta(grafo, gigante)
+    aproximado = excentricidades(grafo, max_buscas=2)
+
+    assert aproximado.buscas <= 2
+    assert aproximado.diametro_minimo <= max(esperado.values()) <= aproximado.diametro_maximo
+    assert aproximado.raio_minimo <= min(esperado.values()) <= aproximado.raio_maximo
+    assert aproximado.diametro_maximo <= 2 * aproximado.diametro_minimo
+
+
+def test_centro_e_periferia_conferem_com_uma_bfs_por_no():
+    for semente in range(30):
+        rng = random.Random(semente)
+        grafo = Graph()
+        for _ in range(rng.randint(20, 150)):
+            grafo.adicionar_aresta(rng.randrange(60), rng.randrange(60), 1.0)
+
+        gigante = indice_componentes(grafo).componente_gigante()
+        esperado = excentricidades_forca_bruta(grafo, gigante)
+        raio, diametro = min(esperado.values()), max(esperado.values())
+
+        for max_buscas in (None, 1):
+            resultado = excentricidades(grafo, max_buscas=max_buscas)
+            assert sorted(resultado.centro()) == sorted(no for no, e in esperado.items() if e == raio)
+            assert sorted(resultado.periferia()) == sorted(
+                no for no, e in esperado.items() if e == diametro
+            )
+            assert (resultado.raio(), resultado.diametro()) == (raio, diametro)
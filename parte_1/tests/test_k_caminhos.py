@@ -0,0 +1,100 @@
+from pathlib import Path
+import sys
+import random
+from math import inf
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+SRC_DIRS = [ROOT_DIR / "src"]
+for dir_path in SRC_DIRS:
+    if dir_path.exists():
+        sys.path.insert(0, str(dir_path))
+
+from graphs.graph import Graph
+from graphs.k_caminhos import k_caminhos_minimos
+
+
+def montar_grafo_yen() -> Graph:
+    # Exemplo clássico do algoritmo de Yen (arestas não-direcionadas aqui)
+    grafo = Graph()
+    for u, v, peso in [
+        ("C", "D", 3.0), ("C", "E", 2.0), ("D", "F", 4.0), ("E", "D", 1.0),
+        ("E", "F", 2.0), ("E", "G", 3.0), ("F", "G", 2.0), ("F", "H", 1.0),
+        ("G", "H", 2.0),
+    ]:
+        grafo.adicionar_aresta(u, v, peso)
+    return grafo
+
+
+def todos_caminhos_simples(grafo: Graph, origem, destino):
+    """Enumera por DFS todos os caminhos sem ciclos, com o menor peso entre arestas paralelas."""
+    menor = {}
+    for u in grafo.obter_nos():
+        for v, peso in grafo.vizinhos(u):
+            menor[(u, v)] = min(menor.get((u, v), inf), peso)
+
+    resultado = []
+
+    def visitar(caminho, custo):
+        u = caminho[-1]
+        if u == destino:
+            resultado.append((custo, list(caminho)))
+            return
+        for v in {v for v, _ in grafo.vizinhos(u)}:
+            if v not in caminho:
+                caminho.append(v)
+                visitar(caminho, custo + menor[(u, v)])
+                caminho.pop()
+
+    visitar([origem], 0.0)
+    return sorted(resultado)
+
+
+def test_k_caminhos_no_exemplo_classico():
+    grafo = montar_grafo_yen()
+
+    resultado = list(k_caminhos_minimos(grafo, "C", "H", 3))
+
+    assert resultado == [
+        (5.0, ["C", "E", "F", "H"]),
+        (7.0, ["C", "E", "G", "H"]),
+        (7.0, ["C", "D", "E", "F", "H"]),
+    ]
+
+
+def test_k_caminhos_confere_com_enumeracao_completa():
+    for semente in range(40):
+        rng = random.Random(semente)
+        grafo = Graph()
+        n = rng.randint(2, 7)
+        for i in range(n):
+            grafo.adicionar_no(i)
+        for _ in range(rng.randint(0, 14)):
+            grafo.adicionar_aresta(rng.randrange(n), rng.randrange(n), float(rng.randint(1, 4)))
+        origem, destino = 0, n - 1
+
+        esperado = todos_caminhos_simples(grafo, origem, destino)
+        resultado = list(k_caminhos_minimos(grafo, origem, destino, 50))
+
+        assert [custo for custo, _ in resultado] == [custo for custo, _ in esperado]
+        assert sorted(map(tuple, (c for _, c in resultado))) == sorted(map(tuple, (c for _, c in esperado)))
+
+
+def test_k_caminhos_e_preguicoso_e_valida_entrada():
+    grafo = montar_grafo_yen()
+
+    gerador = k_caminhos_minimos(grafo, "C", "H", 100)
+    assert next(gerador) == (5.0, ["C", "E", "F", "H"])
+
+    grafo.adicionar_no("Z")
+    assert list(k_caminhos_minimos(grafo, "C", "Z", 3)) == []
+    assert list(k_caminhos_minimos(grafo, "C", "inexistente", 3)) == []
+    assert list(k_caminhos_minimos(grafo, "C", "C", 3)) == [(0.0, ["C"])]
+
+    with pytest.raises(ValueError):
+        k_caminhos_minimos(grafo, "C", "H", 0)
+
+    grafo.adicionar_aresta("C", "Z", -1.0)
+    with pytest.raises(ValueError):
+        k_caminhos_minimos(grafo, "C", "H", 2)
@@ -0,0 +1,109 @@
+from pathlib import Path
+import sys
+import random
+
+import pytest
+from math import isinf
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+SRC_DIRS = [ROOT_DIR / "src"]
+for dir_path in SRC_DIRS:
+    if dir_path.exists():
+        sys.path.insert(0, str(dir_path))
+
+from graphs.graph import Graph
+from graphs.csr import obter_csr, dijkstra_ids
+from graphs.algorithms import dijkstra
+from graphs.landmarks import selecionar_marcos, salvar_marcos, carregar_marcos, a_estrela_alt
+
+
+def montar_grade(lado: int = 15) -> Graph:
+    grafo = Graph()
+    for i in range(lado):
+        for j in range(lado):
+            if i + 1 < lado:
+                grafo.adicionar_aresta(f"{i},{j}", f"{i + 1},{j}", 1.0 + (i * j) % 3)
+            if j + 1 < lado:
+                grafo.adicionar_aresta(f"{i},{j}", f"{i},{j + 1}", 1.0 + (i + j) % 2)
+    grafo.adicionar_aresta("X", "Y", 1.0)
+    return grafo
+
+
+def custo_do_caminho(grafo: Graph, caminho):
+    return sum(
+        min(peso for v, peso in grafo.vizinhos(a) if v == b)
+        for a, b in zip(caminho, caminho[1:])
+    )
+
+
+@pytest.mark.parametrize("estrategia", ["distante", "grau"])
+def test_a_estrela_alt_coincide_com_dijkstra(estrategia):
+    grafo = montar_grade()
+    marcos = selecionar_marcos(grafo, k=4, estrategia=estrategia)
+    rng = random.Random(1)
+    nos = grafo.obter_nos()
+
+    for _ in range(50):
+        origem, destino = rng.choice(nos), rng.choice(nos)
+        custo_esperado, _ = dijkstra(grafo, origem, destino)
+        custo, caminho = a_estrela_alt(grafo, origem, destino, marcos)
+        assert custo == pytest.approx(custo_esperado)
+        if caminho:
+            assert caminho[0] == origem and caminho[-1] == destino
+            assert custo_do_caminho(grafo, caminho) == pytest.approx(custo)
+
+
+def test_a_estrela_alt_expande_menos_nos_que_dijkstra():
+    grafo = montar_grade()
+    marcos = selecionar_marcos(grafo, k=4)
+    csr = obter_csr(grafo)
+
+    alt, uni = {}, {}
+    a_estrela_alt(grafo, "0,0", "14,14", marcos, estatisticas=alt)
+    dijkstra_ids(csr, csr.id_de("0,0"), csr.id_de("14,14"), estatisticas=uni)
+
+    assert alt["nos_expandidos"] < uni["nos_fixados"]
+
+
+def test_selecao_distante_escolhe_nos_distintos():
+    marcos = selecionar_marcos(montar_grade(), k=4)
+
+    nomes = marcos.nomes_marcos()
+    assert len(nomes) == len(set(nomes)) == 4
+    assert marcos.distancias.shape == (4, montar_grade().ordem())
+
+
+def test_a_estrela_alt_componentes_diferentes_e_casos_limite():
+    grafo = montar_grade()
+    marcos = selecionar_marcos(grafo, k=3)
+
+    custo, caminho = a_estrela_alt(grafo, "0,0", "X", marcos)
+    assert isinf(custo) and caminho == []
+    assert a_estrela_alt(grafo, "3,3", "3,3", marcos) == (0.0, ["3,3"])
+    custo, caminho = a_estrela_alt(grafo, "Z", "X", marcos)
+    assert isinf(custo) and caminho == []
+
+
+def test_salvar_e_carregar_marcos(tmp_path):
+    grafo = montar_grade()
+    marcos = selecionar_marcos(grafo, k=3)
+    caminho = tmp_path / "marcos.npz"
+
+    salvar_marcos(marcos, str(caminho))
+    carregados = carregar_marcos(str(caminho), grafo)
+
+    assert carregados.marcos == marcos.marcos
+    assert carregados.nomes == marcos.nomes
+    assert a_estrela_alt(grafo, "0,0", "5,9", carregados)[0] == pytest.approx(
+        dijkstra(grafo, "0,0", "5,9")[0]
+    )
+
+    outro = Graph()
+    outro.adicionar_aresta("A", "B")
+    with pytest.raises(ValueError):
+        carregar_marcos(str(caminho), outro)
+
+
+def test_estrategia_invalida():
+    with pytest.raises(ValueError):
+        selecionar_marcos(montar_grade(), estrategia="aleatoria")
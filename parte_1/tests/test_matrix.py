@@ -0,0 +1,81 @@
+from pathlib import Path
+import sys
+import pickle
+
+import numpy as np
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+SRC_DIRS = [ROOT_DIR / "src"]
+for dir_path in SRC_DIRS:
+    if dir_path.exists():
+        sys.path.insert(0, str(dir_path))
+
+from graphs.graph import Graph
+from graphs.csr import GrafoCSR
+from graphs.algorithms import dijkstra
+from graphs.matrix import matriz_distancias
+
+
+def montar_grafo_matriz() -> Graph:
+    grafo = Graph()
+    grafo.adicionar_aresta("A", "B", 1)
+    grafo.adicionar_aresta("A", "C", 4)
+    grafo.adicionar_aresta("B", "C", 2)
+    grafo.adicionar_aresta("B", "D", 6)
+    grafo.adicionar_aresta("C", "D", 3)
+    grafo.adicionar_aresta("C", "E", 2)
+    grafo.adicionar_aresta("D", "E", 1)
+    grafo.adicionar_no("Isolado")
+    return grafo
+
+
+def test_matriz_distancias_coincide_com_dijkstra_par_a_par():
+    grafo = montar_grafo_matriz()
+    origens = ["A", "C", "Isolado"]
+    destinos = grafo.obter_nos()
+
+    dist, pred = matriz_distancias(grafo, origens, destinos)
+
+    assert pred is None
+    assert dist.shape == (3, grafo.ordem())
+    for i, origem in enumerate(origens):
+        for j, destino in enumerate(destinos):
+            custo, _ = dijkstra(grafo, origem, destino)
+            assert dist[i, j] == pytest.approx(custo)
+
+
+def test_matriz_de_predecessores_reconstroi_caminhos():
+    grafo = montar_grafo_matriz()
+
+    _dist, pred = matriz_distancias(grafo, ["A"], ["E", "A", "Isolado"], predecessores=True)
+
+    assert grafo.nome_de(pred[0, 0]) == "C"
+    assert pred[0, 1] == -1
+    assert pred[0, 2] == -1
+
+
+def test_matriz_distancias_em_paralelo_igual_a_sequencial():
+    grafo = montar_grafo_matriz()
+    nos = grafo.obter_nos()
+
+    dist_seq, pred_seq = matriz_distancias(grafo, nos, predecessores=True)
+    dist_par, pred_par = matriz_distancias(grafo, nos, workers=2, predecessores=True)
+
+    assert np.array_equal(dist_seq, dist_par)
+    assert np.array_equal(pred_seq, pred_par)
+
+
+def test_matriz_distancias_erro_para_no_inexistente():
+    with pytest.raises(ValueError):
+        matriz_distancias(montar_grafo_matriz(), ["Z"])
+
+
+def test_grafo_csr_pode_ser_serializado():
+    csr = GrafoCSR.de_grafo(montar_grafo_matriz())
+
+    copia = pickle.loads(pickle.dumps(csr))
+
+    assert copia.obter_nos() == csr.obter_nos()
+    assert list(copia.alvos) == list(csr.alvos)
+    assert copia.versao == csr.versao
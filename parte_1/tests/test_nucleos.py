@@ -0,0 +1,94 @@
+from pathlib import Path
+import sys
+import random
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+SRC_DIRS = [ROOT_DIR / "src"]
+for dir_path in SRC_DIRS:
+    if dir_path.exists():
+        sys.path.insert(0, str(dir_path))
+
+from graphs.graph import Graph
+from graphs.nucleos import decomposicao_nucleos, degeneracao, subgrafo_nucleo
+
+
+def montar_grafo_nucleos() -> Graph:
+    grafo = Graph()
+    # K4 (núcleo 3) com uma cauda A-E-F (núcleo 1), um triângulo solto (núcleo 2) e um nó isolado
+    for u, v in [("A", "B"), ("A", "C"), ("A", "D"), ("B", "C"), ("B", "D"), ("C", "D")]:
+        grafo.adicionar_aresta(u, v, 1.0)
+    grafo.adicionar_aresta("A", "E", 2.0)
+    grafo.adicionar_aresta("E", "F", 3.0)
+    for u, v in [("X", "Y"), ("Y", "Z"), ("Z", "X")]:
+        grafo.adicionar_aresta(u, v, 1.0)
+    grafo.adicionar_no("I")
+    return grafo
+
+
+def nucleos_forca_bruta(grafo: Graph):
+    """Remove repetidamente nós de grau < k para cada k, sem baldes."""
+    vizinhos = {
+        no: {v for v, _ in grafo.vizinhos(no) if v != no}
+        for no in grafo.obter_nos()
+    }
+    nucleo = {no: 0 for no in vizinhos}
+    k = 1
+    restantes = set(vizinhos)
+    while restantes:
+        mudou = True
+        while mudou:
+            mudou = False
+            for no in list(restantes):
+                if len(vizinhos[no] & restantes) < k:
+                    restantes.discard(no)
+                    mudou = True
+        for no in restantes:
+            nucleo[no] = k
+        k += 1
+    return nucleo
+
+
+def test_decomposicao_nucleos_em_grafo_conhecido():
+    grafo = montar_grafo_nucleos()
+
+    nucleo, ordem = decomposicao_nucleos(grafo)
+
+    assert nucleo == {"A": 3, "B": 3, "C": 3, "D": 3, "E": 1, "F": 1, "X": 2, "Y": 2, "Z": 2, "I": 0}
+    assert sorted(ordem) == sorted(grafo.obter_nos())
+    assert degeneracao(grafo) == 3
+
+
+def test_ordem_de_degeneracao_deixa_no_maximo_k_vizinhos_a_frente():
+    rng = random.Random(5)
+    for _ in range(20):
+        grafo = Graph()
+        n = rng.randint(1, 40)
+        for i in range(n):
+            grafo.adicionar_no(i)
+        for _ in range(rng.randint(0, 120)):
+            grafo.adicionar_aresta(rng.randrange(n), rng.randrange(n), 1.0)
+
+        nucleo, ordem = decomposicao_nucleos(grafo)
+        posicao = {no: i for i, no in enumerate(ordem)}
+
+        assert nucleo == nucleos_forca_bruta(grafo)
+        for no in ordem:
+            depois = {v for v, _ in grafo.vizinhos(no) if posicao[v] > posicao[no]}
+            assert len(depois) <= nucleo[no]
+
+
+def test_subgrafo_nucleo_equivale_ao_subgrafo_induzido():
+    grafo = montar_grafo_nucleos()
+    grafo.adicionar_aresta("A", "B", 5.0)
+
+    nucleo, _ordem = decomposicao_nucleos(grafo)
+    for k in range(5):
+        sub = subgrafo_nucleo(grafo, k)
+        esperado = grafo.subgrafo_induzido([no for no in grafo.obter_nos() if nucleo[no] >= k])
+
+        assert set(sub.obter_nos()) == set(esperado.obter_nos())
+        for no in sub.obter_nos():
+            assert sorted(sub.vizinhos(no)) == sorted(esperado.vizinhos(no))
+
+    assert set(subgrafo_nucleo(grafo, 3).obter_nos()) == {"A", "B", "C", "D"}
+    assert subgrafo_nucleo(grafo, 4).ordem() == 0
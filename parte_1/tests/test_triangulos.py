@@ -0,0 +1,60 @@
+from pathlib import Path
+import sys
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+SRC_DIRS = [ROOT_DIR / "src"]
+for dir_path in SRC_DIRS:
+    if dir_path.exists():
+        sys.path.insert(0, str(dir_path))
+
+from graphs.graph import Graph
+from graphs.triangulos import contar_triangulos
+
+
+def test_triangulos_em_grafo_conhecido():
+    grafo = Graph()
+    # K4 em A, B, C, D mais a cauda D-E
+    for u, v in [("A", "B"), ("A", "C"), ("A", "D"), ("B", "C"), ("B", "D"), ("C", "D"), ("D", "E")]:
+        grafo.adicionar_aresta(u, v, 1.0)
+    grafo.adicionar_aresta("A", "B", 2.0)
+    grafo.adicionar_aresta("E", "E", 1.0)
+
+    resultado = contar_triangulos(grafo)
+    por_no = resultado.por_no()
+
+    assert resultado.total() == 4
+    assert por_no["A"]["triangulos"] == 3
+    assert por_no["D"]["triangulos"] == 3
+    assert por_no["E"]["triangulos"] == 0
+    assert por_no["A"]["agrupamento"] == pytest.approx(1.0)
+    assert por_no["D"]["agrupamento"] == pytest.approx(0.5)
+    assert por_no["E"]["agrupamento"] == 0.0
+    # 3 * 4 triângulos / (3 + 3 + 3 + 6 + 0) triplas conectadas
+    assert resultado.transitividade() == pytest.approx(12 / 15)
+
+
+def test_ego_por_triangulos_igual_ao_subgrafo_induzido(montar_grafo_aleatorio):
+    for semente in range(10):
+        grafo = montar_grafo_aleatorio(25, 70, semente, prefixo=None, lacos=True)
+        por_no = contar_triangulos(grafo).por_no()
+
+        for no in grafo.obter_nos():
+            vizinhos = {v for v, _ in grafo.vizinhos(no) if v != no}
+            ego = grafo.subgrafo_induzido([no] + list(vizinhos))
+            lacos = sum(1 for v in ego.obter_nos() for w, _ in ego.vizinhos(v) if v == w) // 2
+
+            assert por_no[no]["ordem_ego"] == ego.ordem()
+            assert por_no[no]["tamanho_ego"] == ego.tamanho() - lacos
+
+
+def test_triangulos_conferem_com_forca_bruta(montar_grafo_aleatorio):
+    grafo = montar_grafo_aleatorio(30, 120, 7, prefixo=None, lacos=True)
+    vizinhos = {no: {v for v, _ in grafo.vizinhos(no) if v != no} for no in grafo.obter_nos()}
+
+    por_no = contar_triangulos(grafo).por_no()
+
+    for no, vs in vizinhos.items():
+        esperado = sum(1 for u in vs for w in vs if u < w and w in vizinhos[u])
+        assert por_no[no]["triangulos"] == esperado
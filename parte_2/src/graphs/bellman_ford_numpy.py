@@ -0,0 +1,73 @@
+import numpy as np
+from .graph import Graph
+from .csr import GrafoCSR, _ciclo_em_anterior, _indice_origem, obter_csr
+
+
+def arrays_arestas(csr: GrafoCSR):
+    """Retorna os arrays paralelos (u, v, w) das arestas do CSR, calculados uma única vez."""
+    if "arestas" not in csr.derivados:
+        offsets = np.frombuffer(csr.offsets, dtype=np.int64)
+        u = np.repeat(np.arange(csr.ordem(), dtype=np.int64), np.diff(offsets))
+        v = np.frombuffer(csr.alvos, dtype=np.int32).astype(np.int64)
+        w = np.frombuffer(csr.pesos, dtype=np.float64)
+        csr.derivados["arestas"] = (u, v, w)
+    return csr.derivados["arestas"]
+
+
+def bellman_ford_numpy_ids(csr: GrafoCSR, s: int, estatisticas: dict = None):
+    """Bellman-Ford vetorizado; retorna (dist, anterior, ciclo) como arrays por id.
+
+    Cada rodada relaxa de uma vez as arestas que saem de nós melhorados na rodada
+    anterior, com ``np.minimum.at`` sobre o destino. Entre arestas empatadas, o
+    predecessor é a primeira na ordem do CSR. Se ainda houver melhora após ``n - 1``
+    rodadas, ``ciclo`` traz os ids de um ciclo negativo (fechado).
+    Se ``estatisticas`` for informado, recebe as rodadas e as arestas examinadas.
+    """
+    u, v, w = arrays_arestas(csr)
+    n = csr.ordem()
+
+    dist = np.full(n, np.inf)
+    anterior = np.full(n, -1, dtype=np.int64)
+    dist[s] = 0.0
+    ativos = np.zeros(n, dtype=bool)
+    ativos[s] = True
+    rodadas = 0
+    relaxacoes = 0
+
+    while ativos.any() and rodadas < n:
+        rodadas += 1
+        arestas = np.flatnonzero(ativos[u])
+        relaxacoes += len(arestas)
+        origem, destino = u[arestas], v[arestas]
+        candidato = dist[origem] + w[arestas]
+
+        novo = dist.copy()
+        np.minimum.at(novo, destino, candidato)
+        ativos = novo < dist
+
+        vencedoras = np.flatnonzero(ativos[destino] & (candidato == novo[destino]))
+        destinos_vencedores, primeira = np.unique(destino[vencedoras], return_index=True)
+        anterior[destinos_vencedores] = origem[vencedoras[primeira]]
+        dist = novo
+
+    ciclo = []
+    if ativos.any():
+        ciclo = _ciclo_em_anterior(anterior.tolist(), int(np.flatnonzero(ativos)[0]))
+
+    if estatisticas is not None:
+        estatisticas["rodadas"] = rodadas
+        estatisticas["relaxacoes"] = relaxacoes
+    return dist, anterior, ciclo
+
+
+def bellman_ford_numpy(grafo: Graph, origem: str, estatisticas: dict = None):
+    """Bellman-Ford vetorizado em NumPy, no contrato de ``bellman_ford``."""
+    csr = obter_csr(grafo)
+    dist, anterior, ciclo = bellman_ford_numpy_ids(csr, _indice_origem(csr, origem), estatisticas)
+
+    nomes = csr.nomes
+    if estatisticas is not None:
+        estatisticas["ciclo_negativo"] = [nomes[i] for i in ciclo]
+    dist_nomes = {nomes[i]: float(d) for i, d in enumerate(dist)}
+    anterior_nomes = {nomes[i]: (nomes[a] if a >= 0 else None) for i, a in enumerate(anterior.tolist())}
+    return dist_nomes, anterior_nomes, bool(ciclo)
@@ -0,0 +1,239 @@
+import random
+from array import array
+from collections import Counter
+from math import log
+from .graph import Graph
+from .csr import GrafoCSR, obter_csr
+from .centralidade import adjacencia_simples
+
+
+def _renumerar(rotulo):
+    """Renumera os rótulos em 0..k-1, da maior comunidade para a menor (empate: menor id)."""
+    tamanhos = Counter(rotulo)
+    primeiro = {}
+    for i, c in enumerate(rotulo):
+        primeiro.setdefault(c, i)
+    ordem = sorted(tamanhos, key=lambda c: (-tamanhos[c], primeiro[c]))
+    novo = {c: i for i, c in enumerate(ordem)}
+    return [novo[c] for c in rotulo]
+
+
+def _grafo_sem_pesos(csr: GrafoCSR):
+    """Retorna (offsets, alvos, pesos, lacos) do grafo simples com peso 1 por aresta."""
+    offsets, alvos, _pesos = adjacencia_simples(csr)
+    return offsets, alvos, array("d", [1.0] * len(alvos)), [0.0] * csr.ordem()
+
+
+def modularidade_ids(offsets, alvos, pesos, lacos, rotulo, resolucao: float = 1.0):
+    """Modularidade Q = soma sobre as comunidades de in_c / 2m - resolucao * (tot_c / 2m)^2.
+
+    ``lacos[i]`` é o peso A_ii do nó i (já contando as duas pontas).
+    """
+    n = len(rotulo)
+    interno = {}
+    total = {}
+    for i in range(n):
+        c = rotulo[i]
+        grau = lacos[i]
+        dentro = lacos[i]
+        for k in range(offsets[i], offsets[i + 1]):
+            grau += pesos[k]
+            if rotulo[alvos[k]] == c:
+                dentro += pesos[k]
+        interno[c] = interno.get(c, 0.0) + dentro
+        total[c] = total.get(c, 0.0) + grau
+
+    m2 = sum(total.values())
+    if m2 == 0:
+        return 0.0
+    return sum(interno[c] / m2 - resolucao * (total[c] / m2) ** 2 for c in total)
+
+
+def _mover_nos(offsets, alvos, pesos, grau, m2: float, resolucao: float, rng):
+    """Fase local do Louvain: move cada nó para a comunidade vizinha de maior ganho.
+
+    ``total[c]`` guarda a soma dos graus de cada comunidade e é atualizado em O(1)
+    a cada movimento, então o ganho de levar i para c é só
+    ``w(i, c) - resolucao * total[c] * grau[i] / 2m``. Retorna (rotulo, houve_movimento).
+    """
+    n = len(grau)
+    rotulo = list(range(n))
+    total = list(grau)
+    ordem = list(range(n))
+    rng.shuffle(ordem)
+    houve_movimento = False
+
+    movidos = 1
+    while movidos:
+        movidos = 0
+        for i in ordem:
+            atual = rotulo[i]
+            grau_i = grau[i]
+            ligacoes = {}
+            for k in range(offsets[i], offsets[i + 1]):
+                c = rotulo[alvos[k]]
+                ligacoes[c] = ligacoes.get(c, 0.0) + pesos[k]
+
+            total[atual] -= grau_i
+            fator = resolucao * grau_i / m2
+            melhor = atual
+            melhor_ganho = ligacoes.get(atual, 0.0) - total[atual] * fator
+            for c, peso in ligacoes.items():
+                ganho = peso - total[c] * fator
+                if ganho > melhor_ganho + 1e-12:
+                    melhor, melhor_ganho = c, ganho
+            total[melhor] += grau_i
+
+            if melhor != atual:
+                rotulo[i] = melhor
+                movidos += 1
+                houve_movimento = True
+
+    return _renumerar(rotulo), houve_movimento
+
+
+def _agregar(offsets, alvos, pesos, lacos, rotulo):
+    """Contrai cada comunidade em um nó; arestas internas viram laço do novo nó."""
+    k = max(rotulo) + 1
+    novos_lacos = [0.0] * k
+    ligacoes = [{} for _ in range(k)]
+    for i in range(len(rotulo)):
+        c = rotulo[i]
+        novos_lacos[c] += lacos[i]
+        vizinhas = ligacoes[c]
+        for j in range(offsets[i], offsets[i + 1]):
+            d = rotulo[alvos[j]]
+            if d == c:
+                novos_lacos[c] += pesos[j]
+            else:
+                vizinhas[d] = vizinhas.get(d, 0.0) + pesos[j]
+
+    novos_offsets = array("q", [0])
+    novos_alvos = array("i")
+    novos_pesos = array("d")
+    for vizinhas in ligacoes:
+        novos_alvos.extend(vizinhas.keys())
+        novos_pesos.extend(vizinhas.values())
+        novos_offsets.append(len(novos_alvos))
+    return novos_offsets, novos_alvos, novos_pesos, novos_lacos
+
+
+def louvain_ids(offsets, alvos, pesos, lacos, resolucao: float = 1.0, semente: int = 42):
+    """Louvain sobre arrays de ids; retorna o rótulo de comunidade de cada nó original.
+
+    Alterna a fase local (``_mover_nos``) com a contração das comunidades em nós
+    até que nenhum nó mude de comunidade.
+    """
+    rng = random.Random(semente)
+    n = len(lacos)
+    membro = list(range(n))
+    grau = [
+        lacos[i] + sum(pesos[offsets[i]:offsets[i + 1]])
+        for i in range(n)
+    ]
+    m2 = sum(grau)
+    if m2 == 0:
+        return _renumerar(membro)
+
+    while True:
+        rotulo, houve_movimento = _mover_nos(offsets, alvos, pesos, grau, m2, resolucao, rng)
+        if not houve_movimento:
+            break
+        membro = [rotulo[c] for c in membro]
+        offsets, alvos, pesos, lacos = _agregar(offsets, alvos, pesos, lacos, rotulo)
+        grau = [
+            lacos[c] + sum(pesos[offsets[c]:offsets[c + 1]])
+            for c in range(len(lacos))
+        ]
+
+    return _renumerar(membro)
+
+
+def propagacao_rotulos_ids(offsets, alvos, n: int, semente: int = 42, max_iteracoes: int = 100):
+    """Propagação de rótulos assíncrona em O(V + E) por rodada.
+
+    Em ordem aleatória, cada nó adota o rótulo mais frequente entre os vizinhos
+    (empates sorteados, mantendo o atual se ele estiver entre os mais frequentes).
+    Para quando uma rodada inteira não muda nenhum rótulo.
+    """
+    rng = random.Random(semente)
+    rotulo = list(range(n))
+    ordem = list(range(n))
+
+    for _ in range(max_iteracoes):
+        rng.shuffle(ordem)
+        mudou = False
+        for i in ordem:
+            inicio, fim = offsets[i], offsets[i + 1]
+            if inicio == fim:
+                continue
+            contagem = Counter(rotulo[j] for j in alvos[inicio:fim])
+            maior = max(contagem.values())
+            if contagem.get(rotulo[i]) == maior:
+                continue
+            candidatos = [c for c, q in contagem.items() if q == maior]
+            rotulo[i] = candidatos[0] if len(candidatos) == 1 else rng.choice(candidatos)
+            mudou = True
+        if not mudou:
+            break
+
+    return _renumerar(rotulo)
+
+
+def _traduzir(csr: GrafoCSR, rotulo, offsets, alvos, pesos, lacos, resolucao: float):
+    """Retorna (comunidade por nome, modularidade)."""
+    q = modularidade_ids(offsets, alvos, pesos, lacos, rotulo, resolucao)
+    return {csr.nomes[i]: c for i, c in enumerate(rotulo)}, q
+
+
+def louvain(grafo: Graph, resolucao: float = 1.0, semente: int = 42):
+    """Detecta comunidades pelo método de Louvain no grafo simples, sem pesos.
+
+    Retorna (comunidade, modularidade): o rótulo 0..k-1 de cada nó, da maior
+    comunidade para a menor, e a modularidade da partição.
+    """
+    csr = obter_csr(grafo)
+    offsets, alvos, pesos, lacos = _grafo_sem_pesos(csr)
+    rotulo = louvain_ids(offsets, alvos, pesos, lacos, resolucao, semente)
+    return _traduzir(csr, rotulo, offsets, alvos, pesos, lacos, resolucao)
+
+
+def propagacao_rotulos(grafo: Graph, semente: int = 42, max_iteracoes: int = 100):
+    """Detecta comunidades por propagação de rótulos, no contrato de ``louvain``."""
+    csr = obter_csr(grafo)
+    offsets, alvos, pesos, lacos = _grafo_sem_pesos(csr)
+    rotulo = propagacao_rotulos_ids(offsets, alvos, csr.ordem(), semente, max_iteracoes)
+    return _traduzir(csr, rotulo, offsets, alvos, pesos, lacos, 1.0)
+
+
+def modularidade(grafo: Graph, comunidade: dict, resolucao: float = 1.0):
+    """Modularidade de uma partição qualquer (nó -> rótulo) no grafo simples, sem pesos."""
+    csr = obter_csr(grafo)
+    offsets, alvos, pesos, lacos = _grafo_sem_pesos(csr)
+    rotulo = [comunidade[no] for no in csr.nomes]
+    return modularidade_ids(offsets, alvos, pesos, lacos, rotulo, resolucao)
+
+
+def informacao_mutua_normalizada(particao_a: dict, particao_b: dict):
+    """NMI entre duas partições (nó -> rótulo), sobre os nós presentes em ambas.
+
+    Vale 1 quando as partições coincidem e 0 quando são independentes.
+    """
+    nos = [no for no in particao_a if no in particao_b]
+    n = len(nos)
+    if n == 0:
+        return 0.0
+
+    conjunta = Counter((particao_a[no], particao_b[no]) for no in nos)
+    marg_a = Counter(particao_a[no] for no in nos)
+    marg_b = Counter(particao_b[no] for no in nos)
+
+    entropia_a = -sum(q / n * log(q / n) for q in marg_a.values())
+    entropia_b = -sum(q / n * log(q / n) for q in marg_b.values())
+    if entropia_a + entropia_b == 0:
+        return 1.0
+    mutua = sum(
+        q / n * log(q * n / (marg_a[a] * marg_b[b]))
+        for (a, b), q in conjunta.items()
+    )
+    return 2 * mutua / (entropia_a + entropia_b)
@@ -0,0 +1,138 @@
+import heapq
+from array import array
+from fractions import Fraction
+from math import gcd, inf
+from .graph import Graph
+from .csr import GrafoCSR, caminho_ids, dijkstra_ids, obter_csr, postos_por_nome
+from .componentes import indice_componentes
+
+LIMITE_BALDES = 4096
+
+
+def detectar_quantum(pesos, limite_baldes: int = LIMITE_BALDES):
+    """Retorna o maior q tal que todo peso é múltiplo inteiro de q, ou None.
+
+    Também retorna None se algum peso for negativo ou se o maior peso exigir mais
+    de ``limite_baldes`` baldes na fila circular.
+    """
+    numerador, denominador = 0, 1
+    maior = 0.0
+    for peso in pesos:
+        if peso < 0 or peso == inf:
+            return None
+        fracao = Fraction(peso).limit_denominator(1000)
+        if abs(float(fracao) - peso) > 1e-9 * max(1.0, peso):
+            return None
+        numerador = gcd(numerador * fracao.denominator, fracao.numerator * denominador)
+        denominador *= fracao.denominator
+        divisor = gcd(numerador, denominador)
+        if divisor > 1:
+            numerador //= divisor
+            denominador //= divisor
+        maior = max(maior, peso)
+
+    if numerador == 0:
+        return None
+
+    quantum = numerador / denominador
+    if maior / quantum > limite_baldes:
+        return None
+    return quantum
+
+
+def _pesos_inteiros(csr: GrafoCSR):
+    """Retorna (quantum, pesos inteiros) do CSR, calculados uma única vez.
+
+    O quantum só é aceito se cada peso for exatamente ``inteiro * quantum`` e
+    toda soma de pesos for representável sem arredondamento; assim as somas em
+    ponto flutuante de ``dijkstra_ids`` empatam e desempatam como as inteiras.
+    Caso contrário retorna (None, None). Se as estatísticas do grafo indicam um
+    único peso positivo, ele é o quantum e a varredura de ``detectar_quantum`` é evitada.
+    """
+    if "dial" not in csr.derivados:
+        if csr.peso_minimo is not None and csr.peso_minimo == csr.peso_maximo and csr.peso_minimo > 0:
+            quantum = csr.peso_minimo
+            inteiros = array("i", [1]) * len(csr.pesos)
+            exato = Fraction(quantum).numerator * len(inteiros) < 2 ** 53
+        else:
+            quantum = detectar_quantum(csr.pesos)
+            inteiros = None
+            exato = False
+            if quantum is not None:
+                inteiros = array("i", (round(p / quantum) for p in csr.pesos))
+                multiplo = Fraction(quantum)
+                exato = (
+                    all(Fraction(p) == i * multiplo for p, i in zip(csr.pesos, inteiros))
+                    and multiplo.numerator * sum(inteiros) < 2 ** 53
+                )
+        if not exato:
+            quantum, inteiros = None, None
+        csr.derivados["dial"] = (quantum, inteiros)
+    return csr.derivados["dial"]
+
+
+def dial_ids(csr: GrafoCSR, s: int, t: int = -1):
+    """Caminhos mínimos com fila de baldes (Dial); retorna (dist, anterior) por id.
+
+    Exige que todos os pesos sejam múltiplos exatos de um quantum pequeno (veja
+    ``_pesos_inteiros``); caso contrário recorre a ``dijkstra_ids``. Dentro de
+    cada balde os nós saem pela ordem dos nomes, o que reproduz as mesmas
+    distâncias e predecessores de ``dijkstra_ids``.
+    """
+    if csr.tem_peso_negativo:
+        raise ValueError("Dijkstra não aceita pesos negativos.")
+
+    quantum, inteiros = _pesos_inteiros(csr)
+    if quantum is None:
+        return dijkstra_ids(csr, s, t)
+
+    offsets, alvos = csr.offsets, csr.alvos
+    posto, por_posto = postos_por_nome(csr)
+    n = csr.ordem()
+    num_baldes = max(inteiros, default=0) + 1
+
+    dist = [inf] * n
+    anterior = [-1] * n
+    dist[s] = 0
+    baldes = [[] for _ in range(num_baldes)]
+    baldes[0].append(posto[s])
+    pendentes = 1
+    atual = 0
+
+    while pendentes:
+        balde = baldes[atual % num_baldes]
+        while balde:
+            u = por_posto[heapq.heappop(balde)]
+            pendentes -= 1
+            if dist[u] != atual:
+                continue
+            if u == t:
+                pendentes = 0
+                break
+            for k in range(offsets[u], offsets[u + 1]):
+                v = alvos[k]
+                novo_custo = atual + inteiros[k]
+                if novo_custo < dist[v]:
+                    dist[v] = novo_custo
+                    anterior[v] = u
+                    heapq.heappush(baldes[novo_custo % num_baldes], posto[v])
+                    pendentes += 1
+        atual += 1
+
+    return [d * quantum if d != inf else inf for d in dist], anterior
+
+
+def dijkstra_dial(grafo: Graph, origem: str, destino: str):
+    """Caminho mínimo entre origem e destino com fila de baldes, no contrato de ``dijkstra``."""
+    csr = obter_csr(grafo)
+
+    s = csr.id_de(origem)
+    t = csr.id_de(destino)
+    if s is None or t is None or not indice_componentes(csr).mesma_componente(origem, destino):
+        return inf, []
+
+    dist, anterior = dial_ids(csr, s, t)
+    if dist[t] == inf:
+        return inf, []
+
+    return dist[t], [csr.nome_de(i) for i in caminho_ids(anterior, s, t)]
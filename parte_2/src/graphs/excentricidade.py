@@ -0,0 +1,141 @@
+from math import inf
+from .graph import Graph
+from .csr import GrafoCSR, obter_csr, bfs_ids
+from .componentes import indice_componentes
+
+
+class Excentricidades:
+    """Limites de excentricidade (em número de arestas) dos nós de uma componente conexa.
+
+    ``inferior[no] <= excentricidade(no) <= superior[no]``; diâmetro e raio ficam
+    entre os respectivos mínimo e máximo e são exatos quando ``exato()``.
+    """
+
+    def __init__(self, inferior, superior, diametro, raio, buscas, csr: GrafoCSR):
+        """Guarda os limites por nó, os intervalos (mínimo, máximo) de diâmetro e raio, o número de BFS e o CSR."""
+        self.inferior = inferior
+        self.superior = superior
+        self.diametro_minimo, self.diametro_maximo = diametro
+        self.raio_minimo, self.raio_maximo = raio
+        self.buscas = buscas
+        self.csr = csr
+
+    def exato(self):
+        """Retorna True se diâmetro e raio foram determinados exatamente."""
+        return self.diametro_minimo == self.diametro_maximo and self.raio_minimo == self.raio_maximo
+
+    def diametro(self):
+        """Retorna o diâmetro (o limite inferior, se a busca foi interrompida)."""
+        return self.diametro_minimo
+
+    def raio(self):
+        """Retorna o raio (o limite superior, se a busca foi interrompida)."""
+        return self.raio_maximo
+
+    def _fixar(self, nos):
+        """Calcula com uma BFS a excentricidade exata dos nós cujos limites ainda diferem."""
+        for no in nos:
+            if self.inferior[no] != self.superior[no]:
+                _pai, nivel, ordem_visita = bfs_ids(self.csr, self.csr.indice[no])
+                self.inferior[no] = self.superior[no] = nivel[ordem_visita[-1]]
+                self.buscas += 1
+
+    def centro(self):
+        """Nós cuja excentricidade é igual ao raio.
+
+        Os candidatos (``inferior <= raio``) que ainda têm limites abertos recebem
+        uma BFS cada; depois disso o raio também fica exato.
+        """
+        candidatos = [no for no, e in self.inferior.items() if e <= self.raio_maximo]
+        self._fixar(candidatos)
+        raio = min((self.superior[no] for no in candidatos), default=0)
+        self.raio_minimo = self.raio_maximo = raio
+        return [no for no in candidatos if self.superior[no] == raio]
+
+    def periferia(self):
+        """Nós cuja excentricidade é igual ao diâmetro.
+
+        Os candidatos (``superior >= diâmetro``) que ainda têm limites abertos
+        recebem uma BFS cada; depois disso o diâmetro também fica exato.
+        """
+        candidatos = [no for no, e in self.superior.items() if e >= self.diametro_minimo]
+        self._fixar(candidatos)
+        diametro = max((self.inferior[no] for no in candidatos), default=0)
+        self.diametro_minimo = self.diametro_maximo = diametro
+        return [no for no in candidatos if self.inferior[no] == diametro]
+
+
+def limites_excentricidade_ids(csr: GrafoCSR, membros, max_buscas: int = None):
+    """Diâmetro e raio exatos da componente ``membros`` com poucas BFS (Takes e Kosters).
+
+    Cada BFS a partir de v, com excentricidade e, dá para todo w os limites
+    max(d(v, w), e - d(v, w)) <= exc(w) <= e + d(v, w). As fontes alternam entre o
+    nó de maior limite superior (a segunda BFS é a varredura dupla clássica: o nó
+    mais distante da primeira) e o de menor limite inferior. Nós que não podem
+    mais mudar diâmetro nem raio saem dos candidatos. Com ``max_buscas``, para
+    antes e devolve só os limites.
+    Retorna (inferior, superior, (diam_min, diam_max), (raio_min, raio_max), buscas).
+    """
+    if not membros:
+        return {}, {}, (0, 0), (0, 0), 0
+
+    offsets = csr.offsets
+    grau = {v: offsets[v + 1] - offsets[v] for v in membros}
+    inferior = {v: 0 for v in membros}
+    superior = {v: inf for v in membros}
+    candidatos = set(membros)
+    diam_min, diam_max = 0, inf
+    raio_min, raio_max = 0, inf
+    buscas = 0
+    pelo_maior = True
+
+    while candidatos and (diam_min < diam_max or raio_min < raio_max):
+        if max_buscas is not None and buscas >= max_buscas:
+            break
+        if buscas == 0:
+            v = max(candidatos, key=lambda w: (grau[w], -w))
+        elif pelo_maior:
+            v = max(candidatos, key=lambda w: (superior[w], grau[w], -w))
+        else:
+            v = min(candidatos, key=lambda w: (inferior[w], -grau[w], w))
+        pelo_maior = not pelo_maior
+        buscas += 1
+
+        _pai, nivel, ordem_visita = bfs_ids(csr, v)
+        e = nivel[ordem_visita[-1]]
+        for w in candidatos:
+            d = nivel[w]
+            inferior[w] = max(inferior[w], d, e - d)
+            superior[w] = min(superior[w], e + d)
+
+        diam_min = max(diam_min, max(inferior[w] for w in candidatos))
+        raio_max = min(raio_max, min(superior[w] for w in candidatos))
+        candidatos = {
+            w for w in candidatos
+            if not (superior[w] <= diam_min and inferior[w] >= raio_max)
+        }
+        diam_max = max([diam_min] + [superior[w] for w in candidatos])
+        raio_min = min([raio_max] + [inferior[w] for w in candidatos])
+
+    return inferior, superior, (diam_min, diam_max), (raio_min, raio_max), buscas
+
+
+def excentricidades(grafo: Graph, max_buscas: int = None):
+    """Diâmetro, raio e limites de excentricidade da maior componente conexa, sem pesos.
+
+    Em grafos reais costuma precisar de poucas BFS; ``max_buscas`` limita esse
+    número e devolve uma aproximação com limites garantidos (veja ``exato()``).
+    """
+    csr = obter_csr(grafo)
+    membros = [csr.indice[no] for no in indice_componentes(grafo).componente_gigante()]
+    inferior, superior, diametro, raio, buscas = limites_excentricidade_ids(csr, membros, max_buscas)
+
+    nomes = csr.nomes
+    return Excentricidades(
+        {nomes[v]: e for v, e in inferior.items()},
+        {nomes[v]: e for v, e in superior.items()},
+        diametro,
+        raio,
+        buscas,
+        csr,
+    )
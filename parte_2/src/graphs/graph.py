@@ -4,24 +4,53 @@ class Graph:
     def __init__(self):
         """Cria um grafo vazio."""
         self.adjacencia = {}
+        self.ids = {}
+        self.nomes = []
+        self.versao = 0
+        self.peso_minimo = None
+        self.peso_maximo = None
+        self.tem_peso_negativo = False
         self.vitorias = {}
+        self.derrotas = []
 
     def adicionar_no(self, lutador):
         """Adiciona um nó (lutador) ao grafo."""
         if lutador not in self.adjacencia:
             self.adjacencia[lutador] = []
+            self.ids[lutador] = len(self.nomes)
+            self.nomes.append(lutador)
+            self.versao += 1
             self.vitorias[lutador] = 0
 
     def obter_nos(self):
         """Retorna a lista de todos os nós (lutadores) do grafo."""
         return list(self.adjacencia.keys())
 
+    def id_de(self, lutador):
+        """Retorna o id inteiro denso de um nó, ou None se ele não existir."""
+        return self.ids.get(lutador)
+
+    def nome_de(self, id_no):
+        """Retorna o nó correspondente a um id inteiro."""
+        return self.nomes[id_no]
+
     def adicionar_aresta(self, lutador1, lutador2, peso=1.0):
         """Adiciona uma aresta não-direcionada entre dois lutadores."""
         self.adicionar_no(lutador1)
         self.adicionar_no(lutador2)
         self.adjacencia[lutador1].append((lutador2, peso))
         self.adjacencia[lutador2].append((lutador1, peso))
+        self._atualizar_estatisticas_pesos(peso)
+
+    def _atualizar_estatisticas_pesos(self, peso):
+        """Atualiza em O(1) os pesos mínimo/máximo, a flag de peso negativo e a versão."""
+        peso = float(peso)
+        if self.peso_minimo is None or peso < self.peso_minimo:
+            self.peso_minimo = peso
+        if self.peso_maximo is None or peso > self.peso_maximo:
+            self.peso_maximo = peso
+        self.tem_peso_negativo = self.peso_minimo < 0
+        self.versao += 1
 
     def grau(self, lutador):
         """Retorna o grau de um lutador (número de lutas/conexões)."""
@@ -57,6 +86,12 @@ class Graph:
             self.adicionar_no(lutador)
             self.vitorias[lutador] = 1
     
+    def registrar_derrota(self, vencedor, perdedor):
+        """Registra a aresta dirigida vencedor -> perdedor de uma luta decidida."""
+        self.adicionar_no(vencedor)
+        self.adicionar_no(perdedor)
+        self.derrotas.append((vencedor, perdedor))
+
     def obter_vitorias(self, lutador):
         """Retorna o número de vitórias de um lutador."""
         return self.vitorias.get(lutador, 0)
@@ -49,9 +49,35 @@ def carregar_grafo_ufc(caminho_csv: str) -> Graph:
         if pd.notna(vencedor) and str(vencedor).strip() != '':
             vencedor_str = str(vencedor).strip()
             grafo.registrar_vitoria(vencedor_str)
+            if vencedor_str == lutador_r:
+                grafo.registrar_derrota(lutador_r, lutador_b)
+            elif vencedor_str == lutador_b:
+                grafo.registrar_derrota(lutador_b, lutador_r)
     
     return grafo
 
+
+def normalizar_categoria(fight_type) -> str:
+    """Reduz o Fight_type à categoria de peso (ex.: 'UFC Lightweight Title Bout' -> 'Lightweight')."""
+    return str(fight_type).replace(' Bout', '').replace(' Title', '').replace('UFC ', '').strip()
+
+
+def carregar_categorias_ufc(caminho_csv: str) -> dict:
+    """Retorna dicionário mapeando cada lutador para a categoria em que mais lutou."""
+    df = pd.read_csv(caminho_csv, sep=';', encoding='utf-8')
+
+    contagem = {}
+    for _, linha in df.iterrows():
+        categoria = normalizar_categoria(linha['Fight_type'])
+        for lutador in (linha['R_fighter'], linha['B_fighter']):
+            por_categoria = contagem.setdefault(lutador, {})
+            por_categoria[categoria] = por_categoria.get(categoria, 0) + 1
+
+    return {
+        lutador: max(sorted(por_categoria), key=por_categoria.get)
+        for lutador, por_categoria in contagem.items()
+    }
+
 if __name__ == "__main__":
     
     
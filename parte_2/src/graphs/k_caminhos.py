@@ -0,0 +1,146 @@
+import heapq
+from math import inf
+from .graph import Graph
+from .csr import GrafoCSR, obter_csr, dijkstra_ids
+from .componentes import indice_componentes
+
+
+def _peso_arco(csr: GrafoCSR, u: int, v: int):
+    """Menor peso entre as arestas paralelas que ligam u a v."""
+    return min(
+        csr.pesos[k]
+        for k in range(csr.offsets[u], csr.offsets[u + 1])
+        if csr.alvos[k] == v
+    )
+
+
+def _seguir_arvore(s: int, t: int, proximo, bloqueado, proibidos):
+    """Caminho de s a t pela árvore de caminhos mínimos, ou None se ela cruzar a máscara."""
+    caminho = [s]
+    u = s
+    while u != t:
+        v = proximo[u]
+        if v < 0 or bloqueado[v] or (u == s and v in proibidos):
+            return None
+        caminho.append(v)
+        u = v
+    return caminho
+
+
+def _a_estrela_mascarado(csr: GrafoCSR, s: int, t: int, h, bloqueado, proibidos):
+    """A* de s a t guiado pelas distâncias exatas até t no grafo sem máscara.
+
+    Ignora os nós com ``bloqueado[v]`` e os arcos s -> v com v em ``proibidos``.
+    Como a máscara só aumenta distâncias, ``h`` continua admissível e consistente.
+    Retorna (custo, caminho) ou (inf, []).
+    """
+    offsets, alvos, pesos = csr.offsets, csr.alvos, csr.pesos
+    dist = {s: 0.0}
+    anterior = {}
+    fechados = set()
+    fila = [(h[s], 0.0, s)]
+
+    while fila:
+        _estimativa, custo, u = heapq.heappop(fila)
+        if u in fechados:
+            continue
+        if u == t:
+            caminho = [t]
+            while caminho[-1] != s:
+                caminho.append(anterior[caminho[-1]])
+            caminho.reverse()
+            return custo, caminho
+        fechados.add(u)
+
+        for k in range(offsets[u], offsets[u + 1]):
+            v = alvos[k]
+            if bloqueado[v] or h[v] == inf or (u == s and v in proibidos):
+                continue
+            novo_custo = custo + pesos[k]
+            if novo_custo < dist.get(v, inf):
+                dist[v] = novo_custo
+                anterior[v] = u
+                heapq.heappush(fila, (novo_custo + h[v], novo_custo, v))
+
+    return inf, []
+
+
+def k_caminhos_ids(csr: GrafoCSR, s: int, t: int, k: int):
+    """Algoritmo de Yen sobre ids: gera até k pares (custo, caminho) sem ciclos, em ordem de custo.
+
+    Uma única árvore de caminhos mínimos até t é calculada no início e reaproveitada
+    por todos os desvios: se o caminho pela árvore a partir do nó de desvio não cruza
+    a máscara, ele já é o desvio ótimo; senão, um A* guiado pelas distâncias da
+    árvore resolve o desvio. Os nós da raiz e os arcos já usados são mascarados
+    em vez de removidos de uma cópia do grafo.
+    """
+    h, proximo = dijkstra_ids(csr, t)
+    if h[s] == inf:
+        return
+
+    encontrados = [(h[s], _seguir_arvore(s, t, proximo, [False] * csr.ordem(), ()))]
+    yield encontrados[0]
+
+    candidatos = []
+    vistos = {tuple(encontrados[0][1])}
+    bloqueado = [False] * csr.ordem()
+
+    while len(encontrados) < k:
+        caminho_anterior = encontrados[-1][1]
+        custo_raiz = 0.0
+
+        for i in range(len(caminho_anterior) - 1):
+            desvio = caminho_anterior[i]
+            raiz = caminho_anterior[:i + 1]
+            proibidos = {
+                caminho[i + 1]
+                for _custo, caminho in encontrados
+                if len(caminho) > i + 1 and caminho[:i + 1] == raiz
+            }
+
+            for no in raiz[:-1]:
+                bloqueado[no] = True
+            trecho = _seguir_arvore(desvio, t, proximo, bloqueado, proibidos)
+            if trecho is not None:
+                custo_trecho = h[desvio]
+            else:
+                custo_trecho, trecho = _a_estrela_mascarado(csr, desvio, t, h, bloqueado, proibidos)
+            for no in raiz[:-1]:
+                bloqueado[no] = False
+
+            if trecho:
+                caminho = raiz[:-1] + trecho
+                chave = tuple(caminho)
+                if chave not in vistos:
+                    vistos.add(chave)
+                    heapq.heappush(candidatos, (custo_raiz + custo_trecho, len(caminho), caminho))
+
+            custo_raiz += _peso_arco(csr, desvio, caminho_anterior[i + 1])
+
+        if not candidatos:
+            return
+        custo, _tamanho, caminho = heapq.heappop(candidatos)
+        encontrados.append((custo, caminho))
+        yield custo, caminho
+
+
+def k_caminhos_minimos(grafo: Graph, origem: str, destino: str, k: int):
+    """Retorna um gerador dos k caminhos mínimos sem ciclos de origem a destino (Yen).
+
+    Cada item é (custo, caminho) e eles saem em ordem crescente de custo, então
+    quem chama pode parar antes de consumir os k. Arestas paralelas contam com o
+    menor peso. Lança ValueError para pesos negativos ou k < 1.
+    """
+    if k < 1:
+        raise ValueError("k deve ser pelo menos 1.")
+    csr = obter_csr(grafo)
+    if csr.tem_peso_negativo:
+        raise ValueError("Yen não aceita pesos negativos.")
+    if not indice_componentes(grafo).mesma_componente(origem, destino):
+        return iter(())
+
+    nomes = csr.nomes
+    return (
+        (custo, [nomes[i] for i in caminho])
+        for custo, caminho in k_caminhos_ids(csr, csr.indice[origem], csr.indice[destino], k)
+    )
@@ -0,0 +1,80 @@
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from .graph import Graph
+from .csr import GrafoCSR, obter_csr
+from .dial import dial_ids
+
+_csr_trabalhador = None
+
+
+def _iniciar_trabalhador(csr: GrafoCSR):
+    """Guarda no processo trabalhador o snapshot somente-leitura do grafo."""
+    global _csr_trabalhador
+    _csr_trabalhador = csr
+
+
+def _calcular_linha(csr: GrafoCSR, s: int, ids_destinos, com_predecessores: bool):
+    """Executa uma busca a partir de s e recorta as colunas dos destinos."""
+    dist, anterior = dial_ids(csr, s)
+    linha_dist = [dist[t] for t in ids_destinos]
+    linha_pred = [anterior[t] for t in ids_destinos] if com_predecessores else None
+    return linha_dist, linha_pred
+
+
+def _calcular_linha_trabalhador(args):
+    """Ponto de entrada dos processos trabalhadores."""
+    return _calcular_linha(_csr_trabalhador, *args)
+
+
+def _preencher(dist, pred, linhas):
+    """Copia as linhas calculadas para as matrizes de saída."""
+    for i, (linha_dist, linha_pred) in enumerate(linhas):
+        dist[i] = linha_dist
+        if pred is not None:
+            pred[i] = linha_pred
+
+
+def _ids(csr: GrafoCSR, nos):
+    """Converte nomes em ids, lançando ValueError para nós inexistentes."""
+    ids = []
+    for no in nos:
+        i = csr.id_de(no)
+        if i is None:
+            raise ValueError(f"Nó '{no}' não existe no grafo.")
+        ids.append(i)
+    return ids
+
+
+def matriz_distancias(grafo: Graph, origens, destinos=None, workers: int = 1,
+                      predecessores: bool = False):
+    """Calcula a matriz de distâncias mínimas origens x destinos.
+
+    Faz uma busca de origem única por origem; com ``workers > 1`` as origens são
+    distribuídas entre processos que recebem uma única cópia do snapshot CSR.
+    Retorna ``(dist, pred)``: ``dist[i, j]`` é a distância de ``origens[i]`` até
+    ``destinos[j]`` (``inf`` se inalcançável) e ``pred[i, j]`` é o id do predecessor
+    de ``destinos[j]`` nesse caminho (-1 se não houver), ou None se
+    ``predecessores`` for False. Os ids seguem ``grafo.id_de``/``grafo.nome_de``.
+    """
+    csr = obter_csr(grafo)
+    if destinos is None:
+        destinos = csr.obter_nos()
+
+    ids_origens = _ids(csr, origens)
+    ids_destinos = _ids(csr, destinos)
+
+    dist = np.full((len(ids_origens), len(ids_destinos)), np.inf)
+    pred = np.full(dist.shape, -1, dtype=np.int64) if predecessores else None
+
+    tarefas = [(s, ids_destinos, predecessores) for s in ids_origens]
+    if workers <= 1 or len(tarefas) <= 1:
+        _preencher(dist, pred, (_calcular_linha(csr, *tarefa) for tarefa in tarefas))
+        return dist, pred
+
+    tamanho_lote = max(1, len(tarefas) // (workers * 4))
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_iniciar_trabalhador, initargs=(csr,)
+    ) as executor:
+        _preencher(dist, pred, executor.map(_calcular_linha_trabalhador, tarefas, chunksize=tamanho_lote))
+
+    return dist, pred
@@ -0,0 +1,96 @@
+from array import array
+from .graph import Graph
+from .csr import obter_csr
+from .centralidade import adjacencia_simples
+
+
+def nucleos_ids(offsets, alvos, n: int):
+    """Decomposição em k-núcleos de Batagelj-Zaversnik em O(V + E).
+
+    Os nós ficam em baldes por grau; a cada passo sai o nó de menor grau restante,
+    cujos vizinhos com grau maior descem um balde em O(1) (troca com o primeiro do
+    balde). Retorna (nucleo, ordem): o número de núcleo de cada id e a ordem de
+    degeneração (ordem de remoção dos nós).
+    """
+    grau = array("q", (offsets[v + 1] - offsets[v] for v in range(n)))
+    maior_grau = max(grau, default=0)
+
+    inicio = array("q", [0] * (maior_grau + 1))
+    for d in grau:
+        inicio[d] += 1
+    acumulado = 0
+    for d in range(maior_grau + 1):
+        inicio[d], acumulado = acumulado, acumulado + inicio[d]
+
+    ordem = array("q", [0] * n)
+    posicao = array("q", [0] * n)
+    for v in range(n):
+        posicao[v] = inicio[grau[v]]
+        ordem[posicao[v]] = v
+        inicio[grau[v]] += 1
+    for d in range(maior_grau, 0, -1):
+        inicio[d] = inicio[d - 1]
+    inicio[0] = 0
+
+    for i in range(n):
+        v = ordem[i]
+        grau_v = grau[v]
+        for u in alvos[offsets[v]:offsets[v + 1]]:
+            grau_u = grau[u]
+            if grau_u > grau_v:
+                primeiro = ordem[inicio[grau_u]]
+                if primeiro != u:
+                    pos_u = posicao[u]
+                    posicao[u], posicao[primeiro] = inicio[grau_u], pos_u
+                    ordem[pos_u], ordem[inicio[grau_u]] = primeiro, u
+                inicio[grau_u] += 1
+                grau[u] = grau_u - 1
+
+    return list(grau), list(ordem)
+
+
+def decomposicao_nucleos(grafo: Graph):
+    """Retorna (nucleo, ordem): o número de núcleo de cada nó e a ordem de degeneração.
+
+    Laços e arestas paralelas são ignorados. O resultado fica em cache no snapshot CSR.
+    """
+    csr = obter_csr(grafo)
+    if "nucleos" not in csr.derivados:
+        offsets, alvos, _pesos = adjacencia_simples(csr)
+        csr.derivados["nucleos"] = nucleos_ids(offsets, alvos, csr.ordem())
+    nucleo, ordem = csr.derivados["nucleos"]
+
+    nomes = csr.nomes
+    return {nomes[i]: k for i, k in enumerate(nucleo)}, [nomes[i] for i in ordem]
+
+
+def degeneracao(grafo: Graph):
+    """Retorna o maior k para o qual o k-núcleo do grafo não é vazio."""
+    nucleo, _ordem = decomposicao_nucleos(grafo)
+    return max(nucleo.values(), default=0)
+
+
+def subgrafo_nucleo(grafo: Graph, k: int):
+    """Cria o k-núcleo: o subgrafo induzido pelos nós com número de núcleo >= k.
+
+    Percorre só as listas de adjacência dos nós do núcleo, na ordem dos ids. Como
+    ``subgrafo_induzido``, mantém uma única aresta (a primeira) por par de nós.
+    """
+    nucleo, _ordem = decomposicao_nucleos(grafo)
+    ids = grafo.ids
+    novo = Graph()
+
+    membros = [no for no in grafo.nomes if nucleo[no] >= k]
+    for no in membros:
+        novo.adicionar_no(no)
+
+    for no in membros:
+        i = ids[no]
+        vistos = set()
+        for vizinho, peso in grafo.vizinhos(no):
+            if vizinho in vistos or ids[vizinho] < i or nucleo[vizinho] < k:
+                continue
+            vistos.add(vizinho)
+            novo.adicionar_aresta(no, vizinho, peso)
+
+    return novo
@@ -0,0 +1,94 @@
+import numpy as np
+from .graph import Graph
+
+
+def matriz_transicao(n: int, origens, destinos, pesos=None):
+    """Monta a matriz de transição esparsa como arrays (origem, destino, coeficiente).
+
+    O coeficiente de cada aresta é seu peso dividido pelo peso total que sai da
+    origem; arestas repetidas entre o mesmo par somam no ``np.bincount`` da iteração.
+    Retorna também a máscara dos nós sem arestas de saída (pendentes).
+    """
+    origem = np.asarray(origens, dtype=np.int64)
+    destino = np.asarray(destinos, dtype=np.int64)
+    pesos = np.ones(len(origem)) if pesos is None else np.asarray(pesos, dtype=np.float64)
+    if len(pesos) and pesos.min() < 0:
+        raise ValueError("PageRank não aceita pesos negativos.")
+
+    saida = np.bincount(origem, weights=pesos, minlength=n)
+    coeficiente = pesos / saida[origem]
+    return origem, destino, coeficiente, saida == 0
+
+
+def pagerank_ids(n: int, origens, destinos, pesos=None, amortecimento: float = 0.85,
+                 personalizacao=None, tolerancia: float = 1e-10, max_iteracoes: int = 200,
+                 estatisticas: dict = None):
+    """PageRank por iteração de potência sobre arestas dirigidas origem -> destino.
+
+    A cada iteração, a massa de cada nó é espalhada pelas arestas com um único
+    ``np.bincount``; a massa dos nós pendentes e o salto aleatório seguem
+    ``personalizacao`` (uniforme se None). Para quando a variação em norma L1 fica
+    abaixo de ``tolerancia`` e lança ValueError se não convergir em ``max_iteracoes``.
+    Se ``estatisticas`` for informado, recebe as iterações e o erro final.
+    """
+    if not 0 <= amortecimento < 1:
+        raise ValueError("Amortecimento deve estar em [0, 1).")
+    if n == 0:
+        return np.zeros(0)
+
+    if personalizacao is None:
+        p = np.full(n, 1.0 / n)
+    else:
+        p = np.asarray(personalizacao, dtype=np.float64)
+        if len(p) != n or p.min() < 0 or p.sum() <= 0:
+            raise ValueError("Personalização deve ter um peso não-negativo por nó e soma positiva.")
+        p = p / p.sum()
+
+    origem, destino, coeficiente, pendentes = matriz_transicao(n, origens, destinos, pesos)
+    x = p.copy()
+    iteracoes = 0
+    erro = np.inf
+
+    while erro >= tolerancia:
+        if iteracoes == max_iteracoes:
+            raise ValueError(f"PageRank não convergiu em {max_iteracoes} iterações.")
+        iteracoes += 1
+        massa_livre = amortecimento * x[pendentes].sum() + (1.0 - amortecimento)
+        novo = np.bincount(destino, weights=x[origem] * coeficiente, minlength=n)
+        novo *= amortecimento
+        novo += massa_livre * p
+        erro = np.abs(novo - x).sum()
+        x = novo
+
+    if estatisticas is not None:
+        estatisticas["iteracoes"] = iteracoes
+        estatisticas["erro"] = float(erro)
+    return x
+
+
+def pagerank_vitorias(grafo: Graph, amortecimento: float = 0.85, personalizacao: dict = None,
+                      tolerancia: float = 1e-10, estatisticas: dict = None):
+    """PageRank dos lutadores no grafo dirigido de derrotas (``grafo.derrotas``).
+
+    Cada derrota vira uma aresta perdedor -> vencedor: o perdedor transfere parte
+    do seu prestígio a quem o venceu, então vencer lutadores bem ranqueados vale
+    mais que vencer muitos lutadores fracos. ``personalizacao`` mapeia lutador ->
+    peso do salto aleatório; lutadores ausentes recebem peso 0.
+    """
+    nomes = grafo.nomes
+    n = len(nomes)
+    ids = grafo.ids
+    perdedores = [ids[perdedor] for _, perdedor in grafo.derrotas]
+    vencedores = [ids[vencedor] for vencedor, _ in grafo.derrotas]
+
+    vetor = None
+    if personalizacao is not None:
+        vetor = np.zeros(n)
+        for lutador, peso in personalizacao.items():
+            if lutador not in ids:
+                raise ValueError(f"Lutador '{lutador}' não existe no grafo.")
+            vetor[ids[lutador]] = peso
+
+    x = pagerank_ids(n, perdedores, vencedores, None, amortecimento, vetor, tolerancia,
+                     estatisticas=estatisticas)
+    return {nomes[i]: float(x[i]) for i in range(n)}
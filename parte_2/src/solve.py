@@ -1,8 +1,16 @@
 import os
 import json
 import pandas as pd
-from .graphs.io import carregar_grafo_ufc
+from .graphs.io import carregar_grafo_ufc, carregar_categorias_ufc
 from .graphs.graph import Graph
+from .graphs.landmarks import selecionar_marcos, salvar_marcos
+from .graphs.biconexas import biconexidade
+from .graphs.centralidade import intermediacao, proximidade_e_harmonica
+from .graphs.pagerank import pagerank_vitorias
+from .graphs.nucleos import decomposicao_nucleos
+from .graphs.triangulos import contar_triangulos
+from .graphs.excentricidade import excentricidades
+from .graphs.comunidades import louvain, propagacao_rotulos, modularidade, informacao_mutua_normalizada
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DATA_DIR = os.path.join(BASE_DIR, "data")
@@ -13,10 +21,15 @@ CAMINHO_UFC = os.path.join(DATA_DIR, "total_fight_data_processado.csv")
 os.makedirs(OUT_DIR, exist_ok=True)
 
 def calcular_metricas_globais(grafo: Graph) -> dict:
+    distancias = excentricidades(grafo)
     return {
         "ordem": grafo.ordem(),
         "tamanho": grafo.tamanho(),
         "densidade": grafo.densidade(),
+        "transitividade": contar_triangulos(grafo).transitividade(),
+        "diametro": distancias.diametro(),
+        "raio": distancias.raio(),
+        "ordem_maior_componente": len(distancias.inferior),
     }
 
 def gerar_metricas_ufc():
@@ -45,14 +58,37 @@ def gerar_ranking_vitorias():
         json.dump(ranking_ordenado, f, ensure_ascii=False, indent=2)
 
 
+def gerar_ranking_pagerank():
+    grafo = carregar_grafo_ufc(CAMINHO_UFC)
+    pagerank = pagerank_vitorias(grafo)
+
+    ranking = []
+    for lutador, valor in pagerank.items():
+        ranking.append({
+            "lutador": lutador,
+            "pagerank": valor,
+            "vitorias": grafo.obter_vitorias(lutador)
+        })
+
+    ranking_ordenado = sorted(ranking, key=lambda x: x["pagerank"], reverse=True)
+
+    with open(os.path.join(OUT_DIR, "ranking_pagerank.json"), "w", encoding="utf-8") as f:
+        json.dump(ranking_ordenado, f, ensure_ascii=False, indent=2)
+
+
 def gerar_ranking_lutas():
     grafo = carregar_grafo_ufc(CAMINHO_UFC)
+    proximidade, harmonica = proximidade_e_harmonica(grafo)
+    triangulos = contar_triangulos(grafo).por_no()
 
     ranking = []
     for lutador in grafo.obter_nos():
         ranking.append({
             "lutador": lutador,
-            "numero_lutas": grafo.grau(lutador)
+            "numero_lutas": grafo.grau(lutador),
+            "proximidade": proximidade[lutador],
+            "harmonica": harmonica[lutador],
+            "agrupamento": triangulos[lutador]["agrupamento"]
         })
 
     ranking_ordenado = sorted(ranking, key=lambda x: x["numero_lutas"], reverse=True)
@@ -61,8 +97,119 @@ def gerar_ranking_lutas():
         json.dump(ranking_ordenado, f, ensure_ascii=False, indent=2)
 
 
+def gerar_nucleos_lutadores():
+    grafo = carregar_grafo_ufc(CAMINHO_UFC)
+    nucleo, ordem = decomposicao_nucleos(grafo)
+
+    linhas = []
+    for posicao, lutador in enumerate(ordem):
+        linhas.append({
+            "lutador": lutador,
+            "nucleo": nucleo[lutador],
+            "numero_lutas": grafo.grau(lutador),
+            "ordem_degeneracao": posicao
+        })
+
+    df = pd.DataFrame(linhas).sort_values("ordem_degeneracao", ascending=False)
+    df.to_csv(os.path.join(OUT_DIR, "core_lutadores.csv"), index=False)
+
+
+def gerar_marcos_alt(k: int = 16):
+    grafo = carregar_grafo_ufc(CAMINHO_UFC)
+
+    marcos = selecionar_marcos(grafo, k=k, estrategia="distante")
+    salvar_marcos(marcos, os.path.join(OUT_DIR, "marcos_alt.npz"))
+    return marcos
+
+
+def gerar_biconexidade():
+    grafo = carregar_grafo_ufc(CAMINHO_UFC)
+
+    resultado = biconexidade(grafo)
+    blocos_por_lutador = resultado.blocos_por_articulacao()
+
+    articulacoes = [
+        {"lutador": lutador, "blocos": len(blocos_por_lutador[lutador])}
+        for lutador in resultado.articulacoes
+    ]
+    articulacoes.sort(key=lambda x: x["blocos"], reverse=True)
+
+    dados = {
+        "pontos_articulacao": articulacoes,
+        "pontes": [{"lutador_a": u, "lutador_b": v} for u, v in resultado.pontes],
+        "blocos": resultado.blocos,
+        "arvore_bloco_corte": [
+            {"bloco": i, "lutador": lutador} for i, lutador in resultado.arvore_bloco_corte()
+        ],
+    }
+
+    with open(os.path.join(OUT_DIR, "ufc_biconexidade.json"), "w", encoding="utf-8") as f:
+        json.dump(dados, f, ensure_ascii=False, indent=2)
+    return dados
+
+
+def gerar_ranking_intermediacao(workers: int = 1):
+    grafo = carregar_grafo_ufc(CAMINHO_UFC)
+
+    por_lutas = intermediacao(grafo, workers=workers)
+    por_peso = intermediacao(grafo, ponderado=True, workers=workers)
+
+    ranking = []
+    for lutador in grafo.obter_nos():
+        ranking.append({
+            "lutador": lutador,
+            "intermediacao": por_lutas[lutador],
+            "intermediacao_ponderada": por_peso[lutador]
+        })
+
+    ranking_ordenado = sorted(ranking, key=lambda x: x["intermediacao"], reverse=True)
+
+    with open(os.path.join(OUT_DIR, "ranking_intermediacao.json"), "w", encoding="utf-8") as f:
+        json.dump(ranking_ordenado, f, ensure_ascii=False, indent=2)
+
+
+def gerar_comunidades():
+    grafo = carregar_grafo_ufc(CAMINHO_UFC)
+    categorias = carregar_categorias_ufc(CAMINHO_UFC)
+
+    por_louvain, q_louvain = louvain(grafo)
+    por_rotulos, q_rotulos = propagacao_rotulos(grafo)
+
+    dados = {
+        "louvain": {
+            "modularidade": q_louvain,
+            "numero_comunidades": len(set(por_louvain.values())),
+            "nmi_categoria": informacao_mutua_normalizada(por_louvain, categorias)
+        },
+        "propagacao_rotulos": {
+            "modularidade": q_rotulos,
+            "numero_comunidades": len(set(por_rotulos.values())),
+            "nmi_categoria": informacao_mutua_normalizada(por_rotulos, categorias)
+        },
+        "modularidade_categorias": modularidade(grafo, categorias),
+        "lutadores": [
+            {
+                "lutador": lutador,
+                "categoria": categorias.get(lutador),
+                "comunidade_louvain": por_louvain[lutador],
+                "comunidade_propagacao": por_rotulos[lutador]
+            }
+            for lutador in grafo.obter_nos()
+        ]
+    }
+
+    with open(os.path.join(OUT_DIR, "ufc_comunidades.json"), "w", encoding="utf-8") as f:
+        json.dump(dados, f, ensure_ascii=False, indent=2)
+    return dados
+
 if __name__ == "__main__":
     gerar_metricas_ufc()
     gerar_ranking_vitorias()
+    gerar_ranking_pagerank()
     gerar_ranking_lutas()
+    gerar_nucleos_lutadores()
+    gerar_marcos_alt()
+    gerar_biconexidade()
+    gerar_ranking_intermediacao()
+    gerar_comunidades()
   
\ No newline at end of file
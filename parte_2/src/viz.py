@@ -1,14 +1,20 @@
 import os
 import json
+import random
 import time
 import tracemalloc
 import pandas as pd
 import webbrowser
-from collections import deque
 from pyvis.network import Network
 from .graphs.io import carregar_grafo_ufc
-from .graphs.algorithms import bfs_arvore, dfs_arvore, dfs_detectar_ciclo, dfs_classificar_arestas, dijkstra, bellman_ford, bellman_ford_caminho
+from .graphs.algorithms import bfs_arvore, dfs_arvore, dfs_detectar_ciclo, dfs_classificar_arestas, dijkstra_lote, bellman_ford, bellman_ford_caminho, encontrar_ciclo_negativo
 from .graphs.graph import Graph
+from .graphs.bidirectional import comparar_nos_fixados
+from .graphs.bellman_ford_numpy import bellman_ford_numpy
+from .graphs.csr import obter_csr
+from .graphs.componentes import indice_componentes
+from .graphs.nucleos import decomposicao_nucleos, subgrafo_nucleo
+from .graphs.comunidades import louvain
 from math import inf
 import matplotlib
 matplotlib.use("Agg")  
@@ -21,15 +27,27 @@ OUT_DIR = os.path.join(BASE_DIR, "out")
 OUT_HTML_DIR = os.path.join(BASE_DIR, "out")
 REPORT_PATH = os.path.join(OUT_DIR, "parte2_report.json")
 
-def grafo_interativo_ufc_html():
+PALETA_COMUNIDADES = [
+    "#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd",
+    "#8c564b", "#e377c2", "#7f7f7f", "#bcbd22", "#17becf"
+]
+
+def grafo_interativo_ufc_html(nucleo_minimo: int = 0, colorir_por_comunidade: bool = False):
     if Network is None:
         return
 
     os.makedirs(OUT_DIR, exist_ok=True)
     caminho_ufc = os.path.join(DATA_DIR, "total_fight_data_processado.csv")
     grafo = carregar_grafo_ufc(caminho_ufc)
-    lutadores = grafo.obter_nos()
     todas_vitorias = grafo.obter_todas_vitorias()
+    comunidade = None
+    if colorir_por_comunidade:
+        comunidade, _modularidade = louvain(grafo)
+    nucleo = None
+    if nucleo_minimo > 0:
+        nucleo, _ordem = decomposicao_nucleos(grafo)
+        grafo = subgrafo_nucleo(grafo, nucleo_minimo)
+    lutadores = grafo.obter_nos()
     total_lutadores = grafo.ordem()
     total_lutas = grafo.tamanho()
     densidade_media = grafo.densidade()
@@ -117,6 +135,10 @@ def grafo_interativo_ufc_html():
             f"Lutas: {grau}<br>"
             f"Vitórias: {vitorias}"
         )
+        if nucleo is not None:
+            title += f"<br>Núcleo: {nucleo[lutador]}"
+        if comunidade is not None:
+            title += f"<br>Comunidade: {comunidade[lutador]}"
 
         if vitorias == 0:
             cor = "#e0e0e0"
@@ -128,6 +150,8 @@ def grafo_interativo_ufc_html():
             cor = "#1976d2"
         else:
             cor = "#0d47a1"
+        if colorir_por_comunidade:
+            cor = PALETA_COMUNIDADES[comunidade[lutador] % len(PALETA_COMUNIDADES)]
 
         node_size = min(10 + (grau * 0.5), 25)
 
@@ -971,9 +995,9 @@ def registrar_metricas(algorithm: str, task: str, time_ms: float, memory_kb: flo
         json.dump(data, f, ensure_ascii=False, indent=2)
 
 
-def medir_e_registrar(algorithm: str, task: str, func, *args, medir_memoria: bool = True, **kwargs):
-    dataset = "total_fight_data_processado.csv"
-    
+def medir_e_registrar(algorithm: str, task: str, func, *args, medir_memoria: bool = True,
+                      dataset: str = "total_fight_data_processado.csv", **kwargs):
+
     if medir_memoria:
         tracemalloc.start()
     
@@ -1004,6 +1028,17 @@ def _obter_vertices_mais_conectados(grafo: Graph, n: int = 3):
     return [v for v, _ in vertices_com_grau[:n]]
 
 
+def _grafo_sintetico(n: int, m: int, semente: int = 42):
+    rng = random.Random(semente)
+    grafo = Graph()
+    for i in range(n):
+        grafo.adicionar_no(f"V{i}")
+    for _ in range(m):
+        u, v = rng.sample(range(n), 2)
+        grafo.adicionar_aresta(f"V{u}", f"V{v}", rng.choice([0.5, 1.0, 2.0, 3.0, 5.0]))
+    return grafo
+
+
 def _detectar_ciclos_bfs(grafo: Graph, origem: str, pai: dict, nivel: dict):
     vertices_alcancados = set(pai.keys())
     for u in vertices_alcancados:
@@ -1391,6 +1426,7 @@ def gerar_html_dijkstra(out_path: str = None):
         os.makedirs(os.path.dirname(out_path), exist_ok=True)
     
     grafo = carregar_grafo_parte2()
+    componentes = indice_componentes(grafo)
     vertices_conectados = _obter_vertices_mais_conectados(grafo, 10)
     
     pares = []
@@ -1399,22 +1435,7 @@ def gerar_html_dijkstra(out_path: str = None):
         destino = None
         for j in range(i + 1, len(vertices_conectados)):
             candidato = vertices_conectados[j]
-            visitado = set()
-            fila = deque([origem])
-            visitado.add(origem)
-            encontrou = False
-            
-            while fila:
-                atual = fila.popleft()
-                if atual == candidato:
-                    encontrou = True
-                    break
-                for vizinho, _ in grafo.vizinhos(atual):
-                    if vizinho not in visitado:
-                        visitado.add(vizinho)
-                        fila.append(vizinho)
-            
-            if encontrou:
+            if componentes.mesma_componente(origem, candidato):
                 destino = candidato
                 break
         
@@ -1428,22 +1449,7 @@ def gerar_html_dijkstra(out_path: str = None):
                 break
             for destino in todos_vertices:
                 if origem != destino and (origem, destino) not in pares and (destino, origem) not in pares:
-                    visitado = set()
-                    fila = deque([origem])
-                    visitado.add(origem)
-                    encontrou = False
-                    
-                    while fila:
-                        atual = fila.popleft()
-                        if atual == destino:
-                            encontrou = True
-                            break
-                        for vizinho, _ in grafo.vizinhos(atual):
-                            if vizinho not in visitado:
-                                visitado.add(vizinho)
-                                fila.append(vizinho)
-                    
-                    if encontrou:
+                    if componentes.mesma_componente(origem, destino):
                         pares.append((origem, destino))
                         break
     
@@ -1512,21 +1518,21 @@ def gerar_html_dijkstra(out_path: str = None):
                 <th>Destino</th>
                 <th>Caminho</th>
                 <th>Distância Total</th>
+                <th>Nós fixados (unidirecional / bidirecional)</th>
             </tr>
         </thead>
         <tbody>
 """)
     
-    for origem, destino in pares:
-        distancia, caminho = medir_e_registrar(
-            algorithm="DIJKSTRA",
-            task=f"DIJKSTRA {origem} -> {destino}",
-            func=dijkstra,
-            grafo=grafo,
-            origem=origem,
-            destino=destino
-        )
-        
+    resultados = medir_e_registrar(
+        algorithm="DIJKSTRA",
+        task=f"DIJKSTRA lote de {len(pares)} pares",
+        func=dijkstra_lote,
+        grafo=grafo,
+        pares=pares
+    )
+
+    for (origem, destino), (distancia, caminho) in zip(pares, resultados):
         if distancia == inf or not caminho:
             caminho_str = "Sem caminho"
             distancia_str = "∞"
@@ -1534,12 +1540,16 @@ def gerar_html_dijkstra(out_path: str = None):
             caminho_str = " → ".join(caminho)
             distancia_str = f"{distancia:.2f}"
         
+        fixados = comparar_nos_fixados(grafo, origem, destino)
+        fixados_str = f"{fixados['unidirecional']} / {fixados['bidirecional']}"
+        
         html_parts.append(f"""
             <tr>
                 <td>{origem}</td>
                 <td>{destino}</td>
                 <td class="caminho">{caminho_str}</td>
                 <td>{distancia_str}</td>
+                <td>{fixados_str}</td>
             </tr>
 """)
     
@@ -1576,7 +1586,64 @@ def gerar_html_dijkstra(out_path: str = None):
     return out_path
 
 
-def gerar_html_bellman_ford(out_path: str = None):
+def _html_motores_bellman_ford(n_sintetico: int = 5000, m_sintetico: int = 50000):
+    partes = []
+    grafo_sintetico = _grafo_sintetico(n_sintetico, m_sintetico)
+    origem_sintetico = grafo_sintetico.nome_de(0)
+    obter_csr(grafo_sintetico)
+    dataset_sintetico = f"sintetico_{n_sintetico}v_{m_sintetico}a"
+    motores = [("Fila (SPFA)", bellman_ford), ("NumPy vetorizado", bellman_ford_numpy)]
+    linhas_motores = []
+    distancias_motores = []
+    for nome_motor, func_motor in motores:
+        estatisticas = {}
+        dist4, _anterior4, _ciclo4 = medir_e_registrar(
+            algorithm="BELLMAN_FORD",
+            task=f"BF case4: {nome_motor}, {m_sintetico} arestas",
+            func=func_motor,
+            grafo=grafo_sintetico,
+            origem=origem_sintetico,
+            estatisticas=estatisticas,
+            medir_memoria=False,
+            dataset=dataset_sintetico
+        )
+        distancias_motores.append(dist4)
+        linhas_motores.append((nome_motor, estatisticas["relaxacoes"], estatisticas.get("rodadas", "-")))
+    
+    partes.append(f"""
+    <h2>Caso 4: Motores de Relaxação em Grafo Sintético</h2>
+    <p><strong>Grafo:</strong> {n_sintetico} vértices e {m_sintetico} arestas aleatórias (semente fixa)</p>
+    <p><strong>Origem:</strong> {origem_sintetico}</p>
+    <p><strong>Distâncias idênticas entre os motores:</strong> {"sim" if distancias_motores[0] == distancias_motores[1] else "não"}</p>
+    <p><em>Os tempos de cada motor são registrados em parte2_report.json.</em></p>
+    <table>
+        <thead>
+            <tr>
+                <th>Motor</th>
+                <th>Arestas examinadas</th>
+                <th>Rodadas</th>
+            </tr>
+        </thead>
+        <tbody>
+""")
+    
+    for nome_motor, relaxacoes, rodadas in linhas_motores:
+        partes.append(f"""
+            <tr>
+                <td>{nome_motor}</td>
+                <td>{relaxacoes}</td>
+                <td>{rodadas}</td>
+            </tr>
+""")
+    
+    partes.append("""        </tbody>
+    </table>
+""")
+    return partes
+
+
+def gerar_html_bellman_ford(out_path: str = None, incluir_sintetico: bool = False,
+                            n_sintetico: int = 5000, m_sintetico: int = 50000):
     if out_path is None:
         os.makedirs(OUT_HTML_DIR, exist_ok=True)
         out_path = os.path.join(OUT_HTML_DIR, "parte2_bellman_ford.html")
@@ -1765,10 +1832,12 @@ def gerar_html_bellman_ford(out_path: str = None):
 """)
     
     if tem_ciclo2:
-        html_parts.append("""
+        ciclo_encontrado = " → ".join(encontrar_ciclo_negativo(grafo_com_ciclo, origem_caso2))
+        html_parts.append(f"""
     <div class="ciclo-negativo">
         <p><strong>Ciclo negativo detectado!</strong></p>
         <p>O algoritmo Bellman-Ford identificou a existência de um ciclo com soma de pesos negativa.</p>
+        <p>Ciclo encontrado nos predecessores: {ciclo_encontrado}</p>
         <p>Neste caso, as distâncias calculadas podem não ser confiáveis, pois é possível reduzir infinitamente o custo do caminho percorrendo o ciclo negativo repetidamente.</p>
     </div>
 """)
@@ -1834,6 +1903,9 @@ def gerar_html_bellman_ford(out_path: str = None):
     </div>
 """)
     
+    if incluir_sintetico:
+        html_parts.extend(_html_motores_bellman_ford(n_sintetico, m_sintetico))
+    
     html_parts.append("""
 </body>
 </html>
@@ -1861,5 +1933,5 @@ if __name__ == "__main__":
     gerar_histograma_graus()
     gerar_html_bfs()
     gerar_html_dijkstra()
-    gerar_html_bellman_ford()
+    gerar_html_bellman_ford(incluir_sintetico=True)
     gerar_html_dfs()
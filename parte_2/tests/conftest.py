@@ -0,0 +1,40 @@
+from pathlib import Path
+import sys
+import random
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+SRC_DIRS = [ROOT_DIR / "src"]
+for dir_path in SRC_DIRS:
+    if dir_path.exists() and str(dir_path) not in sys.path:
+        sys.path.insert(0, str(dir_path))
+
+from graphs.graph import Graph
+
+
+def _montar_grafo_aleatorio(n, m, semente, pesos=(1.0,), prefixo="N", lacos=False):
+    """Grafo com n nós e m arestas sorteadas com semente fixa.
+
+    Os nós se chamam ``f"{prefixo}{i}"``, ou são os próprios inteiros com ``prefixo=None``.
+    Com ``lacos=True`` as pontas são sorteadas de forma independente e podem coincidir.
+    """
+    rng = random.Random(semente)
+    nome = (lambda i: i) if prefixo is None else (lambda i: f"{prefixo}{i}")
+    grafo = Graph()
+    for i in range(n):
+        grafo.adicionar_no(nome(i))
+    for _ in range(m):
+        if lacos:
+            u, v = rng.randrange(n), rng.randrange(n)
+        else:
+            u, v = rng.sample(range(n), 2)
+        peso = rng.choice(pesos) if len(pesos) > 1 else pesos[0]
+        grafo.adicionar_aresta(nome(u), nome(v), peso)
+    return grafo
+
+
+@pytest.fixture
+def montar_grafo_aleatorio():
+    """Fábrica de grafos aleatórios reprodutíveis compartilhada pelos testes."""
+    return _montar_grafo_aleatorio
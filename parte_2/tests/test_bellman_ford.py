@@ -11,7 +11,10 @@ for dir_path in SRC_DIRS:
         sys.path.insert(0, str(dir_path))
 
 from graphs.graph import Graph
-from graphs.algorithms import bellman_ford, bellman_ford_caminho
+from graphs.algorithms import bellman_ford, bellman_ford_caminho, encontrar_ciclo_negativo
+from graphs.csr import obter_csr, bellman_ford_ids, spfa_ids
+
+PESOS = (0.5, 1.0, 2.0, 4.0)
 
 
 def montar_grafo_basico() -> Graph:
@@ -86,4 +89,48 @@ def test_bellman_ford_caminho_para_destino_inacessivel():
 
     assert tem_ciclo is False
     assert custo is inf
-    assert caminho == []
\ No newline at end of file
+    assert caminho == []
+
+
+def test_spfa_tem_mesmas_distancias_com_menos_relaxacoes(montar_grafo_aleatorio):
+    csr = obter_csr(montar_grafo_aleatorio(80, 240, 11, PESOS))
+
+    estatisticas_bf, estatisticas_spfa = {}, {}
+    dist_bf, _anterior, ciclo_bf = bellman_ford_ids(csr, 0, estatisticas_bf)
+    dist_spfa, anterior, ciclo = spfa_ids(csr, 0, estatisticas_spfa)
+
+    assert not ciclo_bf and ciclo == []
+    assert dist_spfa == pytest.approx(dist_bf)
+    assert estatisticas_spfa["relaxacoes"] < estatisticas_bf["relaxacoes"]
+    for v in range(csr.ordem()):
+        if anterior[v] >= 0:
+            assert dist_spfa[v] >= dist_spfa[anterior[v]]
+
+
+def test_bellman_ford_em_empates_devolve_arvore_de_caminhos_minimos(montar_grafo_aleatorio):
+    grafo = montar_grafo_aleatorio(80, 240, 5, PESOS)
+    dist, anterior, tem_ciclo = bellman_ford(grafo, "N0")
+
+    assert tem_ciclo is False
+    for v, u in anterior.items():
+        if u is not None:
+            peso = min(p for w, p in grafo.vizinhos(u) if w == v)
+            assert dist[v] == pytest.approx(dist[u] + peso)
+
+
+def test_encontrar_ciclo_negativo_retorna_ciclo_fechado_de_custo_negativo():
+    grafo = Graph()
+    grafo.adicionar_aresta("A", "B", 1)
+    grafo.adicionar_aresta("B", "C", -3)
+    grafo.adicionar_aresta("C", "D", 2)
+
+    ciclo = encontrar_ciclo_negativo(grafo, "A")
+
+    assert len(ciclo) >= 3
+    assert ciclo[0] == ciclo[-1]
+    pesos = {(u, v): p for u in grafo.obter_nos() for v, p in grafo.vizinhos(u)}
+    assert sum(pesos[(u, v)] for u, v in zip(ciclo, ciclo[1:])) < 0
+
+
+def test_encontrar_ciclo_negativo_sem_ciclo():
+    assert encontrar_ciclo_negativo(montar_grafo_basico(), "A") == []
@@ -0,0 +1,68 @@
+from pathlib import Path
+import sys
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+SRC_DIRS = [ROOT_DIR / "src"]
+for dir_path in SRC_DIRS:
+    if dir_path.exists():
+        sys.path.insert(0, str(dir_path))
+
+from graphs.graph import Graph
+from graphs.biconexas import biconexidade, pontos_articulacao, pontes
+
+
+def montar_grafo_gravata() -> Graph:
+    """Dois triângulos ligados por C-D, mais uma aresta pendente D-G e um nó isolado."""
+    grafo = Graph()
+    grafo.adicionar_aresta("A", "B", 1)
+    grafo.adicionar_aresta("B", "C", 1)
+    grafo.adicionar_aresta("C", "A", 1)
+    grafo.adicionar_aresta("C", "D", 1)
+    grafo.adicionar_aresta("D", "E", 1)
+    grafo.adicionar_aresta("E", "F", 1)
+    grafo.adicionar_aresta("F", "D", 1)
+    grafo.adicionar_aresta("D", "G", 1)
+    grafo.adicionar_no("Isolado")
+    return grafo
+
+
+def test_articulacoes_e_pontes():
+    grafo = montar_grafo_gravata()
+
+    assert pontos_articulacao(grafo) == ["C", "D"]
+    assert sorted(tuple(sorted(p)) for p in pontes(grafo)) == [("C", "D"), ("D", "G")]
+
+
+def test_blocos_e_arvore_bloco_corte():
+    resultado = biconexidade(montar_grafo_gravata())
+
+    blocos = sorted(sorted(bloco) for bloco in resultado.blocos)
+    assert blocos == [["A", "B", "C"], ["C", "D"], ["D", "E", "F"], ["D", "G"], ["Isolado"]]
+
+    por_articulacao = resultado.blocos_por_articulacao()
+    assert len(por_articulacao["C"]) == 2
+    assert len(por_articulacao["D"]) == 3
+    assert len(resultado.arvore_bloco_corte()) == 5
+
+
+def test_arestas_paralelas_nao_sao_pontes():
+    grafo = Graph()
+    grafo.adicionar_aresta("A", "B", 1)
+    grafo.adicionar_aresta("A", "B", 2)
+    grafo.adicionar_aresta("B", "C", 1)
+    grafo.adicionar_aresta("C", "C", 1)
+
+    assert pontes(grafo) == [("B", "C")]
+    assert pontos_articulacao(grafo) == ["B"]
+
+
+def test_cadeia_longa_sem_recursao():
+    n = 50000
+    grafo = Graph()
+    for i in range(n - 1):
+        grafo.adicionar_aresta(f"V{i}", f"V{i + 1}", 1)
+
+    resultado = biconexidade(grafo)
+
+    assert len(resultado.pontes) == n - 1
+    assert len(resultado.articulacoes) == n - 2
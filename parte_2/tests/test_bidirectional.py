@@ -0,0 +1,104 @@
+from pathlib import Path
+import sys
+import random
+
+import pytest
+from math import isinf
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+SRC_DIRS = [ROOT_DIR / "src"]
+for dir_path in SRC_DIRS:
+    if dir_path.exists():
+        sys.path.insert(0, str(dir_path))
+
+from graphs.graph import Graph
+from graphs.algorithms import dijkstra, bfs_caminho
+from graphs.bidirectional import (
+    dijkstra_bidirecional,
+    bfs_caminho_bidirecional,
+    comparar_nos_fixados,
+)
+
+PESOS = (0.5, 1.0, 2.0, 3.0, 1.7)
+
+
+def montar_cadeia(n: int = 200) -> Graph:
+    grafo = Graph()
+    for i in range(n - 1):
+        grafo.adicionar_aresta(f"C{i}", f"C{i + 1}", 1.0)
+    return grafo
+
+
+def custo_do_caminho(grafo: Graph, caminho):
+    return sum(
+        min(peso for v, peso in grafo.vizinhos(a) if v == b)
+        for a, b in zip(caminho, caminho[1:])
+    )
+
+
+def test_dijkstra_bidirecional_coincide_com_dijkstra(montar_grafo_aleatorio):
+    grafo = montar_grafo_aleatorio(120, 300, 11, PESOS)
+    rng = random.Random(5)
+    nos = grafo.obter_nos()
+
+    for _ in range(60):
+        origem, destino = rng.choice(nos), rng.choice(nos)
+        custo_esperado, caminho_esperado = dijkstra(grafo, origem, destino)
+        custo, caminho = dijkstra_bidirecional(grafo, origem, destino)
+
+        assert custo == pytest.approx(custo_esperado)
+        if caminho_esperado:
+            assert caminho[0] == origem and caminho[-1] == destino
+            assert custo_do_caminho(grafo, caminho) == pytest.approx(custo)
+        else:
+            assert caminho == []
+
+
+def test_dijkstra_bidirecional_casos_limite():
+    grafo = Graph()
+    grafo.adicionar_aresta("A", "B", 1.0)
+    grafo.adicionar_no("C")
+
+    assert dijkstra_bidirecional(grafo, "A", "A") == (0.0, ["A"])
+    assert dijkstra_bidirecional(grafo, "A", "B") == (1.0, ["A", "B"])
+
+    custo, caminho = dijkstra_bidirecional(grafo, "A", "C")
+    assert isinf(custo) and caminho == []
+
+    custo, caminho = dijkstra_bidirecional(grafo, "A", "Z")
+    assert isinf(custo) and caminho == []
+
+
+def test_bfs_caminho_bidirecional_tem_mesmo_comprimento_que_bfs(montar_grafo_aleatorio):
+    grafo = montar_grafo_aleatorio(120, 300, 11, PESOS)
+    rng = random.Random(9)
+    nos = grafo.obter_nos()
+
+    for _ in range(60):
+        origem, destino = rng.choice(nos), rng.choice(nos)
+        esperado = bfs_caminho(grafo, origem, destino)
+        caminho = bfs_caminho_bidirecional(grafo, origem, destino)
+
+        assert len(caminho) == len(esperado)
+        if caminho:
+            assert caminho[0] == origem and caminho[-1] == destino
+            for a, b in zip(caminho, caminho[1:]):
+                assert b in {v for v, _ in grafo.vizinhos(a)}
+
+
+def test_contadores_mostram_reducao_de_nos_fixados(montar_grafo_aleatorio):
+    grafo = montar_cadeia()
+
+    contagem = comparar_nos_fixados(grafo, "C100", "C140")
+
+    assert contagem["bidirecional"] < contagem["unidirecional"]
+
+    estatisticas = {}
+    caminho = bfs_caminho_bidirecional(grafo, "C100", "C140", estatisticas)
+    assert len(caminho) == 41
+    assert estatisticas["nos_visitados"] <= 82
+
+    grafo_denso = montar_grafo_aleatorio(2000, 8000, 11, PESOS)
+    estatisticas = {}
+    assert bfs_caminho_bidirecional(grafo_denso, "N1", "N2", estatisticas)
+    assert estatisticas["nos_visitados"] < grafo_denso.ordem() // 2
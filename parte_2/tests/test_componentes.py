@@ -0,0 +1,96 @@
+from pathlib import Path
+import sys
+import random
+from collections import deque
+
+import pytest
+from math import isinf
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+SRC_DIRS = [ROOT_DIR / "src"]
+for dir_path in SRC_DIRS:
+    if dir_path.exists():
+        sys.path.insert(0, str(dir_path))
+
+from graphs.graph import Graph
+from graphs.algorithms import dijkstra, dijkstra_lote, bfs_caminho
+from graphs.componentes import UniaoBusca, indice_componentes
+
+
+def montar_grafo_componentes() -> Graph:
+    grafo = Graph()
+    grafo.adicionar_aresta("A", "B", 1)
+    grafo.adicionar_aresta("B", "C", 2)
+    grafo.adicionar_aresta("C", "A", 1)
+    grafo.adicionar_aresta("D", "E", 1)
+    grafo.adicionar_no("F")
+    return grafo
+
+
+def alcancaveis(grafo: Graph, origem: str):
+    visitado = {origem}
+    fila = deque([origem])
+    while fila:
+        u = fila.popleft()
+        for v, _ in grafo.vizinhos(u):
+            if v not in visitado:
+                visitado.add(v)
+                fila.append(v)
+    return visitado
+
+
+def test_uniao_busca_une_e_conta_conjuntos():
+    conjuntos = UniaoBusca(5)
+
+    assert conjuntos.unir(0, 1) is True
+    assert conjuntos.unir(3, 4) is True
+    assert conjuntos.unir(1, 0) is False
+    assert conjuntos.encontrar(0) == conjuntos.encontrar(1)
+    assert conjuntos.encontrar(2) != conjuntos.encontrar(3)
+    assert conjuntos.conjuntos == 3
+
+
+def test_indice_componentes_rotulos_tamanhos_e_gigante():
+    indice = indice_componentes(montar_grafo_componentes())
+
+    assert indice.numero_componentes() == 3
+    assert indice.tamanhos == [3, 2, 1]
+    assert indice.mesma_componente("A", "C")
+    assert not indice.mesma_componente("A", "D")
+    assert not indice.mesma_componente("A", "Z")
+    assert indice.tamanho_componente("E") == 2
+    assert indice.tamanho_componente("Z") == 0
+    assert indice.componente_de("F") == 2
+    assert indice.componente_gigante() == ["A", "B", "C"]
+
+
+def test_indice_componentes_coincide_com_bfs_e_acompanha_o_grafo():
+    rng = random.Random(3)
+    grafo = Graph()
+    for i in range(60):
+        grafo.adicionar_no(f"N{i}")
+    for _ in range(45):
+        u, v = rng.sample(range(60), 2)
+        grafo.adicionar_aresta(f"N{u}", f"N{v}", 1)
+
+    indice = indice_componentes(grafo)
+    assert indice_componentes(grafo) is indice
+    for u in grafo.obter_nos()[:15]:
+        alcance = alcancaveis(grafo, u)
+        for v in grafo.obter_nos():
+            assert indice.mesma_componente(u, v) == (v in alcance)
+
+    grafo.adicionar_aresta("N0", "Novo", 1)
+    assert indice_componentes(grafo).mesma_componente("N0", "Novo")
+
+
+def test_consultas_de_caminho_param_cedo_entre_componentes():
+    grafo = montar_grafo_componentes()
+
+    custo, caminho = dijkstra(grafo, "A", "E")
+    assert isinf(custo) and caminho == []
+    assert bfs_caminho(grafo, "A", "F") == []
+    resultados = dijkstra_lote(grafo, [("A", "D"), ("A", "C"), ("F", "A")])
+    assert resultados[0] == (float("inf"), [])
+    assert resultados[1][0] == pytest.approx(1.0)
+    assert resultados[2] == (float("inf"), [])
@@ -0,0 +1,166 @@
+from pathlib import Path
+import sys
+
+import pytest
+from math import isinf
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+SRC_DIRS = [ROOT_DIR / "src"]
+for dir_path in SRC_DIRS:
+    if dir_path.exists():
+        sys.path.insert(0, str(dir_path))
+
+from graphs.graph import Graph
+from graphs.csr import GrafoCSR, bfs_ids, bfs_caminho_ids, dijkstra_ids, bellman_ford_ids, caminho_ids, obter_csr
+from graphs.algorithms import bfs_arvore, bfs_caminho, dfs_arvore, dijkstra, bellman_ford
+
+PESOS = (0.5, 1.0, 2.0, 3.0)
+
+
+def montar_grafo_csr() -> Graph:
+    grafo = Graph()
+    grafo.adicionar_aresta("A", "B", 1)
+    grafo.adicionar_aresta("A", "C", 4)
+    grafo.adicionar_aresta("B", "C", 2)
+    grafo.adicionar_aresta("B", "D", 6)
+    grafo.adicionar_aresta("C", "D", 3)
+    grafo.adicionar_aresta("C", "E", 2)
+    grafo.adicionar_aresta("D", "E", 1)
+    grafo.adicionar_no("Isolado")
+    return grafo
+
+
+def test_csr_preserva_ordem_tamanho_graus_e_vizinhos():
+    grafo = montar_grafo_csr()
+    csr = GrafoCSR.de_grafo(grafo)
+
+    assert csr.ordem() == grafo.ordem()
+    assert csr.tamanho() == grafo.tamanho()
+    assert csr.obter_nos() == grafo.obter_nos()
+    for no in grafo.obter_nos():
+        assert csr.grau(no) == grafo.grau(no)
+        assert csr.vizinhos(no) == [(v, float(p)) for v, p in grafo.vizinhos(no)]
+    assert csr.grau("Z") == 0
+    assert csr.vizinhos("Z") == []
+
+
+def test_csr_e_imutavel():
+    csr = GrafoCSR.de_grafo(montar_grafo_csr())
+
+    with pytest.raises(AttributeError):
+        csr.pesos = None
+
+
+def test_algoritmos_no_csr_equivalem_ao_grafo_original(montar_grafo_aleatorio):
+    grafo = montar_grafo_aleatorio(60, 150, 7, PESOS)
+    csr = GrafoCSR.de_grafo(grafo)
+
+    assert bfs_arvore(csr, "N0") == bfs_arvore(grafo, "N0")
+    assert dfs_arvore(csr, "N0") == dfs_arvore(grafo, "N0")
+    assert bellman_ford(csr, "N0") == bellman_ford(grafo, "N0")
+
+    for destino in grafo.obter_nos():
+        custo_csr, caminho_csr = dijkstra(csr, "N0", destino)
+        custo, caminho = dijkstra(grafo, "N0", destino)
+        assert custo_csr == pytest.approx(custo)
+        assert caminho_csr == caminho
+
+
+def test_bfs_caminho_ids_tem_comprimento_do_nivel_bfs(montar_grafo_aleatorio):
+    grafo = montar_grafo_aleatorio(60, 150, 7, PESOS)
+    csr = obter_csr(grafo)
+    _pai, nivel, _ordem = bfs_ids(csr, 0)
+
+    for t in range(csr.ordem()):
+        caminho = bfs_caminho_ids(csr, 0, t)
+        if nivel[t] < 0:
+            assert caminho == []
+            continue
+        assert len(caminho) == nivel[t] + 1
+        assert caminho[0] == 0 and caminho[-1] == t
+        for u, v in zip(caminho, caminho[1:]):
+            assert v in csr.alvos[csr.offsets[u]:csr.offsets[u + 1]]
+        assert bfs_caminho(grafo, "N0", csr.nome_de(t)) == [csr.nome_de(i) for i in caminho]
+
+
+def test_dijkstra_csr_caminho_e_casos_limite():
+    csr = GrafoCSR.de_grafo(montar_grafo_csr())
+
+    custo, caminho = dijkstra(csr, "A", "E")
+    assert custo == pytest.approx(5.0)
+    assert caminho == ["A", "B", "C", "E"]
+
+    custo, caminho = dijkstra(csr, "A", "Isolado")
+    assert isinf(custo)
+    assert caminho == []
+
+    assert dijkstra(csr, "B", "B") == (0.0, ["B"])
+
+
+def test_dijkstra_csr_recusa_pesos_negativos():
+    grafo = Graph()
+    grafo.adicionar_aresta("A", "B", -1)
+
+    with pytest.raises(ValueError):
+        dijkstra(GrafoCSR.de_grafo(grafo), "A", "B")
+
+
+def test_bfs_csr_origem_inexistente():
+    csr = GrafoCSR.de_grafo(montar_grafo_csr())
+
+    with pytest.raises(ValueError):
+        bfs_arvore(csr, "Z")
+
+
+def test_tabela_de_simbolos_atribui_ids_densos_na_ordem_de_insercao():
+    grafo = montar_grafo_csr()
+
+    assert [grafo.id_de(no) for no in grafo.obter_nos()] == list(range(grafo.ordem()))
+    assert grafo.nome_de(grafo.id_de("C")) == "C"
+    assert grafo.id_de("Z") is None
+
+    grafo.adicionar_aresta("A", "Novo", 1.0)
+    assert grafo.id_de("Novo") == grafo.ordem() - 1
+
+
+def test_csr_reutiliza_ids_do_grafo():
+    grafo = montar_grafo_csr()
+    csr = GrafoCSR.de_grafo(grafo)
+
+    for no in grafo.obter_nos():
+        assert csr.id_de(no) == grafo.id_de(no)
+
+
+def test_variantes_por_id_retornam_vetores_indexados():
+    grafo = montar_grafo_csr()
+    csr = GrafoCSR.de_grafo(grafo)
+    a, e = csr.id_de("A"), csr.id_de("E")
+
+    dist, anterior = dijkstra_ids(csr, a)
+    assert dist[e] == pytest.approx(5.0)
+    assert [csr.nome_de(i) for i in caminho_ids(anterior, a, e)] == ["A", "B", "C", "E"]
+    assert isinf(dist[csr.id_de("Isolado")])
+
+    pai, nivel, ordem_visita = bfs_ids(csr, a)
+    assert nivel[e] == 2
+    assert pai[a] == -1
+    assert nivel[csr.id_de("Isolado")] == -1
+    assert ordem_visita[0] == a
+
+    dist_bf, _anterior_bf, ciclo = bellman_ford_ids(csr, a)
+    assert not ciclo
+    assert dist_bf[e] == pytest.approx(5.0)
+
+
+def test_obter_csr_reaproveita_snapshot_ate_o_grafo_mudar():
+    grafo = montar_grafo_csr()
+
+    primeiro = obter_csr(grafo)
+    assert obter_csr(grafo) is primeiro
+    assert obter_csr(primeiro) is primeiro
+
+    grafo.adicionar_aresta("E", "F", 1.0)
+    segundo = obter_csr(grafo)
+    assert segundo is not primeiro
+    assert segundo.ordem() == grafo.ordem()
+    assert segundo.versao == grafo.versao
@@ -0,0 +1,121 @@
+from pathlib import Path
+import sys
+import random
+
+import pytest
+from math import isinf
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+SRC_DIRS = [ROOT_DIR / "src"]
+for dir_path in SRC_DIRS:
+    if dir_path.exists():
+        sys.path.insert(0, str(dir_path))
+
+from graphs.graph import Graph
+from graphs.csr import GrafoCSR, obter_csr
+from graphs.algorithms import dijkstra
+from graphs.dial import detectar_quantum, dijkstra_dial, _pesos_inteiros
+
+
+def montar_grafo_ufc_sintetico(n: int = 80, m: int = 240, semente: int = 3) -> Graph:
+    rng = random.Random(semente)
+    grafo = Graph()
+    for i in range(n):
+        grafo.adicionar_no(f"L{i}")
+    for _ in range(m):
+        u, v = rng.sample(range(n), 2)
+        grafo.adicionar_aresta(f"L{u}", f"L{v}", rng.choice([0.5, 1.0, 2.0, 3.0]))
+    return grafo
+
+
+def test_detectar_quantum():
+    assert detectar_quantum([0.5, 1.0, 2.0, 3.0]) == pytest.approx(0.5)
+    assert detectar_quantum([1.0, 4.0, 3.5, 5.0]) == pytest.approx(0.5)
+    assert detectar_quantum([2, 4, 6]) == pytest.approx(2.0)
+    assert detectar_quantum([0.1, 0.3]) == pytest.approx(0.1)
+    assert detectar_quantum([1.0, -1.0]) is None
+    assert detectar_quantum([1.0, 10000.0], limite_baldes=100) is None
+    assert detectar_quantum([]) is None
+
+
+def test_dijkstra_dial_coincide_com_dijkstra():
+    grafo = montar_grafo_ufc_sintetico()
+    csr = GrafoCSR.de_grafo(grafo)
+
+    for origem in ["L0", "L5", "L17"]:
+        for destino in grafo.obter_nos():
+            custo_esperado, caminho_esperado = dijkstra(grafo, origem, destino)
+            custo, caminho = dijkstra_dial(csr, origem, destino)
+            assert custo == pytest.approx(custo_esperado)
+            assert caminho == caminho_esperado
+            if caminho:
+                soma = sum(
+                    min(peso for v, peso in grafo.vizinhos(a) if v == b)
+                    for a, b in zip(caminho, caminho[1:])
+                )
+                assert caminho[0] == origem and caminho[-1] == destino
+                assert soma == pytest.approx(custo)
+
+
+def test_dijkstra_dial_aceita_graph_e_casos_limite():
+    grafo = Graph()
+    grafo.adicionar_aresta("A", "B", 0.5)
+    grafo.adicionar_aresta("B", "C", 0.0)
+    grafo.adicionar_aresta("A", "C", 1.0)
+    grafo.adicionar_no("D")
+
+    assert dijkstra_dial(grafo, "A", "C") == (0.5, ["A", "B", "C"])
+    assert dijkstra_dial(grafo, "A", "A") == (0.0, ["A"])
+
+    custo, caminho = dijkstra_dial(grafo, "A", "D")
+    assert isinf(custo) and caminho == []
+
+    custo, caminho = dijkstra_dial(grafo, "Z", "A")
+    assert isinf(custo) and caminho == []
+
+
+def test_dijkstra_dial_recorre_ao_heap_sem_quantum():
+    grafo = Graph()
+    grafo.adicionar_aresta("A", "B", 0.123456789)
+    grafo.adicionar_aresta("B", "C", 1.0)
+
+    custo, caminho = dijkstra_dial(grafo, "A", "C")
+
+    assert custo == pytest.approx(1.123456789)
+    assert caminho == ["A", "B", "C"]
+
+
+def test_dijkstra_dial_recorre_ao_heap_com_quantum_inexato():
+    grafo = Graph()
+    grafo.adicionar_aresta("A", "C", 0.8)
+    grafo.adicionar_aresta("A", "B", 0.1)
+    grafo.adicionar_aresta("B", "C", 0.7)
+
+    assert dijkstra_dial(grafo, "A", "C") == dijkstra(grafo, "A", "C")
+
+
+def test_dijkstra_dial_recusa_pesos_negativos():
+    grafo = Graph()
+    grafo.adicionar_aresta("A", "B", -1)
+
+    with pytest.raises(ValueError):
+        dijkstra_dial(grafo, "A", "B")
+
+
+def test_pesos_iguais_usam_o_peso_como_quantum_sem_varredura():
+    grafo = Graph()
+    for i in range(6):
+        grafo.adicionar_aresta(f"N{i}", f"N{(i + 1) % 6}", 2.5)
+    grafo.adicionar_aresta("N0", "N3", 2.5)
+
+    quantum, inteiros = _pesos_inteiros(obter_csr(grafo))
+
+    assert quantum == 2.5
+    assert list(inteiros) == [1] * len(inteiros)
+    for destino in grafo.obter_nos():
+        assert dijkstra_dial(grafo, "N0", destino) == dijkstra(grafo, "N0", destino)
+
+    grafo_inexato = Graph()
+    grafo_inexato.adicionar_aresta("A", "B", 0.1)
+    grafo_inexato.adicionar_aresta("B", "C", 0.1)
+    assert _pesos_inteiros(obter_csr(grafo_inexato)) == (None, None)
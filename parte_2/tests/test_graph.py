@@ -74,3 +74,24 @@ def test_subgrafo_induzido_mantem_apenas_lutadores_e_arestas_do_conjunto():
     assert sub.grau("B") == 1
     assert sub.grau("Isolado") == 0
     assert sub.tamanho() == 1
+
+
+def test_estatisticas_de_pesos_sao_mantidas_incrementalmente():
+    grafo = Graph()
+    assert grafo.peso_minimo is None
+    versao_inicial = grafo.versao
+
+    grafo.adicionar_aresta("A", "B", 2.0)
+    assert (grafo.peso_minimo, grafo.peso_maximo) == (2.0, 2.0)
+    assert grafo.tem_peso_negativo is False
+    assert grafo.versao > versao_inicial
+
+    versao = grafo.versao
+    grafo.adicionar_aresta("B", "C", -1.0)
+    assert (grafo.peso_minimo, grafo.peso_maximo) == (-1.0, 2.0)
+    assert grafo.tem_peso_negativo is True
+    assert grafo.versao > versao
+
+    versao = grafo.versao
+    grafo.registrar_vitoria("A")
+    assert grafo.versao == versao
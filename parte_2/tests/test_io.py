@@ -10,7 +10,7 @@ for dir_path in SRC_DIRS:
     if dir_path.exists():
         sys.path.insert(0, str(dir_path))
 
-from graphs.io import processar_dados_ufc, carregar_grafo_ufc
+from graphs.io import processar_dados_ufc, carregar_grafo_ufc, carregar_categorias_ufc
 
 
 def test_processar_dados_ufc_gera_csv_processado_sem_nulos(tmp_path):
@@ -105,3 +105,29 @@ def test_carregar_grafo_ufc_cria_nos_arestas_e_vitorias(tmp_path):
 
     assert grafo.obter_vitorias("A") == 1
     assert grafo.obter_vitorias("B") == 1
+    assert grafo.derrotas == [("A", "B"), ("B", "C")]
+
+
+def test_carregar_categorias_ufc_usa_categoria_mais_frequente(tmp_path):
+    caminho_csv = tmp_path / "processado.csv"
+
+    df_proc = pd.DataFrame(
+        [
+            {"R_fighter": "A", "B_fighter": "B", "Fight_type": "Lightweight Bout",
+             "win_by": "KO", "Winner": "A", "peso": 0.5},
+            {"R_fighter": "A", "B_fighter": "C", "Fight_type": "UFC Lightweight Title Bout",
+             "win_by": "KO", "Winner": "A", "peso": 0.5},
+            {"R_fighter": "A", "B_fighter": "D", "Fight_type": "Welterweight Bout",
+             "win_by": "KO", "Winner": "D", "peso": 0.5},
+        ]
+    )
+    df_proc.to_csv(caminho_csv, sep=";", index=False, encoding="utf-8")
+
+    categorias = carregar_categorias_ufc(str(caminho_csv))
+
+    assert categorias == {
+        "A": "Lightweight",
+        "B": "Lightweight",
+        "C": "Lightweight",
+        "D": "Welterweight",
+    }
@@ -0,0 +1,86 @@
+from pathlib import Path
+import sys
+import random
+from array import array
+
+import numpy as np
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+SRC_DIRS = [ROOT_DIR / "src"]
+for dir_path in SRC_DIRS:
+    if dir_path.exists():
+        sys.path.insert(0, str(dir_path))
+
+from graphs.graph import Graph
+from graphs.csr import GrafoCSR, bellman_ford_ids
+from graphs.matrix import matriz_distancias
+from graphs.johnson import johnson, potenciais_johnson
+
+
+def montar_csr_direcionado(n: int = 30, m: int = 90, semente: int = 4) -> GrafoCSR:
+    """Grafo direcionado com pesos negativos e sem ciclo negativo (pesos vindos de potenciais)."""
+    rng = random.Random(semente)
+    potencial = [rng.randint(0, 10) for _ in range(n)]
+    arestas = [[] for _ in range(n)]
+    for _ in range(m):
+        u, v = rng.sample(range(n), 2)
+        arestas[u].append((v, rng.choice([0.0, 1.0, 2.0]) + potencial[v] - potencial[u]))
+
+    offsets, alvos, pesos = array("q", [0]), array("i"), array("d")
+    for u in range(n):
+        for v, peso in arestas[u]:
+            alvos.append(v)
+            pesos.append(peso)
+        offsets.append(len(alvos))
+    nomes = [f"N{i}" for i in range(n)]
+    return GrafoCSR(nomes, {no: i for i, no in enumerate(nomes)}, offsets, alvos, pesos)
+
+
+def test_johnson_coincide_com_bellman_ford_de_cada_origem():
+    csr = montar_csr_direcionado()
+    assert csr.tem_peso_negativo
+
+    dist, pred = johnson(csr)
+
+    for s in range(csr.ordem()):
+        dist_bf, _anterior, ciclo = bellman_ford_ids(csr, s)
+        assert not ciclo
+        assert dist[s].tolist() == pytest.approx(dist_bf)
+        for t in range(csr.ordem()):
+            if t != s and dist[s, t] != np.inf:
+                assert pred[s, t] >= 0
+
+
+def test_johnson_paralelo_igual_ao_sequencial():
+    csr = montar_csr_direcionado()
+
+    dist, pred = johnson(csr)
+    dist_par, pred_par = johnson(csr, workers=2)
+
+    assert np.allclose(dist, dist_par)
+    assert (pred == pred_par).all()
+
+
+def test_johnson_sem_pesos_negativos_equivale_a_matriz_distancias():
+    grafo = Graph()
+    grafo.adicionar_aresta("A", "B", 1)
+    grafo.adicionar_aresta("B", "C", 2)
+    grafo.adicionar_no("D")
+
+    dist, _pred = johnson(grafo)
+
+    esperado, _ = matriz_distancias(grafo, grafo.obter_nos())
+    assert np.array_equal(dist, esperado)
+
+
+def test_johnson_detecta_ciclo_negativo():
+    grafo = Graph()
+    grafo.adicionar_aresta("A", "B", 1)
+    grafo.adicionar_aresta("B", "C", -2)
+
+    _h, ciclo = potenciais_johnson(GrafoCSR.de_grafo(grafo))
+    assert ciclo[0] == ciclo[-1]
+
+    with pytest.raises(ValueError):
+        johnson(grafo)
@@ -0,0 +1,95 @@
+from pathlib import Path
+import sys
+
+import numpy as np
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+SRC_DIRS = [ROOT_DIR / "src"]
+for dir_path in SRC_DIRS:
+    if dir_path.exists():
+        sys.path.insert(0, str(dir_path))
+
+from graphs.graph import Graph
+from graphs.pagerank import pagerank_ids, pagerank_vitorias
+
+
+def montar_grafo_derrotas() -> Graph:
+    grafo = Graph()
+    # A venceu B e C; B venceu C; C venceu D; E nunca lutou
+    for vencedor, perdedor in [("A", "B"), ("A", "C"), ("B", "C"), ("C", "D")]:
+        grafo.adicionar_aresta(vencedor, perdedor, 1.0)
+        grafo.registrar_vitoria(vencedor)
+        grafo.registrar_derrota(vencedor, perdedor)
+    grafo.adicionar_no("E")
+    return grafo
+
+
+def pagerank_denso(n, origens, destinos, amortecimento=0.85, personalizacao=None):
+    """Resolve o sistema linear do PageRank diretamente, como referência."""
+    p = np.full(n, 1.0 / n) if personalizacao is None else np.asarray(personalizacao) / np.sum(personalizacao)
+    transicao = np.zeros((n, n))
+    for u, v in zip(origens, destinos):
+        transicao[v, u] += 1.0
+    saida = transicao.sum(axis=0)
+    for u in range(n):
+        if saida[u] == 0:
+            transicao[:, u] = p
+        else:
+            transicao[:, u] /= saida[u]
+    google = amortecimento * transicao + (1 - amortecimento) * np.outer(p, np.ones(n))
+    return np.linalg.solve(np.eye(n) - google + np.outer(np.ones(n), np.ones(n)) / n, np.ones(n) / n)
+
+
+def test_pagerank_ids_confere_com_solucao_direta_e_soma_um():
+    rng = np.random.default_rng(3)
+    n = 30
+    origens = rng.integers(0, n, 90)
+    destinos = rng.integers(0, n, 90)
+    estatisticas = {}
+
+    x = pagerank_ids(n, origens, destinos, estatisticas=estatisticas)
+
+    assert x.sum() == pytest.approx(1.0)
+    assert np.allclose(x, pagerank_denso(n, origens, destinos), atol=1e-9)
+    assert estatisticas["erro"] < 1e-10
+
+
+def test_pagerank_ids_com_personalizacao():
+    rng = np.random.default_rng(4)
+    n = 20
+    origens = rng.integers(0, n, 50)
+    destinos = rng.integers(0, n, 50)
+    personalizacao = np.zeros(n)
+    personalizacao[[0, 7]] = [1.0, 3.0]
+
+    x = pagerank_ids(n, origens, destinos, personalizacao=personalizacao)
+
+    assert np.allclose(x, pagerank_denso(n, origens, destinos, personalizacao=personalizacao), atol=1e-9)
+
+
+def test_pagerank_vitorias_premia_quem_vence_lutadores_fortes():
+    grafo = montar_grafo_derrotas()
+
+    pr = pagerank_vitorias(grafo)
+
+    assert set(pr) == {"A", "B", "C", "D", "E"}
+    assert sum(pr.values()) == pytest.approx(1.0)
+    assert max(pr, key=pr.get) == "A"
+    assert pr["A"] > pr["B"] > pr["D"]
+    assert pr["D"] == pytest.approx(pr["E"])
+
+
+def test_pagerank_vitorias_personalizacao_e_validacoes():
+    grafo = montar_grafo_derrotas()
+
+    pr = pagerank_vitorias(grafo, personalizacao={"D": 1.0})
+    assert pr["E"] == 0.0
+    assert pr["C"] > pr["B"]
+
+    with pytest.raises(ValueError):
+        pagerank_vitorias(grafo, personalizacao={"X": 1.0})
+    with pytest.raises(ValueError):
+        pagerank_vitorias(grafo, amortecimento=1.0)
+    with pytest.raises(ValueError):
+        pagerank_ids(3, [0, 1], [1, 2], max_iteracoes=2)